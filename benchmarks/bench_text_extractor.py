@@ -0,0 +1,163 @@
+"""
+HTML 텍스트 추출기 벤치마크
+
+기존 BeautifulSoup 기반 추출(전체 트리 생성 → decompose → get_text → 정규식 → 자르기)과
+스트리밍 추출기(src/text_extractor.py)의 결과 일치 여부, 처리 시간, 최대 메모리를 비교합니다.
+
+사용법:
+    python benchmarks/bench_text_extractor.py
+    python benchmarks/bench_text_extractor.py --fixtures ./html_samples --repeat 5
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+import warnings
+from typing import Callable, Dict, List, Tuple
+
+from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.gemini_classifier import MAX_TEXT_CHARS  # noqa: E402
+from src.text_extractor import extract_text  # noqa: E402
+
+
+def legacy_extract_text(html_content: str) -> str:
+    """변경 전 GeminiClassifier의 텍스트 추출 방식 (비교 기준)"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", XMLParsedAsHTMLWarning)
+        soup = BeautifulSoup(html_content, 'html.parser')
+    for tag in soup.find_all(['script', 'style', 'meta', 'noscript', 'link', 'head']):
+        tag.decompose()
+    text = soup.get_text(separator=' ', strip=True)
+    text = re.sub(r'\s+', ' ', text)
+    return text[:MAX_TEXT_CHARS]
+
+
+def streaming_extract_text(html_content: str) -> str:
+    return extract_text(html_content, max_chars=MAX_TEXT_CHARS)
+
+
+_WORDS = [
+    "카지노", "바카라", "슬롯", "첫충", "매충", "환전", "안전놀이터", "이벤트", "회원가입", "보너스",
+    "casino", "bonus", "jackpot", "live", "dealer", "deposit", "뉴스", "블로그", "오늘", "날씨",
+]
+
+
+def _paragraph(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def build_casino_page(rng: random.Random, target_bytes: int) -> str:
+    """인라인 스크립트/스타일이 큰 카지노 페이지 형태의 HTML 생성"""
+    head = [
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>카지노 &amp; 바카라</title>",
+        "<style>" + ".c{color:red}" * 2000 + "</style>",
+        "<script>var cfg = {" + ",".join(f"k{i}: '<div>{i}</div>'" for i in range(2000)) + "};</script>",
+        "<link rel='stylesheet' href='/a.css'></head><body>",
+    ]
+    body = []
+    size = sum(map(len, head))
+    while size < target_bytes:
+        block = rng.choice([
+            f"<div class='card'><h2>{_paragraph(rng, 4)}</h2><p>{_paragraph(rng, 40)}</p></div>",
+            f"<ul>{''.join(f'<li><a href=/g{i}>{_paragraph(rng, 3)}</a></li>' for i in range(10))}</ul>",
+            f"<script>window.__state = '{'x' * 5000}';</script>",
+            f"<p>{_paragraph(rng, 20)} &nbsp; &#54620;&#xAE00; <br> {_paragraph(rng, 10)}</p><img src=x.png>",
+            f"<!-- {_paragraph(rng, 10)} --><noscript>{_paragraph(rng, 10)}</noscript>",
+        ])
+        body.append(block)
+        size += len(block)
+    return "".join(head + body + ["</body></html>"])
+
+
+def build_fixture_corpus(seed: int = 42) -> Dict[str, str]:
+    """결과 비교용 결정적(seed 고정) 픽스처 모음"""
+    rng = random.Random(seed)
+    corpus = {
+        "small_casino_page": build_casino_page(rng, 20_000),
+        "medium_casino_page": build_casino_page(rng, 500_000),
+        "large_casino_page": build_casino_page(rng, 3_000_000),
+        "unclosed_head": "<html><head><title>제목</title><body><p>head가 닫히지 않은 본문</p></body></html>",
+        "malformed_tags": "<div><p>첫째<span>둘째</div></p></b>셋째<p>넷째<div>다섯째",
+        "entities": "<p>&amp; &lt;b&gt; &nbsp; &copy &notanentity; &#65;&#x41; &#128; &#0; &#12ab; &#xzz;</p>",
+        "comments_and_declarations": "<!DOCTYPE html><!-- 주석 --><?xml x?><p>본문<![CDATA[ 데이터 ]]>끝</p>",
+        "template_and_ruby": "<template><p>숨김</p></template><ruby>漢<rt>한</rt><rp>(</rp></ruby><p>보임</p>",
+        "void_tags": "<p>가<br>나<br/>다</br>라<img src=x>마</img>바<hr>사</p>",
+        "huge_text_node": "<body><p>" + "긴 텍스트 " * 100_000 + "</p></body>",
+        "script_only": "<script>" + "var a = 1;" * 10_000 + "</script>",
+        "empty": "",
+    }
+    return corpus
+
+
+def load_fixture_dir(directory: str) -> Dict[str, str]:
+    """디렉토리의 .html/.htm 파일을 픽스처로 읽기"""
+    corpus = {}
+    for name in sorted(os.listdir(directory)):
+        if name.lower().endswith(('.html', '.htm')):
+            with open(os.path.join(directory, name), 'r', encoding='utf-8', errors='replace') as f:
+                corpus[name] = f.read()
+    return corpus
+
+
+def measure(func: Callable[[str], str], html_content: str, repeat: int) -> Tuple[float, int, str]:
+    """(최소 실행 시간(초), 최대 메모리(바이트), 결과) 측정"""
+    best = float('inf')
+    result = ""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(html_content)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    func(html_content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="HTML 텍스트 추출기 벤치마크")
+    parser.add_argument("--fixtures", help="추가로 비교할 .html 파일 디렉토리")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최소 시간 사용)")
+    args = parser.parse_args(argv)
+
+    corpus = build_fixture_corpus()
+    if args.fixtures:
+        corpus.update(load_fixture_dir(args.fixtures))
+
+    print(f"{'fixture':<28}{'size(KB)':>10}{'legacy(ms)':>12}{'stream(ms)':>12}{'speedup':>9}"
+          f"{'legacy peak(MB)':>17}{'stream peak(MB)':>17}  match")
+
+    mismatches = 0
+    total_legacy = total_stream = 0.0
+    for name, html_content in corpus.items():
+        legacy_time, legacy_peak, legacy_text = measure(legacy_extract_text, html_content, args.repeat)
+        stream_time, stream_peak, stream_text = measure(streaming_extract_text, html_content, args.repeat)
+        total_legacy += legacy_time
+        total_stream += stream_time
+
+        match = legacy_text == stream_text
+        if not match:
+            mismatches += 1
+        speedup = legacy_time / stream_time if stream_time else float('inf')
+        print(f"{name[:27]:<28}{len(html_content) / 1024:>10.1f}{legacy_time * 1000:>12.2f}"
+              f"{stream_time * 1000:>12.2f}{speedup:>8.1f}x{legacy_peak / 2**20:>17.2f}"
+              f"{stream_peak / 2**20:>17.2f}  {'✅' if match else '❌'}")
+
+    print(f"\n총 처리 시간: legacy {total_legacy * 1000:.1f}ms, stream {total_stream * 1000:.1f}ms "
+          f"({total_legacy / max(total_stream, 1e-9):.1f}x)")
+    if mismatches:
+        print(f"❌ {mismatches}개 픽스처에서 결과가 다릅니다.")
+        return 1
+    print(f"✅ {len(corpus)}개 픽스처 모두 결과가 일치합니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
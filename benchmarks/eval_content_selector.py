@@ -0,0 +1,217 @@
+"""
+프롬프트 본문 선택기(src/content_selector.py) 평가
+
+정답(불법 여부)이 붙은 픽스처 페이지를 본문 선택기 없이(추출한 텍스트를 MAX_TEXT_CHARS까지 그대로)와
+토큰 예산별 선택기로 각각 분류하여 정확도, 프롬프트 크기(추정 토큰 수), 응답 시간을 비교합니다.
+캐시/유사 페이지/사전 필터/로컬 모델은 끄고 모든 페이지를 모델로 판정합니다.
+
+기본값은 가짜 모델(fake_llm.py)이라 API 비용 없이 선택기가 판단 근거를 남기는지 확인할 수 있고,
+--gemini를 주면 .env의 GEMINI_API_KEY로 실제 Gemini 정확도를 측정합니다 (페이지 수 × 설정 수만큼 호출).
+
+픽스처 디렉토리에는 HTML 파일과 labels.jsonl({"file": "a.html", "url": "https://...", "is_illegal": true})을 둡니다.
+
+사용법:
+    python benchmarks/eval_content_selector.py
+    python benchmarks/eval_content_selector.py --budgets 500,1500,3000 --output selector_eval.json
+    python benchmarks/eval_content_selector.py --fixtures ./labelled_pages --gemini
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, Any, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_llm import FakeGenerativeModel, create_fake_classifier  # noqa: E402
+from src.content_selector import ContentSelector  # noqa: E402
+from src.gemini_classifier import GeminiClassifier, CHARS_PER_TOKEN  # noqa: E402
+from src.metrics import PROMPT_CHARS  # noqa: E402
+
+
+_MENU_ITEMS = ["홈", "공지사항", "이벤트", "커뮤니티", "자유게시판", "고객센터", "자주 묻는 질문", "이용약관",
+               "개인정보처리방침", "회사소개", "제휴문의", "사이트맵", "마이페이지", "알림", "검색"]
+_FILLER_WORDS = ["오늘", "날씨", "여행", "맛집", "후기", "정보", "추천", "사진", "일상", "리뷰", "가격", "비교",
+                 "방법", "소개", "이야기", "시간", "사람", "생각", "문화", "경기", "선수", "시즌", "결과", "분석"]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_FILLER_WORDS) for _ in range(words)) + "."
+
+
+def _filler(rng: random.Random, paragraphs: int) -> str:
+    return "".join(f"<p>{' '.join(_sentence(rng, 12) for _ in range(4))}</p>" for _ in range(paragraphs))
+
+
+def _page(title: str, body: str, rng: random.Random) -> str:
+    menu = "".join(f"<li><a href='/m{i}'>{item}</a></li>" for i, item in enumerate(rng.sample(_MENU_ITEMS, 12)))
+    footer = "<p>Copyright © 2024 All rights reserved. 사업자등록번호 000-00-00000 | 대표 홍길동 | 주소 서울특별시</p>"
+    return (f"<!DOCTYPE html><html><head><title>{title}</title><script>var t = 1;</script></head><body>"
+            f"<header><nav><ul>{menu}</ul></nav></header><main>{body}</main>"
+            f"<footer><nav><ul>{menu}</ul></nav>{footer}</footer></body></html>")
+
+
+def build_labelled_fixtures(count: int = 60, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    결정적(seed 고정) 합성 픽스처: 메뉴/푸터와 일반 문단이 많고 판단 근거가 페이지 곳곳에 흩어진 페이지
+
+    - casino_deep (불법): 긴 일반 문단 뒤 페이지 끝부분에만 가입/충전/환전 안내가 있는 페이지
+    - casino_plain (불법): 게임 소개와 이벤트가 본문 전체에 있는 페이지
+    - addiction_news (합법): 도박 중독 예방 기사 (카지노를 언급하지만 불법 사이트 아님)
+    - shop (합법): 쇼핑몰 상품 페이지
+    - sports_blog (합법): 스포츠 경기 분석 블로그
+    """
+    rng = random.Random(seed)
+    kinds = ["casino_deep", "casino_plain", "addiction_news", "shop", "sports_blog"]
+    fixtures = []
+    for index in range(count):
+        kind = kinds[index % len(kinds)]
+        if kind == "casino_deep":
+            promo = ("<section class='event'><h2>신규 회원 가입 이벤트</h2>"
+                     "<p>가입코드 입력 시 첫충 20% 매충 10% 지급, 바카라 슬롯 라이브카지노 롤링 100%.</p>"
+                     "<p>환전 신청은 고객센터 텔레그램으로 문의, 입금 출금 3분 처리.</p>"
+                     "<form><button>회원가입</button><button>로그인</button></form></section>")
+            body = _filler(rng, rng.randint(150, 400)) + promo + _filler(rng, rng.randint(5, 20))
+            title, is_illegal = f"커뮤니티 {index}", True
+        elif kind == "casino_plain":
+            games = "".join(
+                f"<div class='game'><h3>{rng.choice(['바카라', '슬롯', '블랙잭', '룰렛'])} 게임</h3>"
+                f"<p>실시간 카지노 딜러와 함께 {_sentence(rng, 8)}</p></div>" for _ in range(rng.randint(5, 15))
+            )
+            body = (f"<h1>안전놀이터 메이저 카지노</h1>{games}{_filler(rng, rng.randint(10, 60))}"
+                    "<p>첫충 매충 이벤트 진행 중, 환전 무제한</p>")
+            title, is_illegal = "카지노 사이트", True
+        elif kind == "addiction_news":
+            body = (f"<h1>도박 중독 예방 캠페인</h1><p>한국도박문제예방치유원은 불법 카지노 광고가 늘고 있다고 밝혔다. "
+                    f"{_sentence(rng, 10)}</p>{_filler(rng, rng.randint(20, 200))}"
+                    "<p>도박 중독 상담은 1336으로 문의하면 된다. 홍길동 기자</p>")
+            title, is_illegal = "뉴스 - 도박 중독 예방", False
+        elif kind == "shop":
+            body = (f"<h1>여름 신상품 모음</h1>{_filler(rng, rng.randint(20, 200))}"
+                    "<div class='buy'><p>무료배송 쿠폰 적용 가능</p><button>장바구니</button><button>결제하기</button></div>")
+            title, is_illegal = "쇼핑몰 상품 상세", False
+        else:
+            body = (f"<h1>주말 경기 분석</h1>{_filler(rng, rng.randint(20, 300))}"
+                    "<p>이번 시즌 선수 기록과 경기 결과를 정리했습니다. 댓글로 의견 남겨 주세요.</p>")
+            title, is_illegal = "스포츠 블로그", False
+        fixtures.append({
+            "name": f"{kind}_{index:03d}",
+            "url": f"https://{kind.replace('_', '-')}-{index:03d}.example/",
+            "html": _page(title, body, rng),
+            "is_illegal": is_illegal,
+        })
+    return fixtures
+
+
+def load_labelled_fixtures(directory: str) -> List[Dict[str, Any]]:
+    """labels.jsonl에 정답이 적힌 HTML 픽스처 읽기"""
+    fixtures = []
+    with open(os.path.join(directory, "labels.jsonl"), 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            label = json.loads(line)
+            with open(os.path.join(directory, label["file"]), 'r', encoding='utf-8', errors='replace') as page:
+                html_content = page.read()
+            fixtures.append({
+                "name": label["file"],
+                "url": label.get("url", f"https://{label['file']}/"),
+                "html": html_content,
+                "is_illegal": bool(label["is_illegal"]),
+            })
+    return fixtures
+
+
+def create_classifier(selector: Optional[ContentSelector], args) -> GeminiClassifier:
+    """캐시/사전 필터 등을 모두 끈 분류기 (모든 페이지를 모델로 판정)"""
+    if args.gemini:
+        return GeminiClassifier(requests_per_minute=args.rpm, content_selector=selector)
+    model = FakeGenerativeModel(latency=args.llm_latency, latency_per_1k_chars=args.llm_latency_per_1k)
+    return create_fake_classifier(model=model, content_selector=selector)
+
+
+def evaluate(fixtures: List[Dict[str, Any]], selector: Optional[ContentSelector], args) -> Dict[str, Any]:
+    classifier = create_classifier(selector, args)
+    decisions = []
+    prompt_chars = []
+    latencies = []
+    errors = 0
+    for fixture in fixtures:
+        chars_before = PROMPT_CHARS.get()
+        started = time.perf_counter()
+        result = classifier.classify_url(fixture["url"], fixture["html"])
+        latencies.append(time.perf_counter() - started)
+        prompt_chars.append(PROMPT_CHARS.get() - chars_before)
+        if result.get("error"):
+            errors += 1
+        decisions.append(bool(result.get("is_illegal")))
+
+    labels = [fixture["is_illegal"] for fixture in fixtures]
+    true_positive = sum(1 for d, l in zip(decisions, labels) if d and l)
+    predicted = sum(decisions)
+    actual = sum(labels)
+    latencies.sort()
+    return {
+        "token_budget": selector.token_budget if selector else None,
+        "pages": len(fixtures),
+        "accuracy": sum(1 for d, l in zip(decisions, labels) if d == l) / len(fixtures),
+        "precision": true_positive / predicted if predicted else None,
+        "recall": true_positive / actual if actual else None,
+        "errors": errors,
+        "avg_prompt_chars": sum(prompt_chars) / len(fixtures),
+        "avg_prompt_tokens": sum(prompt_chars) / len(fixtures) / CHARS_PER_TOKEN,
+        "avg_latency": sum(latencies) / len(latencies),
+        "p50_latency": latencies[len(latencies) // 2],
+        "decisions": decisions,
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="프롬프트 본문 선택기 평가")
+    parser.add_argument("--fixtures", help="labels.jsonl이 있는 픽스처 디렉토리 (없으면 합성 픽스처)")
+    parser.add_argument("--count", type=int, default=60, help="합성 픽스처 페이지 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--budgets", default="500,1000,1500,3000", help="쉼표로 구분한 토큰 예산")
+    parser.add_argument("--gemini", action="store_true", help="가짜 모델 대신 실제 Gemini로 판정")
+    parser.add_argument("--rpm", type=float, default=60, help="--gemini 사용 시 분당 요청 수")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="가짜 모델 기본 응답 지연 (초)")
+    parser.add_argument("--llm-latency-per-1k", type=float, default=0.01,
+                        help="가짜 모델의 프롬프트 1,000글자당 추가 지연 (초)")
+    parser.add_argument("--output", help="결과 JSON 파일")
+    args = parser.parse_args(argv)
+
+    fixtures = load_labelled_fixtures(args.fixtures) if args.fixtures else build_labelled_fixtures(args.count, args.seed)
+    print(f"🧪 픽스처 {len(fixtures)}개 (불법 {sum(f['is_illegal'] for f in fixtures)}개), "
+          f"판정 모델: {'Gemini' if args.gemini else '가짜 모델'}")
+
+    configs = [None] + [ContentSelector(token_budget=int(budget), chars_per_token=CHARS_PER_TOKEN)
+                        for budget in args.budgets.split(",") if budget.strip()]
+    results = [evaluate(fixtures, selector, args) for selector in configs]
+    baseline = results[0]
+
+    print(f"{'config':<16}{'accuracy':>10}{'precision':>11}{'recall':>8}{'agree':>8}"
+          f"{'prompt tokens':>15}{'reduction':>11}{'latency':>10}{'errors':>8}")
+    for result in results:
+        name = "선택 안 함" if result["token_budget"] is None else f"예산 {result['token_budget']}"
+        agreement = sum(1 for a, b in zip(result["decisions"], baseline["decisions"]) if a == b) / len(fixtures)
+        result["agreement_with_baseline"] = agreement
+        reduction = baseline["avg_prompt_tokens"] / result["avg_prompt_tokens"] if result["avg_prompt_tokens"] else 0.0
+        precision = f"{result['precision']:.3f}" if result["precision"] is not None else "-"
+        recall = f"{result['recall']:.3f}" if result["recall"] is not None else "-"
+        print(f"{name:<16}{result['accuracy']:>10.3f}{precision:>11}{recall:>8}{agreement:>8.3f}"
+              f"{result['avg_prompt_tokens']:>15.0f}{reduction:>10.1f}x{result['avg_latency'] * 1000:>8.0f}ms"
+              f"{result['errors']:>8}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"fixtures": args.fixtures or f"synthetic(count={args.count}, seed={args.seed})",
+                       "model": "gemini" if args.gemini else "fake", "results": results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+벤치마크용 가짜 Gemini 모델
+
+GeminiClassifier의 model만 바꿔 끼우므로 캐시, 사전 필터, 할당량 제한, 재시도, 응답 파싱 등
+분류기의 나머지 경로는 실제 코드 그대로 실행됩니다. 같은 프롬프트에는 항상 같은 판정과 지연을 돌려줍니다.
+"""
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from google.api_core import exceptions as google_exceptions  # noqa: E402
+
+from src.gemini_classifier import GeminiClassifier  # noqa: E402
+
+
+# 판정에 쓰는 도박 관련 단어 (프롬프트의 웹사이트 콘텐츠 부분에서만 셈)
+GAMBLING_WORDS = ("카지노", "바카라", "슬롯", "첫충", "매충", "환전", "안전놀이터", "casino", "jackpot", "dealer")
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGenerativeModel:
+    """
+    genai.GenerativeModel 대신 쓰는 결정적 모델
+
+    Args:
+        latency: 평균 응답 시간 (초)
+        jitter: 응답 시간 변동 폭 (초, latency ± jitter)
+        error_rate: 429(ResourceExhausted)로 응답할 비율 (재시도 경로 측정용)
+        illegal_threshold: 이 개수 이상 도박 단어가 나오면 불법으로 판정
+        latency_per_1k_chars: 프롬프트 1,000글자당 추가 응답 시간 (초, 입력 길이에 따른 지연)
+    """
+
+    def __init__(self, latency: float = 0.2, jitter: float = 0.0, error_rate: float = 0.0,
+                 illegal_threshold: int = 3, latency_per_1k_chars: float = 0.0):
+        self.latency = latency
+        self.latency_per_1k_chars = latency_per_1k_chars
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.illegal_threshold = illegal_threshold
+        self.calls = 0
+
+    def generate_content(self, prompt: str) -> _FakeResponse:
+        self.calls += 1
+        digest = hashlib.sha1(prompt.encode('utf-8')).digest()
+        fraction = int.from_bytes(digest[:4], "big") / 0xFFFFFFFF
+        input_latency = len(prompt) / 1000 * self.latency_per_1k_chars
+        time.sleep(max(0.0, self.latency + input_latency + (fraction * 2 - 1) * self.jitter))
+
+        # 재시도 시 같은 프롬프트가 계속 실패하지 않도록 호출 순번도 섞음
+        if self.error_rate and (int.from_bytes(digest[4:8], "big") + self.calls) % 1000 < self.error_rate * 1000:
+            raise google_exceptions.ResourceExhausted("fake quota exceeded")
+
+        content = prompt.split("웹사이트 콘텐츠:", 1)[-1].split("판단 기준:", 1)[0].lower()
+        detected = [word for word in GAMBLING_WORDS if word in content]
+        hits = sum(content.count(word) for word in detected)
+        is_illegal = hits >= self.illegal_threshold
+        return _FakeResponse(json.dumps({
+            "is_illegal": is_illegal,
+            "confidence": round(min(0.99, 0.5 + hits / 100), 2) if is_illegal else 0.9,
+            "reason": f"도박 단어 {hits}회",
+            "detected_keywords": detected,
+        }, ensure_ascii=False))
+
+
+def create_fake_classifier(latency: float = 0.2, jitter: float = 0.0, error_rate: float = 0.0,
+                           model: Optional[FakeGenerativeModel] = None, **classifier_kwargs) -> GeminiClassifier:
+    """
+    가짜 모델을 쓰는 GeminiClassifier 생성 (classifier_kwargs는 GeminiClassifier에 그대로 전달)
+
+    할당량 제한으로 벤치마크가 느려지지 않도록 requests_per_minute 기본값을 크게 잡습니다.
+    """
+    classifier_kwargs.setdefault("requests_per_minute", 1_000_000)
+    classifier = GeminiClassifier(api_key="benchmark-fake-key", **classifier_kwargs)
+    classifier.model = model or FakeGenerativeModel(latency, jitter, error_rate)
+    return classifier
+
+
+def install_fake_model(classifier: GeminiClassifier, latency: float = 0.2, jitter: float = 0.0,
+                       error_rate: float = 0.0) -> FakeGenerativeModel:
+    """이미 만든 분류기(예: 크롤러의 분류기)의 모델을 가짜 모델로 교체"""
+    model = FakeGenerativeModel(latency, jitter, error_rate)
+    classifier.model = model
+    return model
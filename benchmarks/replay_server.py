@@ -0,0 +1,324 @@
+"""
+녹화한 검색 결과 페이지(SERP)와 사이트 HTML을 재생하는 로컬 HTTP 서버
+
+Google과 실제 사이트에 접속하지 않고 같은 입력으로 크롤러를 반복 실행하기 위한 벤치마크용 서버입니다.
+픽스처 디렉토리는 다음 형식입니다.
+
+    manifest.json   {"serps": {검색어: "serps/0001.html", ...},
+                     "pages": {원래 URL: {"file": "pages/0001.html", "status": 200}, ...}}
+    serps/*.html    검색 결과 페이지 HTML
+    pages/*.html    검색 결과 링크의 HTML
+
+재생할 때 SERP 안의 원래 URL은 이 서버의 /page/<번호> 주소로 바뀌므로 모든 요청이 로컬에서 처리됩니다.
+
+사용법:
+    python benchmarks/replay_server.py generate --out ./bench_fixtures       # 합성 픽스처 생성
+    python benchmarks/replay_server.py record --out ./bench_fixtures 카지노 바카라  # 실제 검색 결과 녹화
+    python benchmarks/replay_server.py serve --fixtures ./bench_fixtures --port 8099
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse, parse_qs, quote
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_text_extractor import build_casino_page, _paragraph  # noqa: E402
+
+
+# 합성 SERP에 섞어 넣는 (크롤러가 걸러야 하는) 링크
+_NOISE_LINKS = [
+    "https://www.google.com/search?q=related",
+    "https://news.naver.com/article/001/0000000001",
+    "https://www.yna.co.kr/view/AKR0000000001",
+]
+
+
+class ReplayCorpus:
+    """녹화(또는 합성)한 SERP와 페이지 HTML 모음"""
+
+    def __init__(self, serps: Dict[str, str], pages: Dict[str, Dict[str, Any]]):
+        # serps: {검색어: SERP HTML}, pages: {원래 URL: {"html": str, "status": int}}
+        self.serps = serps
+        self.pages = pages
+
+    @property
+    def keywords(self) -> List[str]:
+        return list(self.serps)
+
+    def save(self, directory: str) -> None:
+        os.makedirs(os.path.join(directory, "serps"), exist_ok=True)
+        os.makedirs(os.path.join(directory, "pages"), exist_ok=True)
+        manifest = {"serps": {}, "pages": {}}
+        for i, (keyword, html_content) in enumerate(self.serps.items(), 1):
+            file_name = f"serps/{i:04d}.html"
+            manifest["serps"][keyword] = file_name
+            with open(os.path.join(directory, file_name), 'w', encoding='utf-8') as f:
+                f.write(html_content)
+        for i, (url, page) in enumerate(self.pages.items(), 1):
+            file_name = f"pages/{i:04d}.html"
+            manifest["pages"][url] = {"file": file_name, "status": page.get("status", 200)}
+            with open(os.path.join(directory, file_name), 'w', encoding='utf-8') as f:
+                f.write(page["html"])
+        with open(os.path.join(directory, "manifest.json"), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, directory: str) -> "ReplayCorpus":
+        with open(os.path.join(directory, "manifest.json"), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        def read(file_name: str) -> str:
+            with open(os.path.join(directory, file_name), 'r', encoding='utf-8', errors='replace') as f:
+                return f.read()
+
+        serps = {keyword: read(file_name) for keyword, file_name in manifest["serps"].items()}
+        pages = {url: {"html": read(page["file"]), "status": page.get("status", 200)}
+                 for url, page in manifest["pages"].items()}
+        return cls(serps, pages)
+
+    @classmethod
+    def generate(cls, num_keywords: int = 20, links_per_serp: int = 10, shared_ratio: float = 0.3,
+                 seed: int = 42) -> "ReplayCorpus":
+        """
+        결정적(seed 고정) 합성 픽스처 생성
+
+        카지노 페이지, 일반 페이지, 자바스크립트로만 그리는 SPA 껍데기가 섞여 있고,
+        shared_ratio 비율의 링크는 다른 검색어의 SERP에도 나와 중복 제거 경로를 거칩니다.
+        """
+        rng = random.Random(seed)
+        pages: Dict[str, Dict[str, Any]] = {}
+        serps: Dict[str, str] = {}
+
+        def new_page(index: int) -> str:
+            kind = rng.choices(["casino", "benign", "spa"], weights=[5, 4, 1])[0]
+            if kind == "casino":
+                url = f"https://casino-{index:04d}.example/?utm_source=google&ref=serp"
+                html_content = build_casino_page(rng, rng.choice([20_000, 60_000, 200_000]))
+            elif kind == "benign":
+                url = f"https://blog-{index:04d}.example/post/{index}"
+                body = "".join(f"<p>{_paragraph(rng, 60)}</p>" for _ in range(rng.randint(5, 40)))
+                html_content = f"<html><head><title>블로그 {index}</title></head><body>{body}</body></html>"
+            else:
+                url = f"https://app-{index:04d}.example/"
+                html_content = "<html><head><script src='/app.js'></script></head><body><div id='root'></div></body></html>"
+            pages[url] = {"html": html_content, "status": 200}
+            return url
+
+        for k in range(num_keywords):
+            keyword = f"벤치마크 검색어 {k:03d}"
+            urls = []
+            for _ in range(links_per_serp):
+                if pages and rng.random() < shared_ratio:
+                    urls.append(rng.choice(list(pages)))
+                else:
+                    urls.append(new_page(len(pages)))
+            links = [f'<div class="g"><a href="{url}"><h3>{_paragraph(rng, 5)}</h3></a></div>' for url in urls]
+            links.insert(rng.randint(0, len(links)), f'<div class="g"><a href="{rng.choice(_NOISE_LINKS)}">관련</a></div>')
+            serps[keyword] = (
+                f"<html><head><title>{keyword} - Google 검색</title></head><body>"
+                f"<div id=\"search\"><div id=\"rso\">{''.join(links)}</div></div>"
+                f"<a href=\"/search?q={quote(keyword)}&start=10\">다음</a></body></html>"
+            )
+        return cls(serps, pages)
+
+
+class ReplayServer:
+    """
+    ReplayCorpus를 재생하는 HTTP 서버 (백그라운드 스레드)
+
+    - /search?q=<검색어>: 녹화한 SERP (원래 URL을 /page/<번호>로 바꿈)
+    - /page/<번호>: 녹화한 페이지 HTML
+
+    latency/jitter(초)로 응답 지연을 흉내 내며, 지연은 경로별로 고정되어 실행마다 같습니다.
+    """
+
+    def __init__(self, corpus: ReplayCorpus, host: str = "127.0.0.1", port: int = 0,
+                 serp_latency: float = 0.0, page_latency: float = 0.0, jitter: float = 0.0):
+        self.corpus = corpus
+        self.serp_latency = serp_latency
+        self.page_latency = page_latency
+        self.jitter = jitter
+        self.stats = {"serps": 0, "pages": 0, "bytes": 0, "not_found": 0}
+        self._lock = threading.Lock()
+
+        handler = type("ReplayHandler", (_ReplayHandler,), {"replay": self})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self.host = host
+        self.port = self._server.server_address[1]
+        self._thread: Optional[threading.Thread] = None
+
+        self._page_ids = {url: i for i, url in enumerate(corpus.pages)}
+        self._page_list = list(corpus.pages.values())
+        self._serps = {keyword: self._rewrite_serp(html_content) for keyword, html_content in corpus.serps.items()}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def local_url(self, original_url: str) -> str:
+        return f"{self.base_url}/page/{self._page_ids[original_url]}"
+
+    def search_url(self, keyword: str) -> str:
+        return f"{self.base_url}/search?q={quote(keyword)}"
+
+    def _rewrite_serp(self, html_content: str) -> str:
+        # 긴 URL부터 바꿔야 다른 URL의 앞부분만 바뀌지 않음
+        for url in sorted(self.corpus.pages, key=len, reverse=True):
+            if url in html_content:
+                html_content = html_content.replace(url, self.local_url(url))
+            quoted = quote(url, safe='')
+            if quoted in html_content:
+                html_content = html_content.replace(quoted, quote(self.local_url(url), safe=''))
+        return html_content
+
+    def _delay(self, path: str, latency: float) -> float:
+        if not latency and not self.jitter:
+            return 0.0
+        # 경로별로 고정된 지연 (실행마다 같은 분포)
+        fraction = int(hashlib.md5(path.encode('utf-8')).hexdigest()[:8], 16) / 0xFFFFFFFF
+        return max(0.0, latency + (fraction * 2 - 1) * self.jitter)
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    replay: ReplayServer = None
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        status, body, stat = 404, b"not found", "not_found"
+        latency = 0.0
+        if parsed.path == "/search":
+            keyword = parse_qs(parsed.query).get("q", [""])[0]
+            html_content = self.replay._serps.get(keyword)
+            if html_content is not None:
+                status, body, stat = 200, html_content.encode('utf-8'), "serps"
+            latency = self.replay.serp_latency
+        elif parsed.path.startswith("/page/"):
+            try:
+                page = self.replay._page_list[int(parsed.path[len("/page/"):])]
+                status, body, stat = page.get("status", 200), page["html"].encode('utf-8'), "pages"
+            except (ValueError, IndexError):
+                pass
+            latency = self.replay.page_latency
+
+        delay = self.replay._delay(self.path, latency)
+        if delay:
+            time.sleep(delay)
+        with self.replay._lock:
+            self.replay.stats[stat] += 1
+            self.replay.stats["bytes"] += len(body)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 요청마다 로그를 남기지 않음
+        pass
+
+
+def record_fixtures(keywords: List[str], out_dir: str, max_links: int = 10, headless: bool = True) -> ReplayCorpus:
+    """실제 Google 검색 결과와 링크된 페이지를 녹화하여 픽스처 디렉토리로 저장"""
+    import requests
+    from src.async_fetcher import DEFAULT_HEADERS
+    from src.search_engine import SearchEngine
+
+    search_engine = SearchEngine(headless=headless)
+    session = requests.Session()
+    serps, pages = {}, {}
+    try:
+        for keyword in keywords:
+            print(f"🔎 녹화 중: {keyword}")
+            serps[keyword] = search_engine.search_google(keyword)
+            for url in search_engine.collect_search_result_links(max_links=max_links):
+                if url in pages:
+                    continue
+                try:
+                    response = session.get(url, headers=DEFAULT_HEADERS, timeout=15)
+                    pages[url] = {"html": response.text, "status": response.status_code}
+                except Exception as e:
+                    print(f"  ❌ 페이지 녹화 실패 {url}: {e}")
+    finally:
+        search_engine.close()
+        session.close()
+
+    corpus = ReplayCorpus(serps, pages)
+    corpus.save(out_dir)
+    print(f"💾 SERP {len(serps)}개, 페이지 {len(pages)}개 저장: {out_dir}")
+    return corpus
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="녹화한 SERP/페이지 재생 서버")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="합성 픽스처 생성")
+    generate.add_argument("--out", required=True)
+    generate.add_argument("--keywords", type=int, default=20)
+    generate.add_argument("--links", type=int, default=10)
+    generate.add_argument("--seed", type=int, default=42)
+
+    record = commands.add_parser("record", help="실제 검색 결과 녹화 (Chrome 필요)")
+    record.add_argument("--out", required=True)
+    record.add_argument("--max-links", type=int, default=10)
+    record.add_argument("keywords", nargs="+")
+
+    serve = commands.add_parser("serve", help="픽스처 재생")
+    serve.add_argument("--fixtures", help="픽스처 디렉토리 (없으면 합성 픽스처)")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8099)
+    serve.add_argument("--serp-latency", type=float, default=0.0)
+    serve.add_argument("--page-latency", type=float, default=0.0)
+    serve.add_argument("--jitter", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        corpus = ReplayCorpus.generate(args.keywords, args.links, seed=args.seed)
+        corpus.save(args.out)
+        print(f"💾 SERP {len(corpus.serps)}개, 페이지 {len(corpus.pages)}개 저장: {args.out}")
+        return 0
+
+    if args.command == "record":
+        record_fixtures(args.keywords, args.out, max_links=args.max_links)
+        return 0
+
+    corpus = ReplayCorpus.load(args.fixtures) if args.fixtures else ReplayCorpus.generate()
+    server = ReplayServer(corpus, args.host, args.port, args.serp_latency, args.page_latency, args.jitter)
+    print(f"▶️ 재생 서버 시작: {server.base_url} (SERP {len(corpus.serps)}개, 페이지 {len(corpus.pages)}개)")
+    for keyword in corpus.keywords[:3]:
+        print(f"  {server.search_url(keyword)}")
+    try:
+        server.start()._thread.join()
+    except KeyboardInterrupt:
+        server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,600 @@
+"""
+오프라인 재생 벤치마크
+
+녹화한(또는 합성한) SERP와 페이지를 로컬 재생 서버(replay_server.py)로 제공하고
+Gemini 대신 가짜 모델(fake_llm.py)을 써서, Google/Gemini에 접속하지 않고 같은 입력으로 성능을 측정합니다.
+
+시나리오마다 별도 프로세스에서 실행하여 처리량, p50/p99 지연 시간, 최대 메모리(RSS)를 측정하고
+커밋 해시와 측정 조건을 함께 JSON으로 저장하므로 커밋 사이의 결과를 비교할 수 있습니다.
+시나리오별 출력 요약(저장한 URL 수, 탐지 수 등)도 함께 저장하여 결과가 달라졌는지도 확인합니다.
+
+사용법:
+    python benchmarks/run_benchmarks.py                               # 모든 시나리오 (database 제외)
+    python benchmarks/run_benchmarks.py --scenarios text_extraction,crawler_pipeline
+    python benchmarks/run_benchmarks.py --fixtures ./bench_fixtures --output before.json
+    python benchmarks/run_benchmarks.py --compare before.json after.json
+    python benchmarks/run_benchmarks.py --scenarios database          # .env의 DB에 임시 행을 쓰고 지움
+    python benchmarks/run_benchmarks.py --scenarios browser_tabs --parallel-tabs 4   # 로컬 Chrome 필요
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Any, List, Optional
+
+import requests
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, REPO_ROOT)
+
+from fake_llm import create_fake_classifier, install_fake_model  # noqa: E402
+from replay_server import ReplayCorpus, ReplayServer  # noqa: E402
+
+
+# 시나리오 측정 조건 (결과 비교 시 같아야 하는 값)
+PARAM_NAMES = ("fixtures", "keywords", "links", "seed", "repeat", "serp_latency", "page_latency",
+               "llm_latency", "llm_jitter", "llm_workers", "parallel_tabs")
+
+
+class ReplaySearchEngine:
+    """
+    SearchEngine 대신 재생 서버에서 SERP와 페이지를 HTTP로 가져오는 검색 엔진
+
+    크롤러가 사용하는 메서드(search_google, collect_search_result_links, visit_links,
+    visit_search_result_links, render_url, close)만 같은 형식으로 제공합니다.
+    """
+
+    visit_mode = "parallel"
+    driver_pool = None
+
+    def __init__(self, server: ReplayServer, workers: int = 4, on_search: Optional[Callable[[str], None]] = None):
+        self.server = server
+        self.workers = workers
+        self.on_search = on_search
+        self.page_source = ""
+        self.session = requests.Session()
+        self._page_prefix = f"{server.base_url}/page/"
+
+    def search_google(self, keyword: str) -> str:
+        if self.on_search:
+            self.on_search(keyword)
+        response = self.session.get(self.server.search_url(keyword), timeout=30)
+        response.raise_for_status()
+        self.page_source = response.text
+        return self.page_source
+
+    def collect_search_result_links(self, max_links: int = 10) -> list:
+        # 재생 서버가 제공하는 링크만 SERP에 나온 순서대로 (녹화하지 않은 실제 URL에는 접속하지 않음)
+        links = []
+        position = self.page_source.find(self._page_prefix)
+        while position != -1 and len(links) < max_links:
+            end = position + len(self._page_prefix)
+            while end < len(self.page_source) and self.page_source[end].isdigit():
+                end += 1
+            link = self.page_source[position:end]
+            if link not in links:
+                links.append(link)
+            position = self.page_source.find(self._page_prefix, end)
+        return links
+
+    def render_url(self, target_url: str) -> tuple:
+        response = self.session.get(target_url, timeout=30)
+        return response.url, response.text
+
+    def visit_links(self, urls: list) -> list:
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(urls) or 1))) as executor:
+            return list(executor.map(self.render_url, urls))
+
+    def visit_search_result_links(self, max_links: int = 10) -> list:
+        return self.visit_links(self.collect_search_result_links(max_links=max_links))
+
+    def close(self):
+        self.session.close()
+
+
+def load_corpus(args) -> ReplayCorpus:
+    if args.fixtures:
+        return ReplayCorpus.load(args.fixtures)
+    return ReplayCorpus.generate(args.keywords, args.links, seed=args.seed)
+
+
+def percentile(samples: List[float], q: float) -> Optional[float]:
+    """nearest-rank 분위수"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+def _digest(values) -> str:
+    """출력이 커밋 사이에 달라졌는지 확인하기 위한 짧은 해시"""
+    return hashlib.sha1(json.dumps(values, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+
+# ---------------------------------------------------------------------------
+# 시나리오: {"items", "unit", "seconds", "latencies"(초), "output"} 반환
+# ---------------------------------------------------------------------------
+
+def scenario_url_extractor(args, corpus: ReplayCorpus, work_dir: str) -> Dict[str, Any]:
+    """URLExtractor로 SERP HTML에서 결과 링크 추출"""
+    from src.url_extractor import URLExtractor
+
+    extractor = URLExtractor()
+    serps = list(corpus.serps.values())
+    latencies, extracted = [], []
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        extracted = []
+        for html_content in serps:
+            t0 = time.perf_counter()
+            urls = extractor.extract_urls_from_html(html_content)
+            latencies.append(time.perf_counter() - t0)
+            extracted.append(sorted(urls))
+    return {
+        "items": len(latencies), "unit": "serps", "seconds": time.perf_counter() - started,
+        "latencies": latencies,
+        "output": {"urls": sum(map(len, extracted)), "digest": _digest(extracted)},
+    }
+
+
+def scenario_text_extraction(args, corpus: ReplayCorpus, work_dir: str) -> Dict[str, Any]:
+    """GeminiClassifier._extract_text_from_html로 페이지 텍스트 추출"""
+    from src.gemini_classifier import MAX_TEXT_CHARS
+
+    classifier = create_fake_classifier(latency=0)
+    pages = [page["html"] for page in corpus.pages.values()]
+    latencies, lengths = [], []
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        lengths = []
+        for html_content in pages:
+            t0 = time.perf_counter()
+            text = classifier._extract_text_from_html(html_content, max_chars=MAX_TEXT_CHARS)
+            latencies.append(time.perf_counter() - t0)
+            lengths.append(len(text))
+    return {
+        "items": len(latencies), "unit": "pages", "seconds": time.perf_counter() - started,
+        "latencies": latencies,
+        "output": {"chars": sum(lengths), "digest": _digest(lengths)},
+    }
+
+
+def scenario_classifier(args, corpus: ReplayCorpus, work_dir: str) -> Dict[str, Any]:
+    """가짜 모델로 classify_batch (캐시/사전 필터 없이 모든 페이지를 모델로 판정)"""
+    classifier = create_fake_classifier(latency=args.llm_latency, jitter=args.llm_jitter,
+                                        max_workers=args.llm_workers)
+    latencies = []
+    classify_text = classifier.classify_text
+
+    def timed_classify_text(*call_args, **call_kwargs):
+        t0 = time.perf_counter()
+        try:
+            return classify_text(*call_args, **call_kwargs)
+        finally:
+            latencies.append(time.perf_counter() - t0)
+
+    classifier.classify_text = timed_classify_text
+    items = [(url, page["html"]) for url, page in corpus.pages.items()]
+    started = time.perf_counter()
+    results = list(classifier.classify_batch(items))
+    illegal = sorted(result["url"] for result in results if result.get("is_illegal"))
+    return {
+        "items": len(results), "unit": "pages", "seconds": time.perf_counter() - started,
+        "latencies": latencies,
+        "output": {"illegal": len(illegal), "errors": sum(1 for r in results if r.get("error")),
+                   "digest": _digest(illegal)},
+    }
+
+
+def scenario_json_storage(args, corpus: ReplayCorpus, work_dir: str) -> Dict[str, Any]:
+    """JSONStorage(JSONL)에 검색어마다 결과 저장 후 다시 열어 기존 URL 읽기"""
+    from src.json_storage import JSONStorage
+
+    output_file = os.path.join(work_dir, "results.jsonl")
+    storage = JSONStorage(output_file)
+    urls = list(corpus.pages)
+    result = {"is_illegal": True, "confidence": 0.9, "reason": "benchmark", "detected_keywords": ["카지노"]}
+    latencies = []
+    started = time.perf_counter()
+    try:
+        for r in range(args.repeat):
+            for i in range(0, len(urls), args.links):
+                batch = [f"{url}#{r}" for url in urls[i:i + args.links]]
+                t0 = time.perf_counter()
+                storage.save_results(batch, f"benchmark {i}", [result] * len(batch))
+                latencies.append(time.perf_counter() - t0)
+    finally:
+        storage.close()
+    reopened = JSONStorage(output_file)
+    stored = len(reopened.get_existing_urls())
+    reopened.close()
+    return {
+        "items": len(latencies), "unit": "saves", "seconds": time.perf_counter() - started,
+        "latencies": latencies,
+        "output": {"stored": stored},
+    }
+
+
+def scenario_database(args, corpus: ReplayCorpus, work_dir: str) -> Dict[str, Any]:
+    """DatabaseManager.bulk_upsert_url_data로 .env의 DB에 임시 행을 쓰고 지움"""
+    from src.database import DatabaseManager
+    from src.storage import ResultStorage
+
+    db = DatabaseManager()
+    try:
+        db.connect()
+    except Exception as e:
+        return {"skipped": f"DB 연결 실패: {str(e).strip()}"}
+
+    run_id = f"{os.getpid()}-{int(time.time())}"
+    prefix = f"https://benchmark.invalid/{run_id}/"
+    result = {"is_illegal": True, "confidence": 0.9, "reason": "benchmark", "detected_keywords": ["카지노"]}
+    batch_size = 500
+    latencies, upserted = [], 0
+    started = time.perf_counter()
+    try:
+        db.create_tables()
+        for r in range(args.repeat):
+            urls = [f"{prefix}{i}" for i in range(len(corpus.pages) * 10)]
+            entries = ResultStorage.build_entries(urls, "benchmark", [result] * len(urls))
+            for i in range(0, len(entries), batch_size):
+                t0 = time.perf_counter()
+                upserted += db.bulk_upsert_url_data(entries[i:i + batch_size], chunk_size=batch_size)["upserted"]
+                latencies.append(time.perf_counter() - t0)
+        seconds = time.perf_counter() - started
+    finally:
+        with db.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute("DELETE FROM gambling_urls WHERE url LIKE %s", (prefix + "%",))
+        db.disconnect()
+    return {
+        "items": len(latencies), "unit": f"batches({batch_size})", "seconds": seconds,
+        "latencies": latencies,
+        "output": {"upserted": upserted},
+    }
+
+
+def _run_crawler(args, corpus: ReplayCorpus, work_dir: str, pipeline_enabled: bool) -> Dict[str, Any]:
+    """재생 서버와 가짜 모델로 GamblingDomainCrawler.crawl()을 처음부터 끝까지 실행"""
+    from src.crawler import GamblingDomainCrawler
+    from src.keyword_manager import KeywordManager
+
+    os.environ["GEMINI_API_KEY"] = "benchmark-fake-key"
+    with open(os.path.join(REPO_ROOT, "settings.json"), 'r', encoding='utf-8') as f:
+        settings = json.load(f)
+    settings.update({
+        "keyword_scheduler": "fixed",
+        "delay_between_searches": 0,
+        "max_links_per_search": args.links,
+        "pipeline_enabled": pipeline_enabled,
+        "pipeline_report_interval": 0,
+        "fetch_mode": "tiered",
+        "driver_pool_size": 0,
+        "storage_backend": "json",
+        "output_file": os.path.join(work_dir, "results.jsonl"),
+        "crawl_state_file": os.path.join(work_dir, "crawl_state.sqlite3"),
+        "classification_cache_file": os.path.join(work_dir, "classification_cache.sqlite3"),
+        "near_duplicate_index_file": os.path.join(work_dir, "near_duplicate_index.sqlite3"),
+        "local_model_enabled": False,
+        # 모든 페이지가 같은 호스트(재생 서버)에서 오므로 호스트별 동시 연결 제한을 풂
+        "http_per_host_limit": settings.get("http_max_concurrency", 50),
+        "gemini_max_workers": args.llm_workers,
+        "gemini_rpm": 1_000_000,
+        "gemini_tpm": None,
+        "metrics_port": 0,
+        "metrics_json_file": os.path.join(work_dir, "metrics.json"),
+    })
+    settings_file = os.path.join(work_dir, "settings.json")
+    with open(settings_file, 'w', encoding='utf-8') as f:
+        json.dump(settings, f, ensure_ascii=False)
+    keywords_file = os.path.join(work_dir, "keywords.json")
+    with open(keywords_file, 'w', encoding='utf-8') as f:
+        json.dump({"keywords": corpus.keywords}, f, ensure_ascii=False)
+
+    server = ReplayServer(corpus, serp_latency=args.serp_latency, page_latency=args.page_latency,
+                          jitter=args.page_latency / 2).start()
+    try:
+        crawler = GamblingDomainCrawler(settings_file)
+        install_fake_model(crawler.classifier, args.llm_latency, args.llm_jitter)
+
+        # 키워드 조합 대신 SERP를 녹화한 검색어만 한 번씩 검색
+        crawler.keyword_manager = KeywordManager(keywords_file)
+        crawler.keyword_manager.generate_combinations = crawler.keyword_manager.load_keywords
+
+        # 검색 시작부터 키워드 완료(또는 실패) 기록까지를 키워드별 지연 시간으로 측정
+        search_started, latencies = {}, []
+        crawler.search_engine = ReplaySearchEngine(
+            server, on_search=lambda keyword: search_started.setdefault(keyword, time.perf_counter())
+        )
+        crawler.tiered_fetcher.render_func = crawler.search_engine.render_url
+        for method_name in ("mark_done", "mark_failed"):
+            method = getattr(crawler.crawl_state, method_name)
+
+            def timed(keyword, *call_args, _method=method, **call_kwargs):
+                if keyword in search_started:
+                    latencies.append(time.perf_counter() - search_started[keyword])
+                return _method(keyword, *call_args, **call_kwargs)
+
+            setattr(crawler.crawl_state, method_name, timed)
+
+        started = time.perf_counter()
+        crawler.crawl()
+        seconds = time.perf_counter() - started
+    finally:
+        server.close()
+
+    with open(settings["output_file"], 'r', encoding='utf-8') as f:
+        stored = sorted(json.loads(line)["url"] for line in f if line.strip())
+    # 재생 서버 포트는 실행마다 다르므로 경로만 비교
+    stored_paths = sorted(url.split("/page/", 1)[-1] for url in stored)
+    return {
+        "items": len(latencies), "unit": "keywords", "seconds": seconds,
+        "latencies": latencies,
+        "output": {"pages_served": server.stats["pages"], "stored": len(stored),
+                   "digest": _digest(stored_paths)},
+    }
+
+
+def scenario_browser_tabs(args, corpus: ReplayCorpus, work_dir: str) -> Dict[str, Any]:
+    """SearchEngine.visit_links_parallel로 재생 서버 페이지를 Chrome 탭 여러 개에서 동시에 로딩 (렌더링 프로파일 적용)"""
+    from src.render_profile import RenderProfile
+    from src.search_engine import SearchEngine
+
+    with open(os.path.join(REPO_ROOT, "settings.json"), 'r', encoding='utf-8') as f:
+        settings = json.load(f)
+    settings["render_profile_enabled"] = True
+    settings["render_baseline_sample_rate"] = 0
+
+    server = ReplayServer(corpus, serp_latency=args.serp_latency, page_latency=args.page_latency,
+                          jitter=args.page_latency / 2).start()
+    engine = SearchEngine(visit_mode="parallel", parallel_tabs=args.parallel_tabs,
+                          driver_cache_file=os.path.join(work_dir, ".chromedriver_path.json"),
+                          render_profile=RenderProfile.from_settings(settings))
+    try:
+        try:
+            engine.setup_driver()
+        except Exception as e:
+            return {"skipped": f"Chrome 실행 실패: {str(e).strip()}"}
+        engine.driver.get(server.search_url(corpus.keywords[0]))
+
+        urls = [server.local_url(url) for url in corpus.pages]
+        latencies, visited = [], []
+        started = time.perf_counter()
+        for r in range(args.repeat):
+            for i in range(0, len(urls), args.links):
+                t0 = time.perf_counter()
+                visited += engine.visit_links_parallel(urls[i:i + args.links])
+                latencies.append(time.perf_counter() - t0)
+        seconds = time.perf_counter() - started
+    finally:
+        engine.close()
+        server.close()
+    return {
+        "items": len(visited), "unit": "pages", "seconds": seconds,
+        "latencies": latencies,
+        "output": {"visited": len(visited), "digest": _digest(sorted({url for url, _ in visited}))},
+    }
+
+
+def scenario_crawler_sequential(args, corpus: ReplayCorpus, work_dir: str) -> Dict[str, Any]:
+    """크롤러 전체 (검색어를 하나씩 순서대로 처리)"""
+    return _run_crawler(args, corpus, work_dir, pipeline_enabled=False)
+
+
+def scenario_crawler_pipeline(args, corpus: ReplayCorpus, work_dir: str) -> Dict[str, Any]:
+    """크롤러 전체 (단계별 파이프라인)"""
+    return _run_crawler(args, corpus, work_dir, pipeline_enabled=True)
+
+
+SCENARIOS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "url_extractor": scenario_url_extractor,
+    "text_extraction": scenario_text_extraction,
+    "classifier": scenario_classifier,
+    "json_storage": scenario_json_storage,
+    "database": scenario_database,
+    "browser_tabs": scenario_browser_tabs,
+    "crawler_sequential": scenario_crawler_sequential,
+    "crawler_pipeline": scenario_crawler_pipeline,
+}
+# 명시적으로 지정해야 실행하는 시나리오 (외부 DB에 씀 / 로컬 Chrome 필요)
+OPT_IN_SCENARIOS = {"database", "browser_tabs"}
+
+
+# ---------------------------------------------------------------------------
+# 실행 / 결과 비교
+# ---------------------------------------------------------------------------
+
+def run_scenario_in_process(name: str, args, result_file: str) -> None:
+    """(자식 프로세스) 시나리오 하나를 실행하고 요약을 result_file에 저장"""
+    corpus = load_corpus(args)
+    with tempfile.TemporaryDirectory(prefix=f"bench_{name}_") as work_dir:
+        cwd = os.getcwd()
+        os.chdir(work_dir)
+        try:
+            raw = SCENARIOS[name](args, corpus, work_dir)
+        finally:
+            os.chdir(cwd)
+
+    if raw.get("skipped"):
+        summary = {"skipped": raw["skipped"]}
+    else:
+        latencies = raw["latencies"]
+        summary = {
+            "items": raw["items"],
+            "unit": raw["unit"],
+            "seconds": round(raw["seconds"], 4),
+            "throughput": round(raw["items"] / raw["seconds"], 3) if raw["seconds"] else None,
+            "p50_ms": round(percentile(latencies, 0.5) * 1000, 3) if latencies else None,
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 3) if latencies else None,
+            "output": raw["output"],
+        }
+    # Linux의 ru_maxrss 단위는 KB (macOS는 바이트)
+    scale = 1 if sys.platform == "darwin" else 1024
+    summary["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20, 1)
+    summary["children_peak_rss_mb"] = round(
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale / 2**20, 1
+    )
+    with open(result_file, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False)
+
+
+def git_revision() -> str:
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                  capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return revision + ("+dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _param_args(args) -> List[str]:
+    result = []
+    for name in PARAM_NAMES:
+        value = getattr(args, name)
+        if value is not None:
+            result += [f"--{name.replace('_', '-')}", str(value)]
+    return result
+
+
+def run_benchmarks(args) -> Dict[str, Any]:
+    names = [name.strip() for name in args.scenarios.split(",")] if args.scenarios else \
+        [name for name in SCENARIOS if name not in OPT_IN_SCENARIOS]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"알 수 없는 시나리오: {', '.join(unknown)} (가능: {', '.join(SCENARIOS)})")
+
+    report = {
+        "revision": git_revision(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "params": {name: getattr(args, name) for name in PARAM_NAMES},
+        "scenarios": {},
+    }
+    print(f"⏱️ 벤치마크 시작 (리비전 {report['revision']})")
+
+    for name in names:
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+            result_file = f.name
+        try:
+            command = [sys.executable, os.path.abspath(__file__), "--run-scenario", name,
+                       "--result-file", result_file] + _param_args(args)
+            output = None if args.verbose else subprocess.DEVNULL
+            completed = subprocess.run(command, stdout=output, stderr=output if output else None)
+            if completed.returncode != 0:
+                summary = {"skipped": f"실패 (종료 코드 {completed.returncode}, --verbose로 출력 확인)"}
+            else:
+                with open(result_file, 'r', encoding='utf-8') as f:
+                    summary = json.load(f)
+        finally:
+            os.unlink(result_file)
+        report["scenarios"][name] = summary
+        print_summary_line(name, summary)
+
+    return report
+
+
+def print_summary_line(name: str, summary: Dict[str, Any]) -> None:
+    if summary.get("skipped"):
+        print(f"  {name:<20} ⏭️ {summary['skipped']}")
+        return
+    print(f"  {name:<20} {summary['throughput']:>10.2f} {summary['unit']}/s  "
+          f"p50 {summary['p50_ms']:>9.2f}ms  p99 {summary['p99_ms']:>9.2f}ms  "
+          f"RSS {summary['peak_rss_mb']:>7.1f}MB  {summary['output']}")
+
+
+def _change(before: Optional[float], after: Optional[float]) -> str:
+    if before is None or after is None:
+        return "-"
+    if not before:
+        return "new"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def compare_reports(base: Dict[str, Any], head: Dict[str, Any]) -> int:
+    """두 결과 파일 비교 (처리량은 높을수록, 지연/메모리는 낮을수록 좋음)"""
+    print(f"📊 {base['revision']} → {head['revision']}")
+    changed_params = {name: (base["params"].get(name), head["params"].get(name))
+                      for name in PARAM_NAMES if base["params"].get(name) != head["params"].get(name)}
+    if changed_params:
+        print(f"⚠️ 측정 조건이 다릅니다: {changed_params}")
+
+    print(f"{'scenario':<20}{'throughput':>12}{'p50':>10}{'p99':>10}{'RSS':>10}  output")
+    output_changes = 0
+    for name in sorted(set(base["scenarios"]) | set(head["scenarios"])):
+        before, after = base["scenarios"].get(name, {}), head["scenarios"].get(name, {})
+        if not before or not after or before.get("skipped") or after.get("skipped"):
+            print(f"{name:<20}{'(한쪽에서 실행되지 않음)':>42}")
+            continue
+        same_output = before.get("output") == after.get("output")
+        if not same_output:
+            output_changes += 1
+        print(f"{name:<20}{_change(before['throughput'], after['throughput']):>12}"
+              f"{_change(before['p50_ms'], after['p50_ms']):>10}{_change(before['p99_ms'], after['p99_ms']):>10}"
+              f"{_change(before['peak_rss_mb'], after['peak_rss_mb']):>10}  "
+              f"{'같음' if same_output else '❌ 다름: ' + json.dumps(after.get('output'), ensure_ascii=False)}")
+    return 1 if output_changes else 0
+
+
+def parse_args(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="오프라인 재생 벤치마크")
+    parser.add_argument("--scenarios", help=f"쉼표로 구분한 시나리오 ({', '.join(SCENARIOS)})")
+    parser.add_argument("--output", help="결과 JSON 파일 (기본값: benchmark_results/<리비전>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "HEAD"), help="두 결과 파일 비교")
+    parser.add_argument("--verbose", action="store_true", help="시나리오 실행 출력 표시")
+
+    params = parser.add_argument_group("측정 조건")
+    params.add_argument("--fixtures", help="녹화한 픽스처 디렉토리 (없으면 합성 픽스처)")
+    params.add_argument("--keywords", type=int, default=20, help="합성 픽스처의 검색어 수")
+    params.add_argument("--links", type=int, default=10, help="검색어당 결과 링크 수")
+    params.add_argument("--seed", type=int, default=42)
+    params.add_argument("--repeat", type=int, default=3, help="구성 요소 시나리오 반복 횟수")
+    params.add_argument("--serp-latency", type=float, default=0.05, help="재생 서버 SERP 응답 지연 (초)")
+    params.add_argument("--page-latency", type=float, default=0.05, help="재생 서버 페이지 응답 지연 (초)")
+    params.add_argument("--llm-latency", type=float, default=0.1, help="가짜 모델 응답 지연 (초)")
+    params.add_argument("--llm-jitter", type=float, default=0.05, help="가짜 모델 응답 지연 변동 폭 (초)")
+    params.add_argument("--llm-workers", type=int, default=4, help="분류기 동시 요청 수")
+    params.add_argument("--parallel-tabs", type=int, default=4, help="browser_tabs 시나리오의 동시 탭 수")
+
+    parser.add_argument("--run-scenario", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+
+    if args.run_scenario:
+        run_scenario_in_process(args.run_scenario, args, args.result_file)
+        return 0
+
+    if args.compare:
+        reports = []
+        for path in args.compare:
+            with open(path, 'r', encoding='utf-8') as f:
+                reports.append(json.load(f))
+        return compare_reports(*reports)
+
+    report = run_benchmarks(args)
+    output_file = args.output or os.path.join("benchmark_results", f"{report['revision']}.json")
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"💾 결과 저장: {output_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
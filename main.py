@@ -1,8 +1,85 @@
+import argparse
+import json
+
+from src.crawl_worker import CrawlWorker
 from src.crawler import GamblingDomainCrawler
+from src.job_queue import create_job_queue
+from src.keyword_manager import KeywordManager
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="불법 도박 사이트 크롤러")
+    parser.add_argument("--settings", default="settings.json", help="설정 파일 경로")
+
+    # 여러 프로세스/서버가 작업 대기열을 나눠 처리하는 분산 실행
+    distributed = parser.add_argument_group("분산 실행 (작업 대기열)")
+    distributed.add_argument("--worker", action="store_true",
+                             help="작업 대기열에서 작업을 가져와 처리하는 작업자로 실행")
+    distributed.add_argument("--worker-id", help="작업자 ID (기본값: 호스트 이름:프로세스 ID)")
+    distributed.add_argument("--job-kinds", default="keyword,url",
+                             help="처리할 작업 종류 (쉼표로 구분, keyword / url)")
+    distributed.add_argument("--enqueue-keywords", action="store_true",
+                             help="키워드 조합을 작업 대기열에 추가하고 종료")
+    distributed.add_argument("--enqueue-urls", metavar="FILE",
+                             help="파일의 URL(한 줄에 하나)을 작업 대기열에 추가하고 종료")
+    distributed.add_argument("--requeue-done", action="store_true",
+                             help="이미 완료된 작업도 다시 대기열에 추가")
+    distributed.add_argument("--queue-status", action="store_true", help="작업 대기열 상태를 출력하고 종료")
+    return parser.parse_args()
+
+
+def run_job_queue_command(args) -> None:
+    """작업 대기열 관리 명령 실행 (크롤러를 만들지 않음)"""
+    with open(args.settings, 'r', encoding='utf-8') as f:
+        settings = json.load(f)
+    job_queue = create_job_queue(settings)
+
+    try:
+        if args.enqueue_keywords:
+            keywords = KeywordManager().iter_combinations(settings.get("keyword_max_combination_size", 2))
+            added = job_queue.enqueue("keyword", keywords, requeue_done=args.requeue_done)
+            print(f"📋 {added}개의 검색어 작업 추가 ({job_queue.describe()})")
+        if args.enqueue_urls:
+            with open(args.enqueue_urls, 'r', encoding='utf-8') as f:
+                urls = [line.strip() for line in f if line.strip()]
+            added = job_queue.enqueue("url", urls, requeue_done=args.requeue_done)
+            print(f"🔗 {added}개의 URL 작업 추가 ({job_queue.describe()})")
+
+        print(f"🗂️ 작업 대기열 상태 ({job_queue.describe()})")
+        for kind, counts in sorted(job_queue.get_counts().items()):
+            print(f"  {kind}: 대기 {counts.get('queued', 0)}개, 처리 중 {counts.get('leased', 0)}개, "
+                  f"완료 {counts.get('done', 0)}개, 실패 {counts.get('dead', 0)}개")
+    finally:
+        job_queue.close()
 
 
 def main():
-    crawler = GamblingDomainCrawler()
+    args = parse_args()
+
+    if args.enqueue_keywords or args.enqueue_urls or args.queue_status:
+        run_job_queue_command(args)
+        return
+
+    crawler = GamblingDomainCrawler(args.settings)
+
+    if args.worker:
+        job_queue = create_job_queue(crawler.settings)
+        worker = CrawlWorker(
+            crawler,
+            job_queue,
+            worker_id=args.worker_id,
+            kinds=tuple(kind.strip() for kind in args.job_kinds.split(",") if kind.strip()),
+            url_batch_size=crawler.settings.get("worker_url_batch_size", 20),
+            poll_interval=crawler.settings.get("worker_poll_interval", 5),
+            idle_timeout=crawler.settings.get("worker_idle_timeout", 60)
+        )
+        try:
+            worker.run()
+        finally:
+            job_queue.close()
+            crawler.shutdown()
+        return
+
     crawler.crawl()
 
 
@@ -0,0 +1,221 @@
+import asyncio
+import queue
+import re
+import threading
+import time
+from typing import Dict, Any, Iterator, List, Optional
+
+import aiohttp
+
+from .metrics import PAGE_VISITS, PAGE_LOAD_SECONDS, BYTES_FETCHED, ERRORS
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7'
+}
+
+# 응답 본문을 읽는 단위
+READ_CHUNK_BYTES = 64 * 1024
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+_DONE = object()
+
+
+def decode_html(body: bytes, charset: Optional[str] = None) -> str:
+    """
+    응답 바이트를 문자열로 디코딩합니다.
+    헤더의 charset → HTML meta charset → UTF-8 → CP949(EUC-KR) 순서로 시도합니다.
+    """
+    candidates = []
+    if charset:
+        candidates.append(charset)
+    meta_match = _META_CHARSET_PATTERN.search(body[:4096])
+    if meta_match:
+        candidates.append(meta_match.group(1).decode('ascii', 'ignore'))
+    candidates.extend(['utf-8', 'cp949'])
+
+    for encoding in candidates:
+        try:
+            return body.decode(encoding)
+        except (UnicodeDecodeError, LookupError):
+            continue
+    return body.decode('utf-8', errors='replace')
+
+
+class AsyncFetcher:
+    """
+    asyncio/aiohttp 기반 HTTP 페이지 수집기
+
+    - 하나의 세션(커넥션 풀)을 모든 요청이 공유하며 keep-alive 연결을 재사용
+    - DNS 조회 결과 캐시
+    - 전체 동시 요청 수 / 호스트별 동시 요청 수 제한
+    - 타임아웃, 429/5xx 응답에 대한 제한된 횟수의 재시도 (지수 백오프)
+
+    이벤트 루프는 백그라운드 스레드에서 실행되므로 동기 코드에서도
+    iter_fetch()로 완료되는 순서대로 결과를 받아 바로 처리할 수 있습니다.
+    """
+
+    def __init__(self, max_concurrency: int = 50, per_host_limit: int = 4, timeout: float = 10,
+                 max_retries: int = 2, dns_cache_ttl: int = 300, max_bytes: int = 5 * 1024 * 1024,
+                 headers: Optional[Dict[str, str]] = None):
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.dns_cache_ttl = dns_cache_ttl
+        self.max_bytes = max_bytes
+        self.headers = headers or DEFAULT_HEADERS
+
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self):
+        """백그라운드 이벤트 루프 스레드를 시작합니다"""
+        with self._lock:
+            if self._loop is not None:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="async-fetcher", daemon=True)
+            self._thread.start()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.per_host_limit,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+                keepalive_timeout=30
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def fetch(self, url: str) -> Dict[str, Any]:
+        """
+        URL 하나를 가져옵니다
+
+        Returns:
+            {
+                "url": str (요청 URL),
+                "final_url": str (리다이렉트 후 URL),
+                "status": int or None,
+                "html": str,
+                "bytes": int,
+                "error": str or None
+            }
+        """
+        session = await self._get_session()
+        last_error = None
+        started = time.perf_counter()
+
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                await asyncio.sleep(0.5 * (2 ** (attempt - 1)))
+            try:
+                async with session.get(url, allow_redirects=True) as response:
+                    if response.status in RETRY_STATUSES and attempt < self.max_retries:
+                        last_error = f"HTTP {response.status}"
+                        continue
+
+                    body = await self._read_body(response)
+                    PAGE_VISITS.inc(tier="http")
+                    PAGE_LOAD_SECONDS.observe(time.perf_counter() - started, tier="http")
+                    BYTES_FETCHED.inc(len(body), tier="http")
+                    if response.status >= 400:
+                        ERRORS.inc(stage="fetch")
+                    return {
+                        "url": url,
+                        "final_url": str(response.url),
+                        "status": response.status,
+                        "html": decode_html(body, response.charset),
+                        "bytes": len(body),
+                        "error": None if response.status < 400 else f"HTTP {response.status}",
+                    }
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = str(e) or e.__class__.__name__
+
+        ERRORS.inc(stage="fetch")
+        return {
+            "url": url,
+            "final_url": url,
+            "status": None,
+            "html": "",
+            "bytes": 0,
+            "error": last_error,
+        }
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        """응답 본문을 끝까지 또는 max_bytes까지 읽음 (content.read(n)은 이미 받은 청크까지만 반환)"""
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(READ_CHUNK_BYTES):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.max_bytes:
+                break
+        return b"".join(chunks)[:self.max_bytes]
+
+    async def _fetch_into_queue(self, urls: List[str], result_queue: queue.Queue):
+        try:
+            tasks = [asyncio.ensure_future(self.fetch(url)) for url in urls]
+            for completed in asyncio.as_completed(tasks):
+                result_queue.put(await completed)
+        finally:
+            result_queue.put(_DONE)
+
+    def iter_fetch(self, urls: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        URL 목록을 병렬로 가져오며 완료되는 순서대로 결과를 반환합니다 (동기 제너레이터)
+
+        Args:
+            urls: 가져올 URL 리스트
+
+        Yields:
+            fetch() 결과 딕셔너리
+        """
+        if not urls:
+            return
+
+        self._ensure_loop()
+        result_queue = queue.Queue()
+        future = asyncio.run_coroutine_threadsafe(self._fetch_into_queue(list(urls), result_queue), self._loop)
+
+        while True:
+            item = result_queue.get()
+            if item is _DONE:
+                break
+            yield item
+
+        # 코루틴 내부 예외가 있으면 호출자에게 전달
+        future.result()
+
+    def fetch_all(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """URL 목록을 병렬로 가져와 입력 순서대로 반환합니다"""
+        results = {result["url"]: result for result in self.iter_fetch(urls)}
+        return [results[url] for url in urls if url in results]
+
+    def close(self):
+        """세션과 이벤트 루프를 종료합니다"""
+        with self._lock:
+            if self._loop is None:
+                return
+            if self._session is not None:
+                asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+                self._session = None
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
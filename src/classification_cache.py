@@ -0,0 +1,134 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+
+
+class ClassificationCache:
+    """
+    페이지 텍스트 해시 기반 분류 결과 캐시 (SQLite)
+
+    도메인만 바꿔가며 같은 페이지를 운영하는 사이트가 많으므로,
+    정제된 텍스트 + 프롬프트/모델 버전의 해시를 키로 Gemini 분류 결과를 저장해 두고
+    같은 텍스트가 다시 나오면 API 호출 없이 재사용합니다.
+
+    - ttl_seconds가 지난 항목은 사용하지 않고 삭제
+    - max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제 (LRU)
+    """
+
+    # 이 횟수만큼 저장할 때마다 한 번씩 LRU 정리
+    EVICT_EVERY = 100
+
+    def __init__(self, db_file: str = "classification_cache.sqlite3",
+                 ttl_seconds: float = 30 * 24 * 3600, max_entries: int = 200000):
+        self.db_file = db_file
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self._puts_since_evict = 0
+        self._lock = threading.Lock()
+
+        self.connection = sqlite3.connect(db_file, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS classification_cache (
+                cache_key TEXT PRIMARY KEY,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self.connection.execute("""
+            CREATE INDEX IF NOT EXISTS idx_classification_cache_last_access
+            ON classification_cache(last_access)
+        """)
+        self.connection.commit()
+
+    @staticmethod
+    def make_key(text: str, version: str) -> str:
+        """정제된 텍스트와 프롬프트/모델 버전으로 캐시 키 생성"""
+        digest = hashlib.sha256()
+        digest.update(version.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(text.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 분류 결과 조회 (없거나 만료되었으면 None)"""
+        now = time.time()
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT result, created_at FROM classification_cache WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            result, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                # 만료된 항목 삭제
+                self.connection.execute("DELETE FROM classification_cache WHERE cache_key = ?", (cache_key,))
+                self.connection.commit()
+                self.misses += 1
+                return None
+
+            self.connection.execute(
+                "UPDATE classification_cache SET last_access = ? WHERE cache_key = ?",
+                (now, cache_key)
+            )
+            self.connection.commit()
+            self.hits += 1
+            return json.loads(result)
+
+    def put(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """분류 결과 저장"""
+        now = time.time()
+        with self._lock:
+            self.connection.execute(
+                """
+                INSERT OR REPLACE INTO classification_cache (cache_key, result, created_at, last_access)
+                VALUES (?, ?, ?, ?)
+                """,
+                (cache_key, json.dumps(result, ensure_ascii=False), now, now)
+            )
+            self.connection.commit()
+
+            self._puts_since_evict += 1
+            if self._puts_since_evict >= self.EVICT_EVERY:
+                self._puts_since_evict = 0
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """만료 항목과 max_entries를 넘는 오래된 항목 삭제 (lock을 잡은 상태에서 호출)"""
+        if self.ttl_seconds:
+            self.connection.execute(
+                "DELETE FROM classification_cache WHERE created_at < ?",
+                (now - self.ttl_seconds,)
+            )
+        if self.max_entries:
+            self.connection.execute(
+                """
+                DELETE FROM classification_cache WHERE cache_key IN (
+                    SELECT cache_key FROM classification_cache
+                    ORDER BY last_access DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,)
+            )
+        self.connection.commit()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries = self.connection.execute("SELECT COUNT(*) FROM classification_cache").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
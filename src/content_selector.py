@@ -0,0 +1,164 @@
+import hashlib
+import json
+import threading
+from typing import Dict, Any, List, Optional
+
+from .keyword_prefilter import AhoCorasickMatcher, DEFAULT_SIGNAL_WEIGHTS
+from .text_extractor import TITLE_PREFIX, HEADING_PREFIX
+
+
+# 결제/회원가입 영역을 나타내는 표현 (이 표현이 있는 줄은 도박 신호가 없어도 우선 선택)
+DEFAULT_SECTION_TERMS = [
+    "회원가입", "가입하기", "로그인", "입금", "출금", "충전", "환전", "계좌", "결제", "가입코드", "추천인",
+    "고객센터", "텔레그램", "카카오톡", "sign up", "signup", "register", "login", "log in", "deposit",
+    "withdraw", "payment", "wallet", "telegram",
+]
+
+# 선택하지 않은 줄이 빠진 자리 표시
+GAP_MARKER = "…"
+
+
+class ContentSelector:
+    """
+    프롬프트에 넣을 본문을 토큰 예산 안에서 고르는 선택기
+
+    extract_text(keep_blocks=True)로 블록마다 줄을 나눈 텍스트를 줄(긴 줄은 max_segment_chars 단위) 구간으로 나누고,
+    구간마다 신호 어휘(KeywordPrefilter와 같은 가중치의 절댓값, 합법 신호도 판단 근거이므로 포함)의
+    글자당 밀도로 점수를 매깁니다. 제목 줄은 항상, 소제목과 결제/회원가입 표현이 있는 줄은 가산점을 주고
+    메뉴/푸터처럼 짧거나 반복되는 줄은 뒤로 밀어, 점수 순으로 token_budget에 들어가는 만큼 고른 뒤
+    원래 순서대로 이어 붙입니다. 예산보다 짧은 텍스트는 그대로 반환합니다.
+
+    프롬프트에는 일부만 들어가므로 페이지 끝부분의 가입/결제 안내도 볼 수 있도록
+    텍스트 추출은 MAX_TEXT_CHARS 대신 max_scan_chars까지 합니다.
+    """
+
+    def __init__(self, token_budget: int = 1500, chars_per_token: float = 2,
+                 max_segment_chars: int = 400, min_segment_chars: int = 20, max_scan_chars: int = 200000,
+                 weights: Optional[Dict[str, float]] = None, section_terms: Optional[List[str]] = None,
+                 heading_bonus: float = 1.0, section_bonus: float = 1.0):
+        self.token_budget = token_budget
+        self.chars_per_token = chars_per_token
+        self.budget_chars = int(token_budget * chars_per_token)
+        self.max_segment_chars = max_segment_chars
+        # 이보다 짧은 줄(메뉴 항목, 버튼 등)은 신호가 없으면 가장 나중에 고름
+        self.min_segment_chars = min_segment_chars
+        self.max_scan_chars = max_scan_chars
+        self.heading_bonus = heading_bonus
+        self.section_bonus = section_bonus
+
+        # 영문 패턴은 소문자로 비교
+        self.weights = {pattern.lower(): abs(weight)
+                        for pattern, weight in (weights or DEFAULT_SIGNAL_WEIGHTS).items()}
+        self.section_terms = [term.lower() for term in (section_terms or DEFAULT_SECTION_TERMS)]
+        self.matcher = AhoCorasickMatcher(list(set(self.weights) | set(self.section_terms)))
+
+        self._lock = threading.Lock()
+        self.stats = {"selections": 0, "trimmed": 0, "input_chars": 0, "output_chars": 0}
+
+    @property
+    def version(self) -> str:
+        """선택 설정이 바뀌면 달라지는 값 (분류 캐시 키에 포함)"""
+        config = {
+            "budget_chars": self.budget_chars, "max_segment_chars": self.max_segment_chars,
+            "min_segment_chars": self.min_segment_chars, "heading_bonus": self.heading_bonus,
+            "section_bonus": self.section_bonus, "weights": self.weights, "section_terms": self.section_terms,
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+    def split_segments(self, text: str) -> List[Dict[str, Any]]:
+        """
+        줄 단위 구간으로 나눔 (긴 줄은 max_segment_chars 이하로 공백에서 자름)
+
+        Returns:
+            [{"text", "kind": "title" / "heading" / "body"}, ...] (문서 순서)
+        """
+        segments = []
+        for line in text.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(TITLE_PREFIX):
+                kind = "title"
+            elif line.startswith(HEADING_PREFIX):
+                kind = "heading"
+            else:
+                kind = "body"
+            while len(line) > self.max_segment_chars:
+                cut = line.rfind(" ", 0, self.max_segment_chars + 1)
+                if cut <= 0:
+                    cut = self.max_segment_chars
+                segments.append({"text": line[:cut].rstrip(), "kind": kind})
+                line = line[cut:].lstrip()
+            if line:
+                segments.append({"text": line, "kind": kind})
+        return segments
+
+    def score(self, segment: Dict[str, Any]) -> float:
+        """구간 점수: 신호 어휘의 100글자당 가중치 합 + 소제목/결제·회원가입 가산점"""
+        text = segment["text"]
+        matches = self.matcher.count_matches(text.lower())
+        signal = sum(count * self.weights.get(pattern, 0.0) for pattern, count in matches.items())
+        # 아주 짧은 줄의 밀도가 과장되지 않도록 최소 길이로 나눔
+        score = signal * 100 / max(len(text), self.min_segment_chars * 2)
+        if segment["kind"] == "heading":
+            score += self.heading_bonus
+        if any(term in matches for term in self.section_terms):
+            score += self.section_bonus
+        return score
+
+    def select(self, text: str) -> str:
+        """text에서 token_budget 안에 들어가는 구간을 골라 원래 순서대로 이어 붙인 텍스트 반환"""
+        if len(text) <= self.budget_chars:
+            self._record(len(text), len(text), trimmed=False)
+            return text
+
+        segments = self.split_segments(text)
+        ranked = []
+        seen = set()
+        for index, segment in enumerate(segments):
+            if segment["kind"] == "title":
+                priority = (0, 0.0, index)
+            elif segment["text"] in seen:
+                # 메뉴/푸터처럼 반복되는 줄은 한 번만
+                continue
+            else:
+                score = self.score(segment)
+                # 신호 없는 짧은 줄은 맨 뒤로, 같은 점수면 앞쪽 줄을 먼저 (신호가 없는 페이지는 앞부분이 남음)
+                short = score == 0 and len(segment["text"]) < self.min_segment_chars
+                priority = (2 if short else 1, -score, index)
+            seen.add(segment["text"])
+            ranked.append((priority, index))
+        ranked.sort()
+
+        chosen = set()
+        remaining = self.budget_chars
+        for _, index in ranked:
+            # 줄바꿈 하나와 빠진 자리 표시 한 줄을 여유로 둠
+            cost = len(segments[index]["text"]) + 1 + len(GAP_MARKER) + 1
+            if cost <= remaining:
+                chosen.add(index)
+                remaining -= cost
+            if remaining < self.min_segment_chars:
+                break
+
+        lines = []
+        previous = -1
+        for index in sorted(chosen):
+            if index != previous + 1 and lines:
+                lines.append(GAP_MARKER)
+            lines.append(segments[index]["text"])
+            previous = index
+        selected = "\n".join(lines)
+        self._record(len(text), len(selected), trimmed=True)
+        return selected
+
+    def _record(self, input_chars: int, output_chars: int, trimmed: bool) -> None:
+        with self._lock:
+            self.stats["selections"] += 1
+            self.stats["trimmed"] += int(trimmed)
+            self.stats["input_chars"] += input_chars
+            self.stats["output_chars"] += output_chars
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats)
@@ -0,0 +1,271 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+
+class CrawlStateStore:
+    """
+    크롤링 진행 상태 저장소 (SQLite)
+
+    키워드별 상태(pending / in_progress / done / failed), 시도 횟수, 마지막 실행 시각,
+    누적 수확량(검색 횟수, 새 URL 수, 불법 사이트 탐지 수)을 기록하여
+    브라우저 오류나 CAPTCHA로 중단된 크롤링을 다음 실행에서 이어서 진행합니다.
+
+    검색 중인 키워드의 분류 결과도 URL별로 기록해 두므로,
+    중단된 키워드를 다시 검색할 때 이미 분류한 페이지는 다시 분류하지 않고 기록된 결과를 사용합니다.
+    """
+
+    def __init__(self, db_file: str = "crawl_state.sqlite3", max_attempts: int = 3):
+        self.db_file = db_file
+        # 한 주기에서 이 횟수만큼 실패한 키워드는 failed로 두고 다음 주기까지 건너뜀
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+
+        self.connection = sqlite3.connect(db_file, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS keyword_state (
+                keyword TEXT PRIMARY KEY,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_run REAL,
+                last_error TEXT,
+                searches INTEGER NOT NULL DEFAULT 0,
+                new_urls INTEGER NOT NULL DEFAULT 0,
+                detections INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            )
+        """)
+        # 기존 상태 파일에 SERP 중복 기록 컬럼 추가
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(keyword_state)")}
+        if "duplicate_of" not in columns:
+            self.connection.execute("ALTER TABLE keyword_state ADD COLUMN duplicate_of TEXT")
+            self.connection.execute("ALTER TABLE keyword_state ADD COLUMN duplicate_at REAL")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS idx_keyword_state_updated_at ON keyword_state(updated_at)")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS search_log (
+                keyword TEXT NOT NULL,
+                searched_at REAL NOT NULL
+            )
+        """)
+        self.connection.execute("CREATE INDEX IF NOT EXISTS idx_search_log_searched_at ON search_log(searched_at)")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS serp_fingerprints (
+                fingerprint TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                seen_at REAL NOT NULL,
+                PRIMARY KEY (fingerprint, keyword)
+            )
+        """)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS processed_urls (
+                keyword TEXT NOT NULL,
+                url TEXT NOT NULL,
+                result TEXT NOT NULL,
+                processed_at REAL NOT NULL,
+                PRIMARY KEY (keyword, url)
+            )
+        """)
+        self.connection.commit()
+
+    def prepare_run(self, keywords: List[str]) -> List[str]:
+        """
+        이번 실행에서 검색할 키워드 목록을 반환합니다 (keywords 순서 유지)
+
+        - 새 키워드는 pending으로 등록
+        - done / failed 키워드는 건너뜀 (중단된 in_progress 키워드는 다시 진행)
+        - 남은 키워드가 없으면 모든 키워드를 pending으로 돌려 새 주기를 시작
+        """
+        now = time.time()
+        with self._lock:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO keyword_state (keyword, updated_at) VALUES (?, ?)",
+                [(keyword, now) for keyword in keywords]
+            )
+            self.connection.commit()
+            statuses = dict(self.connection.execute("SELECT keyword, status FROM keyword_state").fetchall())
+
+        remaining = [keyword for keyword in keywords if statuses.get(keyword) not in ("done", "failed")]
+        if remaining:
+            resumed = len(keywords) - len(remaining)
+            if resumed:
+                print(f"↪️ 이전 크롤링 이어서 진행: {resumed}개 키워드 완료, {len(remaining)}개 남음")
+            return remaining
+
+        print("🔄 모든 키워드를 완료하여 새 주기를 시작합니다.")
+        with self._lock:
+            self.connection.execute(
+                "UPDATE keyword_state SET status = 'pending', attempts = 0, last_error = NULL, updated_at = ?",
+                (now,)
+            )
+            self.connection.execute("DELETE FROM processed_urls")
+            self.connection.commit()
+        return list(keywords)
+
+    def mark_started(self, keyword: str) -> None:
+        """키워드 검색 시작 기록 (일일 검색 예산 계산용 검색 기록 포함)"""
+        now = time.time()
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO keyword_state (keyword, updated_at) VALUES (?, ?)", (keyword, now)
+            )
+            self.connection.execute("INSERT INTO search_log (keyword, searched_at) VALUES (?, ?)", (keyword, now))
+            self.connection.execute(
+                """
+                UPDATE keyword_state
+                SET status = 'in_progress', attempts = attempts + 1, last_run = ?, updated_at = ?
+                WHERE keyword = ?
+                """,
+                (now, now, keyword)
+            )
+            self.connection.commit()
+
+    def mark_done(self, keyword: str, new_urls: int, detections: int) -> None:
+        """키워드 검색 완료 기록 (수확량 누적, 연속 실패 횟수 초기화, 분류 결과 기록 삭제)"""
+        with self._lock:
+            self.connection.execute(
+                """
+                UPDATE keyword_state
+                SET status = 'done', attempts = 0, last_error = NULL, searches = searches + 1,
+                    new_urls = new_urls + ?, detections = detections + ?, updated_at = ?
+                WHERE keyword = ?
+                """,
+                (new_urls, detections, time.time(), keyword)
+            )
+            self.connection.execute("DELETE FROM processed_urls WHERE keyword = ?", (keyword,))
+            self.connection.commit()
+
+    def mark_failed(self, keyword: str, error: str) -> None:
+        """키워드 검색 실패 기록 (max_attempts 미만이면 다음 실행에서 다시 시도)"""
+        with self._lock:
+            self.connection.execute(
+                """
+                UPDATE keyword_state
+                SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    last_error = ?, updated_at = ?
+                WHERE keyword = ?
+                """,
+                (self.max_attempts, error, time.time(), keyword)
+            )
+            self.connection.commit()
+
+    def record_result(self, keyword: str, result: Dict[str, Any]) -> None:
+        """키워드 검색 중 분류된 페이지의 결과 기록"""
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO processed_urls (keyword, url, result, processed_at) VALUES (?, ?, ?, ?)",
+                (keyword, result["url"], json.dumps(result, ensure_ascii=False), time.time())
+            )
+            self.connection.commit()
+
+    def get_processed_results(self, keyword: str) -> Dict[str, Dict[str, Any]]:
+        """이전 시도에서 이미 분류한 페이지의 결과 ({url: 분류 결과})"""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT url, result FROM processed_urls WHERE keyword = ?", (keyword,)
+            ).fetchall()
+        return {url: json.loads(result) for url, result in rows}
+
+    def get_keyword_stats(self, updated_since: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """키워드별 상태와 누적 수확량 (updated_since가 있으면 그 이후 바뀐 키워드만)"""
+        query = """
+            SELECT keyword, status, attempts, last_run, last_error, searches, new_urls, detections,
+                   duplicate_of, duplicate_at
+            FROM keyword_state
+        """
+        with self._lock:
+            if updated_since is None:
+                rows = self.connection.execute(query).fetchall()
+            else:
+                rows = self.connection.execute(query + " WHERE updated_at >= ?", (updated_since,)).fetchall()
+        return {
+            row[0]: {
+                "status": row[1],
+                "attempts": row[2],
+                "last_run": row[3],
+                "last_error": row[4],
+                "searches": row[5],
+                "new_urls": row[6],
+                "detections": row[7],
+                "duplicate_of": row[8],
+                "duplicate_at": row[9],
+            }
+            for row in rows
+        }
+
+    def count_searches_since(self, since: float) -> int:
+        """since 이후 시작한 검색 수 (일일 검색 예산 확인용)"""
+        with self._lock:
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM search_log WHERE searched_at >= ?", (since,)
+            ).fetchone()[0]
+
+    @staticmethod
+    def serp_fingerprint(result_urls: List[str]) -> str:
+        """검색 결과 URL 집합의 지문 (순서와 무관)"""
+        digest = hashlib.sha256()
+        for url in sorted(set(result_urls)):
+            digest.update(url.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def find_duplicate_serp(self, keyword: str, result_urls: List[str], window_seconds: float) -> Optional[str]:
+        """
+        window_seconds 안에 완료한 검색 중 같은 검색 결과를 낸 검색어를 찾습니다
+
+        찾으면 키워드에 duplicate_of/duplicate_at을 기록하여 스케줄러가 한동안 이 키워드를 건너뛰도록 합니다.
+
+        Returns:
+            같은 검색 결과를 냈던 검색어 (없으면 None, 지난번 같은 검색어의 결과와 같으면 그 검색어 자신)
+        """
+        if not result_urls:
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self.connection.execute(
+                """
+                SELECT keyword FROM serp_fingerprints
+                WHERE fingerprint = ? AND seen_at >= ?
+                ORDER BY seen_at DESC LIMIT 1
+                """,
+                (self.serp_fingerprint(result_urls), now - window_seconds)
+            ).fetchone()
+            self.connection.execute(
+                "UPDATE keyword_state SET duplicate_of = ?, duplicate_at = ?, updated_at = ? WHERE keyword = ?",
+                (row[0] if row else None, now if row else None, now, keyword)
+            )
+            self.connection.commit()
+        return row[0] if row else None
+
+    def record_serp(self, keyword: str, result_urls: List[str], window_seconds: float) -> None:
+        """
+        처리를 마친 검색 결과의 지문 기록 (window_seconds가 지난 지문은 정리)
+
+        중단된 검색을 다시 진행할 때 자기 자신과 중복으로 판정되지 않도록 검색을 마친 뒤에 기록합니다.
+        """
+        if not result_urls:
+            return
+
+        now = time.time()
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO serp_fingerprints (fingerprint, keyword, seen_at) VALUES (?, ?, ?)",
+                (self.serp_fingerprint(result_urls), keyword, now)
+            )
+            self.connection.execute("DELETE FROM serp_fingerprints WHERE seen_at < ?", (now - window_seconds,))
+            self.connection.commit()
+
+    def get_status_counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT status, COUNT(*) FROM keyword_state GROUP BY status"
+            ).fetchall()
+        return dict(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
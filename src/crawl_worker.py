@@ -0,0 +1,164 @@
+import time
+from typing import List, Dict, Any, Optional
+
+from .crawler import GamblingDomainCrawler
+from .search_engine import SearchBlockedError
+from .job_queue import JobQueue, default_worker_id
+
+
+# URL 작업으로 저장한 결과의 keyword_used 값 (검색어 없이 URL만 대기열에 넣은 경우)
+URL_JOB_KEYWORD = "url_job"
+
+
+class CrawlWorker:
+    """
+    작업 대기열에서 검색어/URL 작업을 가져와 처리하는 작업자
+
+    여러 서버에서 같은 대기열(PostgreSQL crawl_jobs)을 보는 작업자를 여러 개 실행하면
+    각자 다른 작업을 가져가므로 작업자 수에 비례해 처리량이 늘어납니다.
+
+    - "keyword" 작업: 검색 후 결과 페이지를 방문/분류하여 저장 (한 번에 하나씩)
+    - "url" 작업: HTTP로 가져와 분류하여 저장 (url_batch_size개씩 묶어서 처리)
+
+    처리하는 동안 임대 기간을 계속 연장하고, 끝나면 ack, 예외가 나면 fail로 기록합니다.
+    검색이 차단된 검색어 작업은 재시도 횟수를 쓰지 않고 늘어난 검색 간격만큼 뒤로 미뤄 돌려놓고,
+    차단이 max_consecutive_blocks번 연달아 나면 작업자를 중단합니다.
+    작업자가 죽어 임대가 만료된 작업은 다른 작업자가 다시 가져갑니다.
+    """
+
+    def __init__(self, crawler: GamblingDomainCrawler, job_queue: JobQueue, worker_id: Optional[str] = None,
+                 kinds: tuple = ("keyword", "url"), url_batch_size: int = 20, poll_interval: float = 5,
+                 idle_timeout: float = 60):
+        self.crawler = crawler
+        self.job_queue = job_queue
+        self.worker_id = worker_id or default_worker_id()
+        self.kinds = tuple(kinds)
+        self.url_batch_size = url_batch_size
+        self.poll_interval = poll_interval
+        # 가져올 작업이 없는 상태가 이 시간(초)만큼 계속되면 종료 (0이면 계속 대기)
+        self.idle_timeout = idle_timeout
+        self.stats = {"acked": 0, "failed": 0, "released": 0, "lost": 0}
+
+    def run(self) -> Dict[str, int]:
+        """대기열이 빌 때까지(idle_timeout) 작업을 처리하고 처리 통계를 반환합니다"""
+        print(f"👷 작업자 시작: {self.worker_id} (작업 종류: {', '.join(self.kinds)}, 대기열: {self.job_queue.describe()})")
+
+        if self.crawler.driver_pool and "keyword" in self.kinds:
+            self.crawler.driver_pool.start()
+
+        existing_urls = self.crawler.storage.get_existing_urls()
+        idle_since = None
+
+        try:
+            while True:
+                # 검색어 작업은 브라우저를 쓰므로 하나씩, URL 작업은 묶어서 가져옴
+                jobs = []
+                if "keyword" in self.kinds:
+                    jobs = self.job_queue.claim(self.worker_id, kinds=("keyword",), limit=1)
+                if not jobs and "url" in self.kinds:
+                    jobs = self.job_queue.claim(self.worker_id, kinds=("url",), limit=self.url_batch_size)
+
+                if not jobs:
+                    idle_since = idle_since or time.monotonic()
+                    if self.idle_timeout and time.monotonic() - idle_since >= self.idle_timeout:
+                        print(f"💤 {self.idle_timeout}초 동안 가져올 작업이 없어 작업자를 종료합니다.")
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+                idle_since = None
+
+                with self.job_queue.keep_alive([job["id"] for job in jobs], self.worker_id):
+                    if jobs[0]["kind"] == "keyword":
+                        self._process_keyword_job(jobs[0], existing_urls)
+                    else:
+                        self._process_url_jobs(jobs, existing_urls)
+                # 검색 간격은 크롤러의 search_pacer가 다음 검색 요청 직전에 맞춤
+        finally:
+            print(f"👷 작업자 종료: 완료 {self.stats['acked']}개, 실패 {self.stats['failed']}개, "
+                  f"차단으로 반환 {self.stats['released']}개, 임대 만료 {self.stats['lost']}개")
+
+        return dict(self.stats)
+
+    def _process_keyword_job(self, job: Dict[str, Any], existing_urls: set) -> None:
+        keyword = job["key"]
+        print(f"\n🔎 [작업 {job['id']}, {job['attempts']}번째 시도] 검색 키워드: {keyword}")
+        max_links_per_search = self.crawler.settings.get("max_links_per_search", 10)
+        try:
+            new_url_count, detections = self.crawler._run_keyword(keyword, existing_urls, max_links_per_search)
+        except SearchBlockedError as e:
+            # 검색어 탓이 아니므로 시도 횟수를 되돌리고, 늘어난 검색 간격이 지난 뒤 다시 가져가도록 함
+            self._release(job, str(e), delay=self.crawler.search_pacer.interval)
+            if not self.crawler._can_continue_after_block(e):
+                raise
+            return
+        except Exception as e:
+            print(f"  ❌ 검색어 작업 실패: {e}")
+            self._fail(job, str(e))
+            return
+        self._ack(job, {"new_urls": new_url_count, "detections": detections})
+
+    def _process_url_jobs(self, jobs: List[Dict[str, Any]], existing_urls: set) -> None:
+        print(f"\n🔗 URL 작업 {len(jobs)}개 처리 중...")
+
+        # 이미 저장된 URL은 분류하지 않고 완료 처리
+        new_jobs = []
+        for job in jobs:
+            if job["key"] in existing_urls:
+                self._ack(job, {"skipped": "existing"})
+            else:
+                new_jobs.append(job)
+        if not new_jobs:
+            return
+
+        try:
+            filtered_urls, classification_results = self.crawler._classify_and_filter_urls(
+                [job["key"] for job in new_jobs]
+            )
+        except Exception as e:
+            print(f"  ❌ URL 작업 실패: {e}")
+            for job in new_jobs:
+                self._fail(job, str(e))
+            return
+
+        results_by_url = {result["url"]: result for result in classification_results or []}
+        if filtered_urls:
+            # 불법 사이트로 판별된 URL만 저장 (분류 결과를 URL 순서에 맞춰 전달)
+            self.crawler.storage.save_results(
+                filtered_urls, URL_JOB_KEYWORD,
+                [results_by_url[url] for url in filtered_urls] if classification_results else None
+            )
+            existing_urls.update(filtered_urls)
+
+        # 분류기가 없으면 모든 URL이 그대로 저장됨
+        if classification_results is None:
+            for job in new_jobs:
+                self._ack(job, {"is_illegal": True})
+            return
+
+        for job in new_jobs:
+            result = results_by_url.get(job["key"])
+            if result is None:
+                self._fail(job, "콘텐츠 가져오기 실패")
+            elif result.get("error"):
+                self._fail(job, result["error"])
+            else:
+                self._ack(job, {"is_illegal": bool(result.get("is_illegal"))})
+
+    def _ack(self, job: Dict[str, Any], result: Dict[str, Any]) -> None:
+        if self.job_queue.ack(job["id"], self.worker_id, result):
+            self.stats["acked"] += 1
+        else:
+            self.stats["lost"] += 1
+            print(f"  ⚠️ 작업 {job['id']}의 임대가 만료되어 완료 기록을 건너뜁니다.")
+
+    def _fail(self, job: Dict[str, Any], error: str) -> None:
+        if self.job_queue.fail(job["id"], self.worker_id, error):
+            self.stats["failed"] += 1
+        else:
+            self.stats["lost"] += 1
+
+    def _release(self, job: Dict[str, Any], error: str, delay: float) -> None:
+        if self.job_queue.release(job["id"], self.worker_id, error, delay):
+            self.stats["released"] += 1
+        else:
+            self.stats["lost"] += 1
@@ -1,16 +1,34 @@
-import time
 import json
 import requests
 import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any
 from urllib.parse import urlparse
 from dotenv import load_dotenv
 
 from .keyword_manager import KeywordManager
-from .search_engine import SearchEngine
+from .search_engine import SearchEngine, SearchBlockedError
+from .driver_pool import DriverPool
+from .render_profile import RenderProfile
+from .pacing import SearchPacer
+from .async_fetcher import AsyncFetcher
+from .tiered_fetcher import TieredFetcher
 from .url_extractor import URLExtractor
-from .json_storage import JSONStorage
-from .gemini_classifier import GeminiClassifier
+from .storage import create_storage
+from .gemini_classifier import GeminiClassifier, ClassificationDeferredError, CHARS_PER_TOKEN
+from .classification_cache import ClassificationCache
+from .near_duplicate_index import NearDuplicateIndex
+from .keyword_prefilter import KeywordPrefilter
+from .local_model import LocalTextClassifier
+from .content_selector import ContentSelector
+from .training_samples import TrainingSampleStore
+from .crawl_state import CrawlStateStore
+from .keyword_scheduler import KeywordScheduler
+from .pipeline import Pipeline
+from .text_extractor import extract_text
+from .metrics import REGISTRY, DETECTIONS, TEXT_EXTRACTION_SECONDS, start_metrics_server
 
 
 class GamblingDomainCrawler:
@@ -20,46 +38,233 @@ class GamblingDomainCrawler:
         
         self.settings = self._load_settings(settings_file)
         self.keyword_manager = KeywordManager()
-        self.search_engine = SearchEngine(headless=self.settings.get("headless_mode", True))
+
+        # 브라우저 렌더링 프로파일 (리소스 차단 + eager 로딩, render_profile_enabled가 false면 사용 안 함)
+        self.render_profile = RenderProfile.from_settings(self.settings)
+
+        # 드라이버 풀 초기화 (driver_pool_size가 0이면 단독 드라이버 사용)
+        driver_cache_file = self.settings.get("chromedriver_cache_file", ".chromedriver_path.json")
+        self.driver_pool = None
+        if self.settings.get("driver_pool_size", 0) > 0:
+            self.driver_pool = DriverPool(
+                size=self.settings.get("driver_pool_size"),
+                headless=self.settings.get("headless_mode", True),
+                max_pages=self.settings.get("driver_max_pages", 200),
+                max_rss_mb=self.settings.get("driver_max_rss_mb", 2048),
+                rss_check_interval=self.settings.get("driver_rss_check_interval", 20),
+                driver_cache_file=driver_cache_file,
+                render_profile=self.render_profile,
+                create_retries=self.settings.get("driver_create_retries", 2),
+                backfill_interval=self.settings.get("driver_backfill_interval", 30),
+                acquire_timeout=self.settings.get("driver_acquire_timeout", 120)
+            )
+
+        # Google 검색 간격 조절기 (delay_between_searches에서 시작해 CAPTCHA/차단 비율에 따라 조절)
+        self.search_pacer = SearchPacer(
+            initial_interval=self.settings.get("delay_between_searches", 5),
+            min_interval=self.settings.get("search_min_interval", 2),
+            max_interval=self.settings.get("search_max_interval", 120),
+            decrease_step=self.settings.get("search_interval_step", 0.5),
+            backoff_factor=self.settings.get("search_backoff_factor", 2.0),
+            jitter=self.settings.get("search_interval_jitter", 0.3),
+            target_block_rate=self.settings.get("search_target_block_rate", 0.02)
+        )
+        # CAPTCHA/차단이 이 횟수만큼 연달아 나오면 크롤링 중단 (그 전까지는 간격을 늘려 계속 진행)
+        self.max_consecutive_blocks = self.settings.get("search_max_consecutive_blocks", 3)
+
         self.url_extractor = URLExtractor(
             remove_tracking_params=self.settings.get("remove_tracking_params", True)
         )
-        self.storage = JSONStorage(self.settings.get("output_file", "results.json"))
+        self.search_engine = SearchEngine(
+            headless=self.settings.get("headless_mode", True),
+            visit_mode=self.settings.get("visit_mode", "click"),
+            parallel_tabs=self.settings.get("parallel_tabs", 4),
+            page_load_timeout=self.settings.get("page_load_timeout", 15),
+            driver_pool=self.driver_pool,
+            driver_cache_file=driver_cache_file,
+            serp_pages=self.settings.get("serp_pages", 1),
+            url_extractor=self.url_extractor,
+            render_profile=self.render_profile,
+            pacer=self.search_pacer,
+            serp_timeout=self.settings.get("serp_timeout", 10),
+            page_idle_seconds=self.settings.get("page_idle_seconds", 0.5)
+        )
+        # 결과 저장소 ("json": 결과 파일, "postgres": DB에 백그라운드로 일괄 반영)
+        self.storage = create_storage(self.settings)
+
+        # HTTP 수집기 (커넥션 풀 공유)
+        self.http_session = requests.Session()
+        self.fetcher = AsyncFetcher(
+            max_concurrency=self.settings.get("http_max_concurrency", 50),
+            per_host_limit=self.settings.get("http_per_host_limit", 4),
+            timeout=self.settings.get("http_timeout", 10),
+            max_retries=self.settings.get("http_max_retries", 2),
+            dns_cache_ttl=self.settings.get("dns_cache_ttl", 300)
+        )
+
+        # 페이지 수집 방식: "browser" (검색 결과 링크를 브라우저로 방문) 또는
+        # "tiered" (HTTP로 먼저 가져오고 필요한 페이지만 브라우저로 렌더링)
+        self.fetch_mode = self.settings.get("fetch_mode", "browser")
+        browser_workers = max(1, self.driver_pool.size - 1) if self.driver_pool else 1
+        self.tiered_fetcher = TieredFetcher(
+            self.fetcher,
+            render_func=self.search_engine.render_url,
+            browser_workers=browser_workers,
+            min_text_chars=self.settings.get("tiered_min_text_chars", 200)
+        )
+        # URL별 수집 단계 기록 (final_url -> "http" | "browser")
+        self.fetch_tiers = {}
+
+        # 크롤링 진행 상태 (crawl_state_file이 비어 있으면 사용 안 함)
+        crawl_state_file = self.settings.get("crawl_state_file", "crawl_state.sqlite3")
+        self.crawl_state = CrawlStateStore(
+            crawl_state_file,
+            max_attempts=self.settings.get("crawl_max_keyword_attempts", 3)
+        ) if crawl_state_file else None
+
+        # 검색어 선택 방식: "lazy" (검색 성과 기반 스케줄러, crawl_state_file 필요) 또는 "fixed" (모든 조합을 순서대로)
+        self.keyword_scheduler = None
+        if self.settings.get("keyword_scheduler", "fixed") == "lazy":
+            if self.crawl_state:
+                self.keyword_scheduler = KeywordScheduler(
+                    self.keyword_manager,
+                    self.crawl_state,
+                    max_combination_size=self.settings.get("keyword_max_combination_size", 2),
+                    daily_budget=self.settings.get("daily_search_budget", 300),
+                    exploration_rate=self.settings.get("scheduler_exploration_rate", 0.2),
+                    research_interval_hours=self.settings.get("keyword_research_interval_hours", 24),
+                    serp_dedup_window_hours=self.settings.get("serp_dedup_window_hours", 72)
+                )
+            else:
+                print("⚠️ 경고: keyword_scheduler \"lazy\"는 crawl_state_file이 필요하여 고정 순서로 검색합니다.")
+        self.serp_dedup_window = self.settings.get("serp_dedup_window_hours", 72) * 3600
         
         # Gemini 분류기 초기화 (.env 파일에서 API 키 자동 로드)
         try:
             # GeminiClassifier는 자동으로 .env에서 GEMINI_API_KEY를 로드함
-            self.classifier = GeminiClassifier()
+            self.classifier = GeminiClassifier(
+                max_workers=self.settings.get("gemini_max_workers", 4),
+                requests_per_minute=self.settings.get("gemini_rpm", 60),
+                tokens_per_minute=self.settings.get("gemini_tpm"),
+                max_retries=self.settings.get("gemini_max_retries", 3),
+                breaker_threshold=self.settings.get("gemini_breaker_threshold", 5),
+                breaker_cooldown=self.settings.get("gemini_breaker_cooldown", 60),
+                cache=self._create_classification_cache(),
+                near_duplicate_index=self._create_near_duplicate_index(),
+                prefilter=self._create_prefilter(),
+                local_model=self._load_local_model(),
+                content_selector=self._create_content_selector(),
+                training_samples=self._create_training_samples()
+            )
             self.use_classifier = self.settings.get("use_gemini_classifier", True)
         except ValueError as e:
             print(f"⚠️ 경고: Gemini 분류기 초기화 실패 - {e}")
             self.classifier = None
             self.use_classifier = False
 
+        # 단계별 지표 HTTP 서버 (metrics_port가 0이면 사용 안 함)
+        self.metrics_server = None
+        metrics_port = self.settings.get("metrics_port", 0)
+        if metrics_port:
+            try:
+                self.metrics_server = start_metrics_server(metrics_port, self.settings.get("metrics_host", "127.0.0.1"))
+            except OSError as e:
+                # 같은 서버에서 작업자를 여러 개 실행하면 포트가 겹칠 수 있음
+                print(f"⚠️ 경고: 지표 서버 시작 실패 (포트 {metrics_port}) - {e}")
+
     def _load_settings(self, settings_file: str) -> Dict[str, Any]:
         # 설정 파일 로드
         with open(settings_file, 'r', encoding='utf-8') as f:
             return json.load(f)
 
+    def _create_classification_cache(self):
+        """설정에 따라 분류 결과 캐시 생성 (classification_cache_file이 비어 있으면 사용 안 함)"""
+        cache_file = self.settings.get("classification_cache_file", "classification_cache.sqlite3")
+        if not cache_file:
+            return None
+        return ClassificationCache(
+            cache_file,
+            ttl_seconds=self.settings.get("classification_cache_ttl_days", 30) * 24 * 3600,
+            max_entries=self.settings.get("classification_cache_max_entries", 200000)
+        )
+
+    def _create_near_duplicate_index(self):
+        """설정에 따라 유사 페이지 인덱스 생성 (near_duplicate_index_file이 비어 있으면 사용 안 함)"""
+        index_file = self.settings.get("near_duplicate_index_file", "near_duplicate_index.sqlite3")
+        if not index_file:
+            return None
+        return NearDuplicateIndex(
+            index_file,
+            max_distance=self.settings.get("near_duplicate_max_distance", 3),
+            min_text_chars=self.settings.get("near_duplicate_min_text_chars", 200)
+        )
+
+    def _create_training_samples(self):
+        """설정에 따라 로컬 모델 학습 표본 저장소 생성 (training_samples_file이 비어 있으면 사용 안 함)"""
+        samples_file = self.settings.get("training_samples_file", "training_samples.sqlite3")
+        if not samples_file:
+            return None
+        return TrainingSampleStore(
+            samples_file,
+            max_entries=self.settings.get("training_samples_max_entries", 100000)
+        )
+
+    def _create_prefilter(self):
+        """설정에 따라 키워드 점수 사전 필터 생성"""
+        if not self.settings.get("prefilter_enabled", True):
+            return None
+        return KeywordPrefilter(
+            high_score=self.settings.get("prefilter_high_score", 15.0),
+            low_score=self.settings.get("prefilter_low_score", 1.0),
+            min_text_chars=self.settings.get("prefilter_min_text_chars", 500)
+        )
+
+    def _create_content_selector(self):
+        """설정에 따라 프롬프트 본문 선택기 생성 (content_selector_enabled가 false면 사용 안 함)"""
+        if not self.settings.get("content_selector_enabled", True):
+            return None
+        return ContentSelector(
+            token_budget=self.settings.get("prompt_token_budget", 1500),
+            chars_per_token=CHARS_PER_TOKEN,
+            max_segment_chars=self.settings.get("content_segment_max_chars", 400),
+            max_scan_chars=self.settings.get("content_max_scan_chars", 200000)
+        )
+
+    def _load_local_model(self):
+        """설정에 따라 가장 최신 버전의 로컬 분류 모델 로드 (모델 파일이 없으면 사용 안 함)"""
+        if not self.settings.get("local_model_enabled", True):
+            return None
+        model_path = LocalTextClassifier.latest_model_path(self.settings.get("local_model_dir", "models"))
+        if not model_path:
+            return None
+        model = LocalTextClassifier.load(
+            model_path,
+            high=self.settings.get("local_model_high", 0.9),
+            low=self.settings.get("local_model_low", 0.1)
+        )
+        print(f"🧠 로컬 분류 모델 로드: {model_path}")
+        return model
+
     def _fetch_html_from_url(self, url: str, timeout: int = 10) -> str:
         """URL에서 HTML 콘텐츠를 가져옵니다"""
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = self.http_session.get(url, headers=headers, timeout=timeout)
             response.encoding = response.apparent_encoding or 'utf-8'
             return response.text
         except Exception as e:
             print(f"  ❌ URL 가져오기 실패 {url}: {e}")
             return ""
 
-    def _classify_visited_results(self, visited_results: list) -> tuple:
+    def _classify_visited_results(self, visited_results: list, keyword: str = None) -> tuple:
         """
         방문한 결과(URL과 HTML 쌍)를 분류하고 불법 도박 사이트만 필터링합니다
         
         Args:
             visited_results: [(url, html_content), ...] 형태의 리스트
+            keyword: 검색 키워드 (크롤링 상태 저장소에 분류 결과를 기록할 때 사용)
         
         Returns:
             (filtered_urls, classification_results) 튜플
@@ -68,21 +273,39 @@ class GamblingDomainCrawler:
             # 분류기가 없으면 모든 URL 반환
             return [url for url, _ in visited_results], None
 
+        def pages_to_classify():
+            for url, html_content in visited_results:
+                if not html_content:
+                    print(f"  ⏭️ 건너뛰기 {url} - HTML 콘텐츠 없음")
+                    continue
+                print(f"  🔍 분류 중: {url}")
+                yield url, html_content
+
+        return self._run_classification(pages_to_classify(), keyword=keyword)
+
+    def _run_classification(self, pages, keyword: str = None) -> tuple:
+        """
+        (url, html_content) 쌍들을 Gemini로 동시에 분류하고 결과가 나오는 순서대로 필터링합니다
+
+        Returns:
+            (filtered_urls, classification_results) 튜플
+        """
         filtered_urls = []
         classification_results = []
 
-        for url, html_content in visited_results:
-            if not html_content:
-                print(f"  ⏭️ 건너뛰기 {url} - HTML 콘텐츠 없음")
-                continue
-
-            # Gemini로 불법 사이트 판별
-            print(f"  🔍 분류 중: {url}")
-            result = self.classifier.classify_url(url, html_content)
+        for result in self.classifier.classify_batch(pages):
+            url = result["url"]
+            if url in self.fetch_tiers:
+                result["fetch_tier"] = self.fetch_tiers[url]
             classification_results.append(result)
 
+            # 중단 후 다시 검색할 때 재분류하지 않도록 결과 기록 (오류 결과는 다시 분류)
+            if self.crawl_state and keyword and result.get("error") is None:
+                self.crawl_state.record_result(keyword, result)
+
             # 오류가 없고 불법 사이트면 필터링된 목록에 추가
             if result.get("error") is None and result.get("is_illegal"):
+                DETECTIONS.inc()
                 print(f"  ✅ 불법 사이트 탐지: {url} (신뢰도: {result.get('confidence', 0):.2f})")
                 filtered_urls.append(url)
             elif result.get("error"):
@@ -92,6 +315,38 @@ class GamblingDomainCrawler:
 
         return filtered_urls, classification_results
 
+    def _collect_search_result_pages(self, max_links: int, links: list = None) -> list:
+        """
+        현재 검색 결과 페이지의 링크들을 수집 방식(fetch_mode)에 따라 가져옵니다
+
+        Args:
+            max_links: 방문할 최대 링크 수
+            links: 이미 수집한 검색 결과 링크 (없으면 검색 결과 페이지에서 수집)
+
+        Returns:
+            [(url, html_content), ...] 형태의 리스트
+        """
+        if self.fetch_mode != "tiered":
+            # 검색 결과 링크를 직접 방문하며 HTML 수집
+            if links is not None and self.search_engine.visit_mode == "parallel":
+                return self.search_engine.visit_links(links)
+            return self.search_engine.visit_search_result_links(max_links=max_links)
+
+        if links is None:
+            links = self.search_engine.collect_search_result_links(max_links=max_links)
+        visited_results = []
+        for fetch_result in self.tiered_fetcher.fetch(links):
+            if not fetch_result["html"]:
+                print(f"    ❌ 링크 수집 실패 {fetch_result['url']}: {fetch_result['error']}")
+                continue
+            final_url = fetch_result["final_url"]
+            self.fetch_tiers[final_url] = fetch_result["tier"]
+            visited_results.append((final_url, fetch_result["html"]))
+            reason = fetch_result["escalation_reason"]
+            tier_note = f" (사유: {reason})" if fetch_result["tier"] == "browser" else ""
+            print(f"    ✅ HTML 수집 완료 [{fetch_result['tier']}]: {final_url}{tier_note}")
+        return visited_results
+
     def _classify_and_filter_urls(self, urls: list) -> tuple:
         """
         URL 목록을 분류하고 불법 도박 사이트만 필터링합니다
@@ -102,92 +357,450 @@ class GamblingDomainCrawler:
         if not self.use_classifier or not self.classifier:
             return urls, None
 
-        filtered_urls = []
-        classification_results = []
+        def fetched_pages():
+            # 모든 URL을 병렬로 가져오고, 도착하는 순서대로 바로 분류기로 전달
+            print(f"  📥 {len(urls)}개 URL 콘텐츠 가져오는 중...")
+            for fetch_result in self.fetcher.iter_fetch(urls):
+                url = fetch_result["url"]
+                if not fetch_result["html"]:
+                    # HTML을 가져올 수 없으면 건너뛰기
+                    print(f"  ⏭️ 건너뛰기 {url} - 콘텐츠 가져오기 실패 ({fetch_result['error']})")
+                    continue
+                print(f"  🔍 분류 중: {url}")
+                yield url, fetch_result["html"]
 
-        for url in urls:
-            # URL에서 HTML 콘텐츠 가져오기
-            print(f"  📥 콘텐츠 가져오는 중: {url}")
-            html_content = self._fetch_html_from_url(url)
+        return self._run_classification(fetched_pages())
 
-            if not html_content:
-                # HTML을 가져올 수 없으면 건너뛰기
-                print(f"  ⏭️ 건너뛰기 {url} - 콘텐츠 가져오기 실패")
-                continue
+    def crawl(self):
+        print("🚀 불법 도박 사이트 크롤러 시작...")
 
-            # Gemini로 불법 사이트 판별
-            print(f"  🔍 분류 중: {url}")
-            result = self.classifier.classify_url(url, html_content)
-            classification_results.append(result)
+        try:
+            # 드라이버 풀 미리 준비 (warm startup)
+            if self.driver_pool:
+                self.driver_pool.start()
 
-            # 오류가 없고 불법 사이트면 필터링된 목록에 추가
-            if result.get("error") is None and result.get("is_illegal"):
-                print(f"  ✅ 불법 사이트 탐지: {url} (신뢰도: {result.get('confidence', 0):.2f})")
-                filtered_urls.append(url)
-            elif result.get("error"):
-                print(f"  ⚠️ 분류 오류 {url}: {result.get('error')}")
+            max_links_per_search = self.settings.get("max_links_per_search", 10)
+            existing_urls = self.storage.get_existing_urls()
+            keywords, total = self._iter_keywords()
+
+            if self.settings.get("pipeline_enabled", False):
+                # 검색 → 수집 → 텍스트 추출 → 분류 → 저장 단계를 동시에 진행
+                self._crawl_pipeline(keywords, total, existing_urls, max_links_per_search)
             else:
-                print(f"  ❌ 불법 도박 사이트 아님: {url}")
+                # 검색 간격은 search_pacer가 검색 요청 직전에 맞춤
+                for i, keyword in enumerate(keywords, 1):
+                    print(f"\n🔎 [{i}/{total or '?'}] 검색 키워드: {keyword}")
+                    try:
+                        self._run_keyword(keyword, existing_urls, max_links_per_search)
+                    except SearchBlockedError as e:
+                        if not self._can_continue_after_block(e):
+                            raise
+                    except ClassificationDeferredError as e:
+                        # 키워드는 실패로 기록되어 다음 실행에서 남은 페이지를 다시 분류
+                        print(f"  ⚠️ {e} (키워드: {keyword}, 다음에 다시 시도합니다)")
+        finally:
+            # 오류로 중단되어도 브라우저를 종료하고 저장소에 남은 결과를 모두 기록
+            self.shutdown()
 
-        return filtered_urls, classification_results
+    def _iter_keywords(self) -> tuple:
+        """
+        검색할 키워드를 하나씩 돌려주는 iterator와 전체 개수
 
-    def crawl(self):
-        print("🚀 불법 도박 사이트 크롤러 시작...")
+        Returns:
+            (키워드 iterator, 전체 키워드 수) 튜플 (스케줄러를 사용하면 전체 수는 None)
+        """
+        if self.keyword_scheduler:
+            # 검색 성과에 따라 다음 검색어를 골라 오늘 검색 예산 안에서 검색
+            print(f"📋 검색 성과 기반 스케줄러 사용 (오늘 남은 검색 예산: {self.keyword_scheduler.remaining_budget()}회)")
+            return iter(self.keyword_scheduler.next_query, None), None
 
         # 키워드 조합 생성
         keywords = self.keyword_manager.generate_combinations()
         print(f"📋 {len(keywords)}개의 키워드 조합 생성 완료")
 
-        delay = self.settings.get("delay_between_searches", 2)
-        max_links_per_search = self.settings.get("max_links_per_search", 10)
-        existing_urls = self.storage.get_existing_urls()
+        # 이전 실행에서 완료한 키워드는 건너뛰고 이어서 진행
+        if self.crawl_state:
+            keywords = self.crawl_state.prepare_run(keywords)
+        return iter(keywords), len(keywords)
+
+    def shutdown(self):
+        """브라우저와 연결을 종료하고 결과 요약 출력"""
+        try:
+            self.search_engine.close()
+            if self.driver_pool:
+                self.driver_pool.close()
+            self.fetcher.close()
+            self.http_session.close()
+            self._print_final_stats()
+        finally:
+            # 브라우저 종료나 요약 출력이 실패해도 대기 중인 결과는 저장소에 반영
+            self.storage.close()
+            if self.crawl_state:
+                self.crawl_state.close()
+            self._save_metrics()
+
+    def _save_metrics(self):
+        """실행 종료 시 지표를 JSON 파일로 저장하고 지표 서버 종료 (metrics_json_file이 비어 있으면 저장 안 함)"""
+        metrics_file = self.settings.get("metrics_json_file", "metrics.json")
+        if metrics_file:
+            try:
+                REGISTRY.dump_json(metrics_file)
+                print(f"📈 지표 저장: {metrics_file}")
+            except OSError as e:
+                print(f"⚠️ 지표 저장 실패: {e}")
+        if self.metrics_server:
+            self.metrics_server.shutdown()
+            self.metrics_server.server_close()
+            self.metrics_server = None
+
+    def _can_continue_after_block(self, error: SearchBlockedError) -> bool:
+        """CAPTCHA/차단 후 (늘어난 검색 간격으로) 계속 진행할지 여부"""
+        blocks = self.search_pacer.consecutive_blocks
+        if blocks >= self.max_consecutive_blocks:
+            print(f"  🛑 CAPTCHA/차단이 {blocks}번 연달아 발생하여 크롤링을 중단합니다: {error}")
+            return False
+        print(f"  ⚠️ 검색이 차단되어 이 키워드는 다음에 다시 시도합니다 (연속 {blocks}회)")
+        return True
+
+    def _run_keyword(self, keyword: str, existing_urls: set, max_links_per_search: int) -> tuple:
+        """
+        키워드 하나를 처리하고 크롤링 상태 저장소에 시작/완료/실패를 기록합니다
+
+        Returns:
+            (새로운 URL 수, 저장한 불법 도박 사이트 수) 튜플
+        """
+        if self.crawl_state:
+            self.crawl_state.mark_started(keyword)
+        try:
+            new_url_count, detections = self._process_keyword(keyword, existing_urls, max_links_per_search)
+        except Exception as e:
+            # 브라우저 오류 등으로 중단: 다음 실행에서 이 키워드부터 다시 진행
+            if self.crawl_state:
+                self.crawl_state.mark_failed(keyword, str(e))
+            raise
+        if self.crawl_state:
+            self.crawl_state.mark_done(keyword, new_url_count, detections)
+        return new_url_count, detections
+
+    def _process_keyword(self, keyword: str, existing_urls: set, max_links_per_search: int) -> tuple:
+        """
+        키워드 하나를 검색하고 결과 페이지를 분류하여 불법 도박 사이트를 저장합니다
+
+        Returns:
+            (새로운 URL 수, 저장한 불법 도박 사이트 수) 튜플
+        """
+        # Google 검색 수행
+        self.search_engine.search_google(keyword)
 
-        # 모든 키워드에 대해 검색 수행
-        for i, keyword in enumerate(keywords, 1):
-            print(f"\n🔎 [{i}/{len(keywords)}] 검색 키워드: {keyword}")
+        # 최근 다른 검색과 같은 검색 결과면 방문/분류를 건너뜀
+        links = None
+        if self.crawl_state and self.serp_dedup_window > 0:
+            links = self.search_engine.collect_search_result_links(max_links=max_links_per_search)
+            duplicate_of = self.crawl_state.find_duplicate_serp(keyword, links, self.serp_dedup_window)
+            if duplicate_of:
+                print(f"  ♻️ 최근 검색 '{duplicate_of}'와 같은 검색 결과라 건너뜁니다.")
+                return 0, 0
+
+        # 검색 결과 링크의 HTML 수집
+        visited_results = self._collect_search_result_pages(max_links_per_search, links)
+        result_counts = self._classify_and_save(keyword, visited_results, existing_urls)
+
+        # 중단 후 다시 검색할 때 자기 자신과 중복으로 판정되지 않도록 처리를 마친 뒤 기록
+        if links:
+            self.crawl_state.record_serp(keyword, links, self.serp_dedup_window)
+        return result_counts
+
+    def _classify_and_save(self, keyword: str, visited_results: list, existing_urls: set) -> tuple:
+        """
+        방문한 검색 결과 페이지 중 새로운 URL을 분류하고 불법 도박 사이트를 저장합니다
+
+        Returns:
+            (새로운 URL 수, 저장한 불법 도박 사이트 수) 튜플
+        """
+        if not visited_results:
+            print(f"  ⚠️ 방문한 링크 없음 (키워드: {keyword})")
+            return 0, 0
+
+        print(f"  📄 {len(visited_results)}개의 링크 방문 완료")
+
+        new_visited_results, reused_results = self._select_new_pages(keyword, visited_results, existing_urls)
+        if not new_visited_results and not reused_results:
+            return 0, 0
+
+        # Gemini 분류기를 사용하여 불법 사이트만 필터링
+        filtered_urls, classification_results = self._classify_visited_results(new_visited_results, keyword)
+        deferred = [result for result in classification_results or [] if result.get("retryable")]
+        if reused_results:
+            reused_illegal = [result["url"] for result in reused_results if result.get("is_illegal")]
+            filtered_urls = reused_illegal + filtered_urls
+            classification_results = reused_results + (classification_results or [])
+
+        if not filtered_urls:
+            print(f"  ℹ️ 불법 도박 사이트 미발견 (키워드: {keyword})")
+        else:
+            # 불법 사이트로 판별된 URL만 저장 (분류 결과를 URL 순서에 맞춰 전달)
+            if classification_results:
+                results_by_url = {result["url"]: result for result in classification_results}
+                classification_results = [results_by_url[url] for url in filtered_urls]
+            self.storage.save_results(filtered_urls, keyword, classification_results)
+            existing_urls.update(filtered_urls)
+            print(f"  💾 {len(filtered_urls)}개의 불법 도박 사이트 저장 완료 (키워드: {keyword})")
+
+        if deferred:
+            # 서킷 브레이커 등으로 분류하지 못한 페이지가 있으면 키워드를 완료로 기록하지 않음
+            # (분류한 페이지는 저장되었거나 crawl_state에 기록되어 다시 분류하지 않음)
+            raise ClassificationDeferredError(
+                f"{len(deferred)}개 페이지를 분류하지 못했습니다: {deferred[0]['error']}"
+            )
+        return len(new_visited_results) + len(reused_results), len(filtered_urls)
+
+    def _select_new_pages(self, keyword: str, visited_results: list, existing_urls: set) -> tuple:
+        """
+        방문한 페이지 중 저장되지 않은 URL만 고르고, 이전 시도에서 이미 분류한 페이지는 기록된 결과로 대신합니다
+
+        Returns:
+            (분류할 [(url, html_content), ...], 이전 시도의 분류 결과 리스트) 튜플
+        """
+        # 이미 존재하는 URL 제외
+        new_visited_results = [
+            (url, html) for url, html in visited_results 
+            if url not in existing_urls
+        ]
+        if not new_visited_results:
+            print(f"  ℹ️ 새로운 URL 없음 (키워드: {keyword})")
+            return [], []
 
-            # Google 검색 수행
+        print(f"  🆕 {len(new_visited_results)}개의 새로운 URL 발견")
+
+        # 이 키워드의 이전 시도(중단된 실행)에서 이미 분류한 페이지는 기록된 결과 사용
+        processed_results = self.crawl_state.get_processed_results(keyword) if self.crawl_state else {}
+        reused_results = [processed_results[url] for url, _ in new_visited_results if url in processed_results]
+        if reused_results:
+            print(f"  ↪️ 이전 시도에서 분류한 {len(reused_results)}개 페이지는 다시 분류하지 않습니다.")
+            new_visited_results = [
+                (url, html) for url, html in new_visited_results if url not in processed_results
+            ]
+        return new_visited_results, reused_results
+
+    def _can_fetch_separately(self) -> bool:
+        """
+        검색 결과 링크 수집을 검색과 다른 스레드에서 동시에 진행할 수 있는지 여부
+
+        검색용 드라이버와 다른 드라이버(풀)로 링크를 방문할 때만 가능하며,
+        그 외에는 검색 단계에서 링크 방문까지 처리합니다.
+        """
+        if not self.driver_pool:
+            return False
+        if self.fetch_mode == "tiered":
+            return True
+        return self.search_engine.visit_mode == "parallel" and self.driver_pool.size > 1
+
+    def _crawl_pipeline(self, keywords, total, existing_urls: set, max_links_per_search: int) -> None:
+        """
+        검색 → 수집 → 텍스트 추출 → 분류 → 저장 단계를 제한된 크기의 큐로 이어 동시에 진행합니다
+
+        - 검색: 1개 스레드 (브라우저로 검색, 검색 간격은 search_pacer가 조절)
+        - 수집: pipeline_fetch_workers개 스레드 (검색 결과 링크를 HTTP/풀의 드라이버로 가져옴)
+        - 텍스트 추출: pipeline_extract_processes개 프로세스 (HTML 파싱은 CPU 작업이라 프로세스 풀 사용)
+        - 분류: pipeline_classify_workers개 스레드 (Gemini 호출)
+        - 저장: 1개 스레드
+
+        검색 중 오류(CAPTCHA, 브라우저 오류 등)가 나면 새 키워드를 넣지 않고
+        이미 들어간 항목을 모두 처리한 뒤 그 오류를 다시 발생시킵니다.
+        """
+        queue_size = self.settings.get("pipeline_queue_size", 100)
+        extract_processes = self.settings.get("pipeline_extract_processes", 2)
+        classify = self.use_classifier and self.classifier
+        separate_fetch = self._can_fetch_separately()
+
+        # 키워드별 진행 상황 {keyword: {"pending", "new_urls", "detections", "links"}}
+        progress = {}
+        # 저장 여부가 정해지지 않은 URL (여러 키워드의 검색 결과에 같은 URL이 있을 때 한 번만 처리)
+        in_flight_urls = set()
+        lock = threading.Lock()
+        errors = []
+        stop = threading.Event()
+
+        process_pool = None
+        if classify and extract_processes > 0:
+            # 브라우저/스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+            process_pool = ProcessPoolExecutor(
+                max_workers=extract_processes, mp_context=multiprocessing.get_context("spawn")
+            )
+
+        def finish_keyword(keyword: str) -> None:
+            with lock:
+                keyword_progress = progress.pop(keyword, None) or {"new_urls": 0, "detections": 0, "links": None}
+            if keyword_progress["detections"]:
+                print(f"  💾 {keyword_progress['detections']}개의 불법 도박 사이트 저장 완료 (키워드: {keyword})")
+            if keyword_progress.get("errors"):
+                # 저장 등에 실패한 페이지가 있으면 완료로 기록하지 않고 다음에 다시 검색
+                error = f"페이지 {keyword_progress['errors']}개 처리 실패: {keyword_progress['last_error']}"
+                print(f"  ❌ 키워드 처리 실패 ({keyword}): {error}")
+                if self.crawl_state:
+                    self.crawl_state.mark_failed(keyword, error)
+                return
+            if self.crawl_state:
+                if keyword_progress["links"]:
+                    self.crawl_state.record_serp(keyword, keyword_progress["links"], self.serp_dedup_window)
+                self.crawl_state.mark_done(keyword, keyword_progress["new_urls"], keyword_progress["detections"])
+
+        def search(item: dict) -> list:
+            # 검색 간격은 search_pacer가 검색 요청 직전에 맞춤 (기다리는 동안 다른 단계는 계속 진행)
+            keyword = item["keyword"]
+            print(f"\n🔎 [{item['index']}/{total or '?'}] 검색 키워드: {keyword}")
             self.search_engine.search_google(keyword)
 
-            # 검색 결과 링크를 직접 방문하며 HTML 수집
-            visited_results = self.search_engine.visit_search_result_links(max_links=max_links_per_search)
-            
-            # 새로운 URL 필터링 및 분류
-            if visited_results:
-                print(f"  📄 {len(visited_results)}개의 링크 방문 완료")
-                
-                # 이미 존재하는 URL 제외
-                new_visited_results = [
-                    (url, html) for url, html in visited_results 
-                    if url not in existing_urls
-                ]
-                
-                if new_visited_results:
-                    print(f"  🆕 {len(new_visited_results)}개의 새로운 URL 발견")
-                    
-                    # Gemini 분류기를 사용하여 불법 사이트만 필터링
-                    filtered_urls, classification_results = self._classify_visited_results(new_visited_results)
-                    
-                    if filtered_urls:
-                        # 불법 사이트로 판별된 URL만 저장
-                        self.storage.save_results(filtered_urls, keyword, classification_results)
-                        existing_urls.update(filtered_urls)
-                        print(f"  💾 {len(filtered_urls)}개의 불법 도박 사이트 저장 완료 (키워드: {keyword})")
-                    else:
-                        print(f"  ℹ️ 불법 도박 사이트 미발견 (키워드: {keyword})")
+            # 최근 다른 검색과 같은 검색 결과면 방문/분류를 건너뜀
+            if self.crawl_state and self.serp_dedup_window > 0:
+                item["links"] = self.search_engine.collect_search_result_links(max_links=max_links_per_search)
+                duplicate_of = self.crawl_state.find_duplicate_serp(keyword, item["links"], self.serp_dedup_window)
+                if duplicate_of:
+                    print(f"  ♻️ 최근 검색 '{duplicate_of}'와 같은 검색 결과라 건너뜁니다.")
+                    return []
+            elif separate_fetch:
+                item["links"] = self.search_engine.collect_search_result_links(max_links=max_links_per_search)
+
+            return [item] if separate_fetch else fetch(item)
+
+        def fetch(item: dict) -> list:
+            keyword = item["keyword"]
+            visited_results = self._collect_search_result_pages(max_links_per_search, item.get("links"))
+            if not visited_results:
+                print(f"  ⚠️ 방문한 링크 없음 (키워드: {keyword})")
+                return []
+
+            with lock:
+                skipped = existing_urls | in_flight_urls
+            new_visited_results, reused_results = self._select_new_pages(keyword, visited_results, skipped)
+            pages = [{"keyword": keyword, "url": url, "html": html} for url, html in new_visited_results]
+            pages += [{"keyword": keyword, "url": result["url"], "result": result} for result in reused_results]
+
+            with lock:
+                pages = [page for page in pages if page["url"] not in in_flight_urls]
+                in_flight_urls.update(page["url"] for page in pages)
+                progress[keyword] = {
+                    "pending": len(pages), "new_urls": len(pages), "detections": 0, "links": item.get("links"),
+                    "errors": 0, "last_error": None
+                }
+            return pages
+
+        def extract(page: dict) -> list:
+            if not classify or "result" in page:
+                return [page]
+            html_content = page.pop("html")
+            if not html_content:
+                print(f"  ⏭️ 건너뛰기 {page['url']} - HTML 콘텐츠 없음")
+                return []
+            try:
+                if process_pool is None:
+                    raise RuntimeError("프로세스 풀 없음")
+                with TEXT_EXTRACTION_SECONDS.time():
+                    page["text"] = process_pool.submit(
+                        extract_text, html_content, self.classifier.max_text_chars, self.classifier.keep_blocks
+                    ).result()
+            except Exception:
+                # 프로세스 풀을 쓸 수 없거나 파싱에 실패하면 이 스레드에서 추출 (실패 시 원본 사용)
+                page["text"] = self.classifier.prepare_text(html_content)
+            return [page]
+
+        def classify_page(page: dict) -> list:
+            if not classify or "result" in page:
+                return [page]
+            url = page["url"]
+            print(f"  🔍 분류 중: {url}")
+            result = self.classifier.classify_text(url, page.pop("text"))
+            if url in self.fetch_tiers:
+                result["fetch_tier"] = self.fetch_tiers[url]
+            page["result"] = result
+
+            if result.get("error") is None:
+                # 중단 후 다시 검색할 때 재분류하지 않도록 결과 기록
+                if self.crawl_state:
+                    self.crawl_state.record_result(page["keyword"], result)
+                if result.get("is_illegal"):
+                    DETECTIONS.inc()
+                    print(f"  ✅ 불법 사이트 탐지: {url} (신뢰도: {result.get('confidence', 0):.2f})")
                 else:
-                    print(f"  ℹ️ 새로운 URL 없음 (키워드: {keyword})")
+                    print(f"  ❌ 불법 도박 사이트 아님: {url}")
             else:
-                print(f"  ⚠️ 방문한 링크 없음 (키워드: {keyword})")
+                print(f"  ⚠️ 분류 오류 {url}: {result.get('error')}")
+                if result.get("retryable"):
+                    # 키워드를 완료로 기록하지 않도록 오류로 끝냄 (item_done에서 키워드 실패로 집계)
+                    raise ClassificationDeferredError(result["error"])
+            return [page]
+
+        def store(page: dict) -> list:
+            result = page.get("result")
+            # 분류기가 없으면 모든 URL 저장
+            if result is None or (result.get("error") is None and result.get("is_illegal")):
+                self.storage.save_results([page["url"]], page["keyword"], [result] if result else None)
+                page["saved"] = True
+            return []
+
+        def item_done(item: dict, error) -> None:
+            keyword = item["keyword"]
+            if "url" not in item:
+                # 검색/수집 단계에서 끝난 키워드 (결과 페이지 없음 또는 오류)
+                if error is None:
+                    finish_keyword(keyword)
+                return
+
+            with lock:
+                in_flight_urls.discard(item["url"])
+                if item.get("saved"):
+                    existing_urls.add(item["url"])
+                keyword_progress = progress[keyword]
+                keyword_progress["pending"] -= 1
+                if item.get("saved"):
+                    keyword_progress["detections"] += 1
+                if error is not None:
+                    keyword_progress["errors"] += 1
+                    keyword_progress["last_error"] = str(error)
+                finished = keyword_progress["pending"] == 0
+            if finished:
+                finish_keyword(keyword)
 
-            # 다음 검색 전 대기
-            if i < len(keywords):
-                print(f"  ⏳ 다음 검색까지 {delay}초 대기 중...")
-                time.sleep(delay)
+        def search_failed(item: dict, error: Exception) -> None:
+            # 브라우저 오류 등: 새 키워드를 넣지 않고 남은 항목을 처리한 뒤 종료
+            print(f"  ❌ 검색 실패 ({item['keyword']}): {error}")
+            if self.crawl_state:
+                self.crawl_state.mark_failed(item["keyword"], str(error))
+            if isinstance(error, SearchBlockedError) and self._can_continue_after_block(error):
+                return
+            errors.append(error)
+            stop.set()
+
+        def store_failed(item: dict, error: Exception) -> None:
+            # 저장소 오류 지표는 저장소에서 기록하므로 여기서는 키워드 실패로만 처리 (item_done에서 집계)
+            print(f"  ❌ 저장 실패 ({item['url']}): {error}")
+
+        pipeline = Pipeline(on_item_done=item_done, report_interval=self.settings.get("pipeline_report_interval", 30))
+        # 검색 큐를 작게 두어 스케줄러가 최신 성과로 다음 검색어를 고르도록 함
+        pipeline.add_stage("search", search, workers=1, queue_size=1, on_error=search_failed)
+        if separate_fetch:
+            pipeline.add_stage("fetch", fetch, workers=self.settings.get("pipeline_fetch_workers", 2),
+                               queue_size=queue_size, on_error=search_failed)
+        pipeline.add_stage("extract", extract, workers=max(1, extract_processes), queue_size=queue_size)
+        classify_workers = self.settings.get("pipeline_classify_workers", self.settings.get("gemini_max_workers", 4))
+        pipeline.add_stage("classify", classify_page, workers=classify_workers, queue_size=queue_size)
+        pipeline.add_stage("store", store, workers=1, queue_size=queue_size, on_error=store_failed)
+        pipeline.start()
+
+        try:
+            for i, keyword in enumerate(keywords, 1):
+                if stop.is_set():
+                    break
+                if self.crawl_state:
+                    self.crawl_state.mark_started(keyword)
+                pipeline.put({"keyword": keyword, "index": i})
+        finally:
+            pipeline.close()
+            if process_pool:
+                process_pool.shutdown()
 
-        # 브라우저 종료 및 결과 출력
-        self.search_engine.close()
-        self._print_final_stats()
+        if errors:
+            raise errors[0]
 
     def _print_final_stats(self):
         stats = self.storage.get_stats()
@@ -197,5 +810,50 @@ class GamblingDomainCrawler:
         print(f"📁 총 항목 수: {stats['total_entries']}")
         print(f"🔗 고유 URL 수: {stats['unique_urls']}")
         print(f"🔤 사용된 키워드 수: {stats['keywords_used']}")
-        print(f"💾 출력 파일: {self.settings.get('output_file', 'results.json')}")
+        print(f"💾 저장 위치: {self.storage.describe()}")
+        if self.classifier:
+            classifier_stats = self.classifier.get_stats()
+            if self.classifier.cache:
+                print(f"🗃️ 분류 캐시: 적중 {classifier_stats['cache_hits']}회, 미적중 {classifier_stats['cache_misses']}회")
+            if self.classifier.near_duplicate_index:
+                print(f"🧬 유사 페이지 판정 상속: {classifier_stats['near_duplicate_hits']}회")
+            if self.classifier.prefilter:
+                print(f"🔤 사전 필터 판정: 불법 {classifier_stats['prefilter_illegal']}회, "
+                      f"합법 {classifier_stats['prefilter_legal']}회")
+            if self.classifier.local_model:
+                print(f"🧠 로컬 모델 판정: 불법 {classifier_stats['local_model_illegal']}회, "
+                      f"합법 {classifier_stats['local_model_legal']}회")
+            print(f"🤖 Gemini 호출: {classifier_stats['gemini_calls']}회")
+            if self.classifier.training_samples:
+                sample_stats = self.classifier.training_samples.get_stats()
+                print(f"🧪 로컬 모델 학습 표본: {sample_stats['entries']}개 "
+                      f"(불법 {sample_stats['illegal']}개, 합법 {sample_stats['legal']}개)")
+            if self.classifier.content_selector:
+                selector_stats = self.classifier.content_selector.get_stats()
+                if selector_stats["selections"]:
+                    print(f"✂️ 프롬프트 본문: 평균 {selector_stats['input_chars'] / selector_stats['selections']:.0f}자 → "
+                          f"{selector_stats['output_chars'] / selector_stats['selections']:.0f}자 "
+                          f"({selector_stats['trimmed']}/{selector_stats['selections']}개 페이지 선택 적용)")
+        if self.crawl_state:
+            status_counts = self.crawl_state.get_status_counts()
+            print(f"🗂️ 키워드 상태: 완료 {status_counts.get('done', 0)}개, 대기 {status_counts.get('pending', 0)}개, "
+                  f"실패 {status_counts.get('failed', 0)}개")
+        if self.keyword_scheduler:
+            scheduler_stats = self.keyword_scheduler.stats
+            print(f"🧭 검색어 선택: 탐색 {scheduler_stats['explored']}회, 성과 기반 {scheduler_stats['exploited']}회, "
+                  f"재개 {scheduler_stats['resumed']}회")
+        if self.fetch_mode == "tiered":
+            tier_counts = self.tiered_fetcher.get_tier_counts()
+            print(f"🌐 수집 단계: HTTP {tier_counts['http']}개, 브라우저 {tier_counts['browser']}개")
+        pacer_stats = self.search_pacer.get_stats()
+        if pacer_stats["requests"]:
+            print(f"🚦 검색 간격: 현재 {pacer_stats['interval']:.1f}초, 대기 합계 {pacer_stats['waited_seconds']:.0f}초, "
+                  f"CAPTCHA/차단 {pacer_stats['blocks']}회 (검색 요청 {pacer_stats['requests']}회)")
+        if self.render_profile:
+            render_stats = self.render_profile.get_stats()
+            if render_stats["visits"]:
+                print(f"🪶 브라우저 전송량: 페이지당 {render_stats['transferred_bytes'] / render_stats['visits'] / 1024:.0f}KB, "
+                      f"차단 요청 {render_stats['blocked_requests']}개, "
+                      f"페이지당 약 {render_stats['bytes_saved_per_page'] / 1024:.0f}KB 절약 "
+                      f"(표본 {render_stats['sampled_visits']}개 기준)")
         print("="*50)
@@ -1,14 +1,50 @@
 import psycopg2
 from psycopg2.extras import Json
-from typing import List, Dict, Any, Optional
+from psycopg2.pool import ThreadedConnectionPool
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dotenv import load_dotenv
+from contextlib import contextmanager
+import io
+import json
 import os
+import time
 from datetime import datetime
 
+
+# 조회 결과로 돌려주는 gambling_urls 컬럼 (순서대로)
+URL_COLUMNS = (
+    "id", "url", "keyword_used", "collected_at", "is_illegal",
+    "gemini_confidence", "gemini_reason", "detected_keywords", "cluster_id"
+)
+
+# 일괄 적재 시 COPY로 옮기는 gambling_urls 컬럼 (순서대로)
+BULK_COLUMNS = (
+    "url", "keyword_used", "collected_at", "is_illegal", "gemini_confidence",
+    "gemini_reason", "gemini_error", "detected_keywords", "cluster_id", "classification_source"
+)
+
+
+def _copy_text_value(value: Any) -> str:
+    """COPY text 형식의 필드 값으로 변환 (None은 NULL)"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
 class DatabaseManager:
-    """Supabase PostgreSQL 데이터베이스 연결 및 관리 클래스"""
+    """
+    Supabase PostgreSQL 데이터베이스 연결 및 관리 클래스
+
+    ThreadedConnectionPool로 연결을 관리하므로 여러 작업 스레드에서 같은 인스턴스를 사용해도 됩니다.
+    (각 메서드는 호출마다 풀에서 연결을 빌려 쓰고 돌려줌)
+    """
     
-    def __init__(self):
+    def __init__(self, min_connections: int = 1, max_connections: int = 10):
         # .env 파일에서 환경 변수 로드
         load_dotenv()
         
@@ -20,22 +56,46 @@ class DatabaseManager:
             "dbname": os.getenv("DB_NAME")
         }
         
-        self.connection = None
-        self.cursor = None
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.pool = None
     
     def connect(self):
-        """데이터베이스 연결"""
-        self.connection = psycopg2.connect(**self.connection_params)
-        self.cursor = self.connection.cursor()
+        """데이터베이스 연결 풀 생성"""
+        self.pool = ThreadedConnectionPool(self.min_connections, self.max_connections, **self.connection_params)
         print(f"✅ 데이터베이스 연결 성공: {self.connection_params['host']}")
     
     def disconnect(self):
-        """데이터베이스 연결 종료"""
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.close()
+        """데이터베이스 연결 풀 종료"""
+        if self.pool:
+            self.pool.closeall()
+            self.pool = None
         print("✅ 데이터베이스 연결 종료")
+
+    @contextmanager
+    def get_connection(self):
+        """
+        풀에서 연결을 빌려 사용 후 돌려줍니다
+
+        블록이 정상 종료되면 커밋, 예외가 나면 롤백합니다.
+
+        사용 예:
+            with db.get_connection() as connection, connection.cursor() as cursor:
+                cursor.execute(...)
+        """
+        if self.pool is None:
+            raise RuntimeError("데이터베이스에 연결되지 않았습니다. connect()를 먼저 호출하세요.")
+
+        connection = self.pool.getconn()
+        try:
+            yield connection
+            connection.commit()
+        except BaseException:
+            # 제너레이터를 끝까지 읽지 않고 닫은 경우(GeneratorExit)도 롤백
+            connection.rollback()
+            raise
+        finally:
+            self.pool.putconn(connection)
     
     def create_tables(self):
         """results.json 데이터를 저장할 테이블 생성"""
@@ -52,11 +112,23 @@ class DatabaseManager:
             gemini_reason TEXT,
             gemini_error TEXT,
             detected_keywords JSONB,
+            cluster_id TEXT,
+            classification_source TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
         """
         
+        # 기존 테이블에 유사 페이지 클러스터 ID 컬럼 추가
+        add_cluster_column = """
+        ALTER TABLE gambling_urls ADD COLUMN IF NOT EXISTS cluster_id TEXT;
+        """
+
+        # 기존 테이블에 판정 경로 컬럼 추가 (로컬 모델 학습 데이터 선별용)
+        add_source_column = """
+        ALTER TABLE gambling_urls ADD COLUMN IF NOT EXISTS classification_source TEXT;
+        """
+        
         # URL에 대한 인덱스 생성 (검색 성능 향상)
         create_index_url = """
         CREATE INDEX IF NOT EXISTS idx_gambling_urls_url 
@@ -75,12 +147,24 @@ class DatabaseManager:
         ON gambling_urls(collected_at DESC);
         """
         
+        # (collected_at, id) 복합 인덱스 (키셋 페이지네이션 조회)
+        create_index_collected_id = """
+        CREATE INDEX IF NOT EXISTS idx_gambling_urls_collected_at_id 
+        ON gambling_urls(collected_at, id);
+        """
+        
         # detected_keywords JSONB 필드에 대한 GIN 인덱스 생성 (키워드 검색 성능 향상)
         create_index_keywords = """
         CREATE INDEX IF NOT EXISTS idx_gambling_urls_detected_keywords 
         ON gambling_urls USING GIN(detected_keywords);
         """
         
+        # cluster_id 필드에 대한 인덱스 생성 (같은 클러스터의 미러 사이트 조회)
+        create_index_cluster = """
+        CREATE INDEX IF NOT EXISTS idx_gambling_urls_cluster_id 
+        ON gambling_urls(cluster_id);
+        """
+        
         # updated_at 자동 업데이트 트리거 함수 생성
         create_trigger_function = """
         CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -101,14 +185,18 @@ class DatabaseManager:
             EXECUTE FUNCTION update_updated_at_column();
         """
         
-        self.cursor.execute(create_table_query)
-        self.cursor.execute(create_index_url)
-        self.cursor.execute(create_index_illegal)
-        self.cursor.execute(create_index_collected)
-        self.cursor.execute(create_index_keywords)
-        self.cursor.execute(create_trigger_function)
-        self.cursor.execute(create_trigger)
-        self.connection.commit()
+        with self.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(create_table_query)
+            cursor.execute(add_cluster_column)
+            cursor.execute(add_source_column)
+            cursor.execute(create_index_url)
+            cursor.execute(create_index_illegal)
+            cursor.execute(create_index_collected)
+            cursor.execute(create_index_collected_id)
+            cursor.execute(create_index_keywords)
+            cursor.execute(create_index_cluster)
+            cursor.execute(create_trigger_function)
+            cursor.execute(create_trigger)
         
         print("✅ 테이블 및 인덱스 생성 완료: gambling_urls")
     
@@ -118,8 +206,9 @@ class DatabaseManager:
         insert_query = """
         INSERT INTO gambling_urls (
             url, keyword_used, collected_at, is_illegal, 
-            gemini_confidence, gemini_reason, gemini_error, detected_keywords
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            gemini_confidence, gemini_reason, gemini_error, detected_keywords, cluster_id,
+            classification_source
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         ON CONFLICT (url) DO UPDATE SET
             keyword_used = EXCLUDED.keyword_used,
             collected_at = EXCLUDED.collected_at,
@@ -128,6 +217,8 @@ class DatabaseManager:
             gemini_reason = EXCLUDED.gemini_reason,
             gemini_error = EXCLUDED.gemini_error,
             detected_keywords = EXCLUDED.detected_keywords,
+            cluster_id = EXCLUDED.cluster_id,
+            classification_source = EXCLUDED.classification_source,
             updated_at = CURRENT_TIMESTAMP;
         """
         
@@ -136,7 +227,110 @@ class DatabaseManager:
         if isinstance(collected_at, str):
             collected_at = datetime.fromisoformat(collected_at)
         
-        self.cursor.execute(insert_query, (
+        with self.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(insert_query, (
+                url_data.get("url"),
+                url_data.get("keyword_used"),
+                collected_at,
+                url_data.get("is_illegal"),
+                url_data.get("gemini_confidence"),
+                url_data.get("gemini_reason"),
+                url_data.get("gemini_error"),
+                Json(url_data.get("detected_keywords", [])),
+                url_data.get("cluster_id"),
+                url_data.get("classification_source")
+            ))
+        return True
+    
+    def insert_bulk_url_data(self, url_data_list: List[Dict[str, Any]], chunk_size: int = 5000) -> int:
+        """여러 URL 데이터 일괄 삽입 (bulk_upsert_url_data 참고)"""
+        return self.bulk_upsert_url_data(url_data_list, chunk_size=chunk_size)["upserted"]
+
+    def bulk_upsert_url_data(self, url_data_list: List[Dict[str, Any]], chunk_size: int = 5000) -> Dict[str, Any]:
+        """
+        여러 URL 데이터를 COPY로 임시 테이블에 적재한 뒤 한 번의 INSERT ... ON CONFLICT로 반영합니다
+
+        chunk_size 행마다 커밋하며, 청크 안에 잘못된 행이 있으면 SAVEPOINT로 되돌린 뒤
+        청크를 반으로 나눠 다시 적재하는 방식으로 잘못된 행만 골라내고 나머지는 모두 반영합니다.
+
+        Returns:
+            {"rows": 입력 행 수, "upserted": 반영된 행 수, "failed": 실패한 행 수,
+             "bad_rows": [(url, 오류 메시지), ...], "rejected": [반영하지 못한 입력 항목, ...],
+             "elapsed": 소요 시간(초), "rows_per_sec": 초당 처리 행 수}
+        """
+        started = time.perf_counter()
+        bad_rows: List[Tuple[Optional[str], str]] = []
+        rejected: List[Any] = []
+        upserted = 0
+
+        # 임시 테이블은 세션(연결)별이므로 전체 적재 동안 같은 연결 사용
+        with self.get_connection() as connection, connection.cursor() as cursor:
+            self._create_staging_table(cursor)
+
+            for start in range(0, len(url_data_list), chunk_size):
+                records = []
+                # 레코드 → 입력 항목 (DB가 거부한 레코드를 원래 항목으로 돌려주기 위함)
+                sources = {}
+                for url_data in url_data_list[start:start + chunk_size]:
+                    try:
+                        record = self._bulk_record(url_data)
+                    except (ValueError, TypeError, AttributeError) as e:
+                        bad_rows.append((url_data.get("url") if isinstance(url_data, dict) else None, str(e)))
+                        rejected.append(url_data)
+                        continue
+                    records.append(record)
+                    sources[id(record)] = url_data
+
+                rejected_records: List[Tuple[Any, ...]] = []
+                upserted += self._upsert_records(cursor, records, bad_rows, rejected_records)
+                connection.commit()
+                rejected.extend(sources[id(record)] for record in rejected_records)
+
+        elapsed = time.perf_counter() - started
+        rows_per_sec = len(url_data_list) / elapsed if elapsed > 0 else 0.0
+        print(f"  📥 {upserted}/{len(url_data_list)}행 반영 ({elapsed:.2f}초, {rows_per_sec:,.0f} rows/sec)")
+        for url, error in bad_rows[:10]:
+            print(f"  ❌ URL 삽입 실패 ({url}): {error}")
+        if len(bad_rows) > 10:
+            print(f"  ❌ ... 외 {len(bad_rows) - 10}행 실패")
+
+        return {
+            "rows": len(url_data_list),
+            "upserted": upserted,
+            "failed": len(bad_rows),
+            "bad_rows": bad_rows,
+            "rejected": rejected,
+            "elapsed": elapsed,
+            "rows_per_sec": rows_per_sec
+        }
+
+    @staticmethod
+    def _create_staging_table(cursor) -> None:
+        """일괄 적재용 임시 테이블 (세션 종료 시 자동 삭제, 커밋마다 비워짐)"""
+        cursor.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS gambling_urls_staging (
+            row_no BIGINT NOT NULL,
+            url TEXT,
+            keyword_used TEXT,
+            collected_at TIMESTAMP,
+            is_illegal BOOLEAN,
+            gemini_confidence NUMERIC(3, 2),
+            gemini_reason TEXT,
+            gemini_error TEXT,
+            detected_keywords JSONB,
+            cluster_id TEXT,
+            classification_source TEXT
+        ) ON COMMIT DELETE ROWS;
+        """)
+
+    @staticmethod
+    def _bulk_record(url_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """URL 데이터를 BULK_COLUMNS 순서의 튜플로 변환 (collected_at 형식 오류 등은 ValueError)"""
+        collected_at = url_data.get("collected_at")
+        if isinstance(collected_at, str):
+            collected_at = datetime.fromisoformat(collected_at)
+
+        return (
             url_data.get("url"),
             url_data.get("keyword_used"),
             collected_at,
@@ -144,54 +338,209 @@ class DatabaseManager:
             url_data.get("gemini_confidence"),
             url_data.get("gemini_reason"),
             url_data.get("gemini_error"),
-            Json(url_data.get("detected_keywords", []))
-        ))
-        
-        self.connection.commit()
-        return True
-    
-    def insert_bulk_url_data(self, url_data_list: List[Dict[str, Any]]) -> int:
-        """여러 URL 데이터 일괄 삽입"""
-        inserted_count = 0
-        
-        for url_data in url_data_list:
-            try:
-                self.insert_url_data(url_data)
-                inserted_count += 1
-            except Exception as e:
-                print(f"❌ URL 삽입 실패 ({url_data.get('url')}): {e}")
-                self.connection.rollback()
+            json.dumps(url_data.get("detected_keywords", []), ensure_ascii=False),
+            url_data.get("cluster_id"),
+            url_data.get("classification_source")
+        )
+
+    def _upsert_records(self, cursor, records: List[Tuple[Any, ...]],
+                        bad_rows: List[Tuple[Optional[str], str]],
+                        rejected_records: Optional[List[Tuple[Any, ...]]] = None) -> int:
+        """
+        레코드를 SAVEPOINT 안에서 적재하고, 실패하면 반으로 나눠 다시 시도합니다
+        (끝까지 실패한 레코드는 bad_rows와 rejected_records에 추가)
+
+        Returns:
+            반영된 행 수
+        """
+        if not records:
+            return 0
+
+        cursor.execute("SAVEPOINT bulk_upsert")
+        try:
+            self._copy_to_staging(cursor, records)
+            upserted = self._merge_staging(cursor)
+            cursor.execute("TRUNCATE gambling_urls_staging")
+            cursor.execute("RELEASE SAVEPOINT bulk_upsert")
+            return upserted
+        except psycopg2.Error as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT bulk_upsert")
+            cursor.execute("RELEASE SAVEPOINT bulk_upsert")
+            if len(records) == 1:
+                bad_rows.append((records[0][0], str(e).strip()))
+                if rejected_records is not None:
+                    rejected_records.append(records[0])
+                return 0
+
+        middle = len(records) // 2
+        return (self._upsert_records(cursor, records[:middle], bad_rows, rejected_records) +
+                self._upsert_records(cursor, records[middle:], bad_rows, rejected_records))
+
+    @staticmethod
+    def _copy_to_staging(cursor, records: List[Tuple[Any, ...]]) -> None:
+        buffer = io.StringIO()
+        for row_no, record in enumerate(records):
+            buffer.write(str(row_no))
+            for value in record:
+                buffer.write("\t")
+                buffer.write(_copy_text_value(value))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        columns = ", ".join(("row_no",) + BULK_COLUMNS)
+        cursor.copy_expert(f"COPY gambling_urls_staging ({columns}) FROM STDIN", buffer)
+
+    @staticmethod
+    def _merge_staging(cursor) -> int:
+        """임시 테이블의 행을 gambling_urls에 반영 (같은 URL이 여러 번 있으면 마지막 행 사용)"""
+        columns = ", ".join(BULK_COLUMNS)
+        cursor.execute(f"""
+        INSERT INTO gambling_urls ({columns})
+        SELECT DISTINCT ON (url) {columns}
+        FROM gambling_urls_staging
+        ORDER BY url, row_no DESC
+        ON CONFLICT (url) DO UPDATE SET
+            keyword_used = EXCLUDED.keyword_used,
+            collected_at = EXCLUDED.collected_at,
+            is_illegal = EXCLUDED.is_illegal,
+            gemini_confidence = EXCLUDED.gemini_confidence,
+            gemini_reason = EXCLUDED.gemini_reason,
+            gemini_error = EXCLUDED.gemini_error,
+            detected_keywords = EXCLUDED.detected_keywords,
+            cluster_id = EXCLUDED.cluster_id,
+            classification_source = EXCLUDED.classification_source,
+            updated_at = CURRENT_TIMESTAMP;
+        """)
+        return cursor.rowcount
+
+    def get_illegal_urls(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """불법 도박 사이트 URL 조회 (최근 수집 순)"""
+        query = f"""
+        SELECT {", ".join(URL_COLUMNS)}
+        FROM gambling_urls
+        WHERE is_illegal = TRUE
+        ORDER BY collected_at DESC, id DESC
+        LIMIT %s
+        """
         
-        return inserted_count
+        # LIMIT NULL은 제한 없음
+        with self.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(query, (int(limit) if limit else None,))
+            return [dict(zip(URL_COLUMNS, row)) for row in cursor.fetchall()]
+
+    def iter_urls(self, illegal_only: bool = False, descending: bool = False,
+                  page_size: int = 10000, fetch_size: int = 1000,
+                  limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        gambling_urls 행을 (collected_at, id) 순서로 하나씩 읽는 제너레이터
+
+        (collected_at, id) 키셋 페이지네이션으로 page_size 행씩 나눠 조회하고,
+        각 페이지는 서버 측 커서(named cursor)로 fetch_size 행씩 가져오므로
+        수백만 행을 내보내도 메모리 사용량이 일정합니다.
+        페이지마다 짧은 트랜잭션을 쓰므로 오래 걸리는 내보내기도 연결/스냅샷을 오래 붙잡지 않습니다.
+
+        Args:
+            illegal_only: True면 불법으로 판별된 행만
+            descending: True면 최근 수집 순
+            page_size: 한 페이지(트랜잭션)에서 읽을 최대 행 수
+            fetch_size: 서버 측 커서에서 한 번에 가져올 행 수
+            limit: 최대 행 수 (None이면 전체)
+
+        Yields:
+            URL_COLUMNS 키를 가진 행 딕셔너리
+        """
+        comparison, order = ("<", "DESC") if descending else (">", "ASC")
+        columns = ", ".join(URL_COLUMNS)
+        conditions = ["is_illegal = TRUE"] if illegal_only else []
+        first_page_query = f"""
+        SELECT {columns}
+        FROM gambling_urls
+        {"WHERE " + " AND ".join(conditions) if conditions else ""}
+        ORDER BY collected_at {order}, id {order}
+        LIMIT %s
+        """
+        # 다음 페이지는 이전 페이지 마지막 행의 (collected_at, id) 이후부터
+        next_page_query = f"""
+        SELECT {columns}
+        FROM gambling_urls
+        WHERE {" AND ".join(conditions + [f"(collected_at, id) {comparison} (%s, %s)"])}
+        ORDER BY collected_at {order}, id {order}
+        LIMIT %s
+        """
+
+        remaining = limit
+        last_key = None
+        page_number = 0
+        while remaining is None or remaining > 0:
+            current_page_size = page_size if remaining is None else min(page_size, remaining)
+            page_number += 1
+            rows_in_page = 0
+
+            with self.get_connection() as connection:
+                with connection.cursor(name=f"iter_urls_{id(self)}_{page_number}") as cursor:
+                    cursor.itersize = fetch_size
+                    if last_key is None:
+                        cursor.execute(first_page_query, (current_page_size,))
+                    else:
+                        cursor.execute(next_page_query, (*last_key, current_page_size))
+                    for row in cursor:
+                        rows_in_page += 1
+                        last_key = (row[3], row[0])
+                        yield dict(zip(URL_COLUMNS, row))
+
+            if remaining is not None:
+                remaining -= rows_in_page
+            if rows_in_page < current_page_size:
+                break
     
-    def get_illegal_urls(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """불법 도박 사이트 URL 조회"""
+    def get_labelled_urls(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        로컬 분류 모델 학습용 Gemini 판정 결과 조회 (분류 오류가 없는 행만)
+
+        사전 필터/로컬 모델/유사 페이지 상속 판정으로 학습하면 모델이 자기 판정을 다시 배우므로
+        classification_source가 gemini인 행만 사용합니다 (판정 경로를 기록하기 전에 저장된 NULL 행도 포함).
+        """
         query = """
-        SELECT url, keyword_used, collected_at, is_illegal, 
-               gemini_confidence, gemini_reason, detected_keywords
+        SELECT url, is_illegal, gemini_confidence, detected_keywords
         FROM gambling_urls
-        WHERE is_illegal = TRUE
+        WHERE gemini_error IS NULL AND (classification_source IS NULL OR classification_source = 'gemini')
         ORDER BY collected_at DESC
+        LIMIT %s
         """
         
-        if limit:
-            query += f" LIMIT {limit}"
-        
-        self.cursor.execute(query)
+        with self.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(query, (int(limit) if limit else None,))
+            rows = cursor.fetchall()
         
-        results = []
-        for row in self.cursor.fetchall():
-            results.append({
+        return [
+            {
                 "url": row[0],
-                "keyword_used": row[1],
-                "collected_at": row[2],
-                "is_illegal": row[3],
-                "gemini_confidence": row[4],
-                "gemini_reason": row[5],
-                "detected_keywords": row[6]
-            })
-        
-        return results
+                "is_illegal": row[1],
+                "gemini_confidence": float(row[2]) if row[2] is not None else None,
+                "detected_keywords": row[3]
+            }
+            for row in rows
+        ]
+    
+    def get_all_urls(self, fetch_size: int = 10000) -> set:
+        """저장된 모든 URL 집합 (서버 측 커서로 fetch_size 행씩 읽음)"""
+        with self.get_connection() as connection:
+            with connection.cursor(name=f"all_urls_{id(self)}") as cursor:
+                cursor.itersize = fetch_size
+                cursor.execute("SELECT url FROM gambling_urls")
+                return {row[0] for row in cursor}
+
+    def count_existing_urls(self, urls) -> int:
+        """주어진 URL 중 테이블에 있는 URL 수"""
+        with self.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM gambling_urls WHERE url = ANY(%s)", (list(urls),))
+            return cursor.fetchone()[0]
+
+    def get_keywords_used(self) -> List[str]:
+        """저장된 행에 사용된 검색 키워드 목록"""
+        with self.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute("SELECT DISTINCT keyword_used FROM gambling_urls")
+            return [row[0] for row in cursor.fetchall()]
     
     def get_statistics(self) -> Dict[str, Any]:
         """데이터베이스 통계 조회"""
@@ -206,8 +555,9 @@ class DatabaseManager:
         FROM gambling_urls;
         """
         
-        self.cursor.execute(stats_query)
-        row = self.cursor.fetchone()
+        with self.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(stats_query)
+            row = cursor.fetchone()
         
         return {
             "total_urls": row[0],
@@ -219,31 +569,29 @@ class DatabaseManager:
         }
 
 
-def import_from_json(json_file_path: str, delete_after_import: bool = True):
+def import_from_json(json_file_path: str, delete_after_import: bool = True, batch_size: int = 5000):
     """
-    results.json 파일의 데이터를 데이터베이스에 임포트
+    results.json / results.jsonl 파일의 데이터를 데이터베이스에 임포트
+    
+    파일 전체를 메모리에 올리지 않고 batch_size개씩 읽어 반영하며,
+    중단된 경우 다시 실행하면 마지막으로 커밋된 위치부터 이어서 가져옵니다 (result_importer 참고).
     
     Args:
-        json_file_path: JSON 파일 경로
-        delete_after_import: 임포트 성공 후 JSON 파일 삭제 여부 (기본값: True)
+        json_file_path: JSON 배열 또는 JSONL 파일 경로
+        delete_after_import: 모든 행의 반영이 확인된 후 파일 삭제 여부 (기본값: True)
+        batch_size: 한 번에 반영할 행 수
     """
-    import json
+    from .result_importer import import_results_file
     
     # JSON 파일 존재 확인
     if not os.path.exists(json_file_path):
         print(f"⚠️ 파일이 존재하지 않습니다: {json_file_path}")
         return
     
-    # JSON 파일 읽기
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        url_data_list = json.load(f)
-    
-    if not url_data_list:
+    if os.path.getsize(json_file_path) == 0:
         print(f"⚠️ 파일이 비어있습니다: {json_file_path}")
         return
     
-    print(f"📄 {len(url_data_list)}개의 URL 데이터를 읽었습니다.")
-    
     # 데이터베이스에 삽입
     db = DatabaseManager()
     db.connect()
@@ -252,8 +600,8 @@ def import_from_json(json_file_path: str, delete_after_import: bool = True):
     db.create_tables()
     
     # 데이터 삽입
-    inserted_count = db.insert_bulk_url_data(url_data_list)
-    print(f"✅ {inserted_count}개의 URL 데이터를 데이터베이스에 저장했습니다.")
+    result = import_results_file(json_file_path, db, batch_size=batch_size,
+                                 delete_after_import=delete_after_import)
     
     # 통계 출력
     stats = db.get_statistics()
@@ -265,14 +613,12 @@ def import_from_json(json_file_path: str, delete_after_import: bool = True):
     
     db.disconnect()
     
-    # 임포트 성공 후 JSON 파일 삭제
-    if delete_after_import and inserted_count > 0:
-        os.remove(json_file_path)
+    if result["deleted"]:
         print(f"\n🗑️ JSON 파일 삭제 완료: {json_file_path}")
-        print("   (다음 크롤링 시 새로운 results.json이 생성됩니다)")
+        print(f"   (다음 크롤링 시 새로운 {os.path.basename(json_file_path)}이 생성됩니다)")
 
 
 if __name__ == "__main__":
-    # 테스트: results.json 데이터 임포트
-    import_from_json("results.json")
+    # 테스트: 수집 결과 데이터 임포트 (기존 results.json이 남아 있으면 그 파일)
+    import_from_json("results.jsonl" if os.path.exists("results.jsonl") else "results.json")
 
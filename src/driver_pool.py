@@ -0,0 +1,356 @@
+import json
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+# User-Agent 후보 목록 (드라이버 생성 시 랜덤 선택)
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+]
+
+_driver_path_lock = threading.Lock()
+_resolved_driver_path = None
+
+
+def resolve_chromedriver_path(cache_file: str = ".chromedriver_path.json") -> str:
+    """
+    ChromeDriver 경로를 한 번만 확인하고 캐시합니다.
+
+    캐시 파일에 기록된 경로가 아직 존재하면 네트워크 접근 없이 그대로 사용하고,
+    없을 때만 ChromeDriverManager로 설치한 뒤 경로를 캐시 파일에 저장합니다.
+
+    Args:
+        cache_file: ChromeDriver 경로를 저장할 캐시 파일
+
+    Returns:
+        chromedriver 실행 파일 경로
+    """
+    global _resolved_driver_path
+
+    with _driver_path_lock:
+        if _resolved_driver_path and os.path.exists(_resolved_driver_path):
+            return _resolved_driver_path
+
+        # 캐시 파일에서 경로 로드 (오프라인 재사용)
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached_path = json.load(f).get("driver_path")
+            if cached_path and os.path.exists(cached_path):
+                _resolved_driver_path = cached_path
+                return cached_path
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+        # 캐시가 없거나 경로가 사라졌으면 새로 설치
+        driver_path = ChromeDriverManager().install()
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({"driver_path": driver_path, "resolved_at": time.time()}, f)
+        except OSError as e:
+            print(f"⚠️ ChromeDriver 경로 캐시 저장 실패: {e}")
+
+        _resolved_driver_path = driver_path
+        return driver_path
+
+
+def create_chrome_driver(headless: bool = True, driver_cache_file: str = ".chromedriver_path.json",
+                         render_profile=None):
+    """
+    봇 탐지 회피 옵션이 적용된 Chrome 드라이버를 생성합니다
+    (render_profile이 있으면 로딩 전략과 리소스 차단을 적용)
+    """
+    # Chrome 옵션 설정
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless=new")
+
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    # User-Agent 랜덤 설정
+    chrome_options.add_argument(f"--user-agent={random.choice(USER_AGENTS)}")
+
+    if render_profile:
+        render_profile.configure_options(chrome_options)
+
+    # 캐시된 ChromeDriver 경로로 초기화
+    service = Service(resolve_chromedriver_path(driver_cache_file))
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+
+    # 자동화 탐지 우회
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+    if render_profile:
+        render_profile.apply(driver)
+
+    return driver
+
+
+def _process_tree_rss_mb(root_pid: int) -> Optional[float]:
+    """
+    root_pid와 모든 하위 프로세스의 RSS 합계(MB)를 /proc에서 계산합니다.
+    /proc을 사용할 수 없는 환경에서는 None을 반환합니다.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+
+    # pid -> ppid, rss 페이지 수 수집
+    children = {}
+    rss_pages = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", 'r') as f:
+                stat = f.read()
+            # comm 필드에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후부터 분리
+            fields = stat[stat.rindex(")") + 2:].split()
+            pid = int(entry)
+            ppid = int(fields[1])
+            children.setdefault(ppid, []).append(pid)
+            rss_pages[pid] = int(fields[21])
+        except (OSError, ValueError, IndexError):
+            continue
+
+    if root_pid not in rss_pages:
+        return None
+
+    total_pages = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total_pages += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, []))
+
+    return total_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+class DriverPool:
+    """
+    여러 개의 headless Chrome 드라이버를 미리 띄워두고 검색/페이지 방문에 대여하는 풀
+
+    - 시작 시 size개의 드라이버를 병렬로 생성 (warm startup)
+    - 드라이버별 방문 페이지 수가 max_pages를 넘거나
+      Chrome 프로세스 트리의 RSS가 max_rss_mb를 넘으면 반납 시 새 드라이버로 교체
+      (RSS 계산은 /proc 전체를 읽으므로 드라이버마다 rss_check_interval번 반납할 때 한 번만 확인)
+    - 드라이버 생성은 create_retries번까지 다시 시도하고, 그래도 실패해 풀이 줄어들면
+      대여할 드라이버가 없을 때 backfill_interval초 간격으로 다시 채움
+    - 대여는 acquire_timeout초까지만 기다리고 TimeoutError 발생 (살아 있는 드라이버가 없으면 바로 RuntimeError)
+    """
+
+    def __init__(self, size: int = 2, headless: bool = True, max_pages: int = 200,
+                 max_rss_mb: int = 2048, driver_cache_file: str = ".chromedriver_path.json",
+                 render_profile=None, create_retries: int = 2, backfill_interval: float = 30,
+                 acquire_timeout: float = 120, rss_check_interval: int = 20):
+        self.size = max(1, size)
+        self.headless = headless
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.driver_cache_file = driver_cache_file
+        self.render_profile = render_profile
+        self.create_retries = create_retries
+        self.backfill_interval = backfill_interval
+        self.acquire_timeout = acquire_timeout
+        self.rss_check_interval = max(1, rss_check_interval)
+
+        self._idle = queue.Queue()
+        # 살아 있는(유휴 + 대여 중) 드라이버별 누적 방문 페이지 수
+        self._page_counts = {}
+        # 드라이버별 반납 횟수 (RSS 확인 주기 계산용)
+        self._release_counts = {}
+        self._lock = threading.Lock()
+        self._backfill_lock = threading.Lock()
+        self._last_create_failure = None
+        self._started = False
+        self._closed = False
+
+    def start(self):
+        """size개의 드라이버를 미리 생성합니다"""
+        if self._started:
+            return
+        self._started = True
+
+        # 드라이버 경로를 먼저 확인하여 스레드마다 중복 설치하지 않도록 함
+        resolve_chromedriver_path(self.driver_cache_file)
+
+        threads = [threading.Thread(target=self._add_new_driver) for _ in range(self.size)]
+        start_time = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        print(f"✅ 드라이버 풀 준비 완료: {self._idle.qsize()}/{self.size}개 ({time.time() - start_time:.1f}초)")
+
+    @property
+    def live_count(self) -> int:
+        """살아 있는(유휴 + 대여 중) 드라이버 수 (생성에 실패하면 size보다 작을 수 있음)"""
+        with self._lock:
+            return len(self._page_counts)
+
+    def _add_new_driver(self) -> bool:
+        """드라이버를 하나 만들어 풀에 추가합니다 (create_retries번까지 재시도, 성공 여부 반환)"""
+        for attempt in range(self.create_retries + 1):
+            try:
+                driver = create_chrome_driver(self.headless, self.driver_cache_file, self.render_profile)
+                break
+            except Exception as e:
+                print(f"❌ 드라이버 생성 실패 ({attempt + 1}/{self.create_retries + 1}): {e}")
+                if attempt < self.create_retries:
+                    time.sleep(2 ** attempt)
+        else:
+            self._last_create_failure = time.monotonic()
+            print(f"  ⚠️ 드라이버 풀이 줄어든 상태입니다 ({self.live_count}/{self.size}개), 나중에 다시 채웁니다.")
+            return False
+
+        with self._lock:
+            self._page_counts[id(driver)] = 0
+        if self._closed:
+            self._quit_driver(driver)
+            return False
+        self._idle.put(driver)
+        return True
+
+    def _backfill(self) -> bool:
+        """생성 실패로 줄어든 풀을 한 개 채웁니다 (마지막 실패 후 backfill_interval초가 지났을 때만)"""
+        if self._closed or self.live_count >= self.size:
+            return False
+        if self._last_create_failure is not None and time.monotonic() - self._last_create_failure < self.backfill_interval:
+            return False
+        # 여러 스레드가 동시에 채우지 않도록 함
+        if not self._backfill_lock.acquire(blocking=False):
+            return False
+        try:
+            if self.live_count >= self.size:
+                return False
+            return self._add_new_driver()
+        finally:
+            self._backfill_lock.release()
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        유휴 드라이버를 대여합니다 (없으면 반납되거나 다시 채워질 때까지 최대 timeout초 대기)
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 acquire_timeout)
+        """
+        if not self._started:
+            self.start()
+        if self._closed:
+            raise RuntimeError("드라이버 풀이 이미 종료되었습니다")
+
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            self._backfill()
+            if self.live_count == 0:
+                # 반납될 드라이버도 없으므로 기다려도 소용없음
+                raise RuntimeError("사용 가능한 드라이버가 없습니다 (드라이버 생성 실패)")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"{timeout}초 안에 사용 가능한 드라이버가 없습니다")
+            try:
+                return self._idle.get(timeout=min(0.25, remaining))
+            except queue.Empty:
+                continue
+
+    def release(self, driver, pages: int = 0, broken: bool = False):
+        """
+        드라이버를 반납합니다. 세션이 끊겼거나 재활용 기준을 넘은 드라이버는 교체합니다.
+
+        Args:
+            driver: 반납할 드라이버
+            pages: 이번 대여 동안 로딩한 페이지 수
+            broken: 세션이 끊어진 드라이버 여부
+        """
+        with self._lock:
+            page_count = self._page_counts.get(id(driver), 0) + pages
+            self._page_counts[id(driver)] = page_count
+            release_count = self._release_counts.get(id(driver), 0) + 1
+            self._release_counts[id(driver)] = release_count
+
+        if self._closed:
+            self._quit_driver(driver)
+            return
+
+        reason = None
+        if broken:
+            reason = "세션 끊김"
+        elif self.max_pages and page_count >= self.max_pages:
+            reason = f"{page_count}페이지 방문"
+        elif self.max_rss_mb and release_count % self.rss_check_interval == 0:
+            rss_mb = self._driver_rss_mb(driver)
+            if rss_mb is not None and rss_mb > self.max_rss_mb:
+                reason = f"메모리 {rss_mb:.0f}MB 사용"
+
+        if reason:
+            print(f"  ♻️ 드라이버 재활용 ({reason})")
+            self._quit_driver(driver)
+            self._add_new_driver()
+        else:
+            self._idle.put(driver)
+
+    @contextmanager
+    def lease(self, pages: int = 1, timeout: Optional[float] = None):
+        """with 문으로 드라이버를 대여하고, 블록이 끝나면 자동 반납합니다"""
+        driver = self.acquire(timeout=timeout)
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            # 세션이 살아있는지 확인하여 끊긴 드라이버는 교체
+            try:
+                _ = driver.current_url
+            except Exception:
+                broken = True
+            raise
+        finally:
+            self.release(driver, pages=pages, broken=broken)
+
+    def _driver_rss_mb(self, driver) -> Optional[float]:
+        try:
+            return _process_tree_rss_mb(driver.service.process.pid)
+        except Exception:
+            return None
+
+    def _quit_driver(self, driver):
+        # 풀에서 빼므로 live_count도 줄어듦
+        with self._lock:
+            self._page_counts.pop(id(driver), None)
+            self._release_counts.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """풀의 모든 유휴 드라이버를 종료합니다 (대여 중인 드라이버는 반납 시 종료)"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit_driver(driver)
@@ -1,21 +1,112 @@
+import hashlib
 import json
 import os
-from typing import Dict, Any, Optional
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
 from dotenv import load_dotenv
 import google.generativeai as genai
-from bs4 import BeautifulSoup
-import re
+from google.api_core import exceptions as google_exceptions
+
+from .rate_limiter import QuotaLimiter, CircuitBreaker, CircuitOpenError
+from .classification_cache import ClassificationCache
+from .near_duplicate_index import NearDuplicateIndex
+from .keyword_prefilter import KeywordPrefilter
+from .local_model import LocalTextClassifier
+from .content_selector import ContentSelector
+from .training_samples import TrainingSampleStore
+from .text_extractor import extract_text
+from .metrics import (
+    TEXT_EXTRACTION_SECONDS, CLASSIFICATIONS, CACHE_HITS, LLM_CALL_SECONDS, LLM_CALLS, PROMPT_CHARS, ERRORS
+)
+
+
+# 재시도할 Gemini API 오류 (429 할당량 초과, 5xx 서버 오류)
+RETRYABLE_ERRORS = (
+    google_exceptions.TooManyRequests,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.InternalServerError,
+    google_exceptions.BadGateway,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.GatewayTimeout,
+    google_exceptions.DeadlineExceeded,
+)
+
+# 프롬프트 토큰 수 추정용 (한글이 섞인 텍스트 기준 보수적으로 2글자당 1토큰)
+CHARS_PER_TOKEN = 2
+
+# 추출된 텍스트 길이 제한 (Gemini API 입력 크기 제한)
+MAX_TEXT_CHARS = 50000
+
+# 응답 파싱 실패 오류 메시지 (예전에는 이 이유로 합법 판정을 반환하여 캐시에 남아 있을 수 있음)
+PARSE_FAILURE_REASON = "응답 파싱 실패"
+
+
+class ResponseParseError(ValueError):
+    """Gemini 응답을 판정 JSON으로 파싱하지 못한 경우"""
+    pass
+
+
+class ClassificationDeferredError(Exception):
+    """서킷 브레이커가 열려 있거나 재시도를 다 써서 분류하지 못한 페이지가 있는 경우 (나중에 다시 분류)"""
+    pass
+
+
+def extract_text_from_html(html_content: str, max_chars: Optional[int] = None, keep_blocks: bool = False) -> str:
+    """
+    HTML에서 텍스트 콘텐츠만 추출
+    script, style, meta 등 불필요한 태그 제거
+
+    전체 DOM 트리를 만들지 않고 스트리밍으로 파싱하며,
+    max_chars 글자를 채우면 나머지 HTML은 읽지 않습니다.
+
+    Args:
+        html_content: 원본 HTML 콘텐츠
+        max_chars: 최대 글자 수 (None이면 제한 없음)
+        keep_blocks: 블록 요소마다 줄을 나누고 제목/소제목 줄을 표시할지 여부 (ContentSelector용)
+
+    Returns:
+        정제된 텍스트 콘텐츠
+    """
+    with TEXT_EXTRACTION_SECONDS.time():
+        try:
+            return extract_text(html_content, max_chars=max_chars, keep_blocks=keep_blocks)
+        except Exception as e:
+            # 파싱 실패 시 원본 반환 (안전성)
+            return html_content if max_chars is None else html_content[:max_chars]
 
 
 class GeminiClassifier:
     """Gemini API를 사용하여 불법 도박 사이트를 판별하는 클래스"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, max_workers: int = 4,
+                 requests_per_minute: float = 60, tokens_per_minute: Optional[float] = None,
+                 max_retries: int = 3, breaker_threshold: int = 5, breaker_cooldown: float = 60.0,
+                 cache: Optional[ClassificationCache] = None,
+                 near_duplicate_index: Optional[NearDuplicateIndex] = None,
+                 prefilter: Optional[KeywordPrefilter] = None,
+                 local_model: Optional[LocalTextClassifier] = None,
+                 content_selector: Optional[ContentSelector] = None,
+                 training_samples: Optional[TrainingSampleStore] = None):
         """
         GeminiClassifier 초기화
 
         Args:
             api_key: Google Generative AI API 키 (제공되지 않으면 .env 파일에서 로드)
+            max_workers: classify_batch의 최대 동시 요청 수
+            requests_per_minute: 분당 요청 할당량 (RPM)
+            tokens_per_minute: 분당 입력 토큰 할당량 (TPM, None이면 제한 없음)
+            max_retries: 429/5xx 오류 시 최대 재시도 횟수
+            breaker_threshold: 서킷 브레이커를 여는 연속 실패 횟수
+            breaker_cooldown: 서킷 브레이커가 열린 뒤 요청을 차단하는 시간 (초)
+            cache: 텍스트 해시 기반 분류 결과 캐시 (None이면 캐시 사용 안 함)
+            near_duplicate_index: 유사 페이지 인덱스 (None이면 유사 페이지 판정 상속 안 함)
+            prefilter: 키워드 점수 사전 필터 (None이면 모든 페이지를 Gemini로 판정)
+            local_model: 학습된 로컬 분류 모델 (None이면 사용 안 함)
+            content_selector: 프롬프트 본문 선택기 (None이면 추출한 텍스트를 MAX_TEXT_CHARS까지 그대로 전송)
+            training_samples: Gemini 판정과 텍스트를 로컬 모델 학습용으로 저장할 저장소 (None이면 저장 안 함)
         """
         # .env 파일에서 환경 변수 로드
         load_dotenv()
@@ -30,7 +121,48 @@ class GeminiClassifier:
 
         # API 키로 Gemini 설정
         genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model_name = "gemini-2.5-flash"
+        self.model = genai.GenerativeModel(self.model_name)
+
+        # 유사(미러) 페이지 인덱스
+        self.near_duplicate_index = near_duplicate_index
+
+        # 키워드 점수 사전 필터
+        self.prefilter = prefilter
+
+        # 로컬 분류 모델
+        self.local_model = local_model
+
+        # 프롬프트 본문 선택기 (토큰 예산 안에서 신호가 많은 구간만 전송)
+        self.content_selector = content_selector
+
+        # 로컬 모델 학습용 Gemini 판정 표본 (불법/합법 모두, 판정 당시 텍스트와 함께)
+        self.training_samples = training_samples
+
+        # 판정 경로별 횟수
+        self.stats = {
+            "near_duplicate_hits": 0,
+            "prefilter_illegal": 0,
+            "prefilter_legal": 0,
+            "local_model_illegal": 0,
+            "local_model_legal": 0,
+            "gemini_calls": 0,
+        }
+        self._stats_lock = threading.Lock()
+
+        # 캐시 키에 들어가는 프롬프트/모델 버전 (프롬프트 템플릿이 바뀌면 자동으로 캐시 무효화)
+        self.cache = cache
+        prompt_template = self._build_prompt("", "")
+        selector_version = content_selector.version if content_selector else ""
+        self.prompt_version = hashlib.sha256(
+            f"{self.model_name}\0{prompt_template}\0{selector_version}".encode('utf-8')
+        ).hexdigest()[:16]
+
+        # 동시 요청, 할당량, 재시도, 서킷 브레이커 설정
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.rate_limiter = QuotaLimiter(requests_per_minute, tokens_per_minute)
+        self.circuit_breaker = CircuitBreaker(breaker_threshold, breaker_cooldown)
 
     def classify_url(self, url: str, html_content: str) -> Dict[str, Any]:
         """
@@ -47,71 +179,260 @@ class GeminiClassifier:
                 "confidence": float (0.0-1.0),
                 "reason": str,
                 "detected_keywords": list,
-                "error": str or None
+                "cluster_id": str (유사 페이지 인덱스 사용 시),
+                "error": str or None,
+                "retryable": bool (오류 결과만, 일시적인 API 오류면 True)
             }
         """
         try:
-            # HTML에서 텍스트만 추출
-            cleaned_html = self._extract_text_from_html(html_content)
+            cleaned_html = self.prepare_text(html_content)
+        except Exception as e:
+            return self._error_result(url, e)
+        return self.classify_text(url, cleaned_html)
+
+    def prepare_text(self, html_content: str) -> str:
+        """HTML에서 텍스트만 추출하고 길이를 제한합니다"""
+        # 추출된 텍스트 길이 제한 (Gemini API 입력 크기 제한)
+        # 제한에 도달하면 나머지 HTML은 파싱하지 않음
+        return self._extract_text_from_html(html_content, max_chars=self.max_text_chars, keep_blocks=self.keep_blocks)
+
+    @property
+    def max_text_chars(self) -> int:
+        """추출할 최대 글자 수 (본문 선택기를 쓰면 프롬프트에는 일부만 들어가므로 더 길게 추출)"""
+        return self.content_selector.max_scan_chars if self.content_selector else MAX_TEXT_CHARS
+
+    @property
+    def keep_blocks(self) -> bool:
+        """본문 선택기가 줄 단위 구간을 쓰므로 블록 구조를 남겨 추출하는지 여부"""
+        return self.content_selector is not None
+
+    def classify_text(self, url: str, cleaned_html: str,
+                      local_probability: Optional[float] = None) -> Dict[str, Any]:
+        """
+        정제된 텍스트로 불법 도박 사이트 여부를 판별합니다
+        (캐시 → 유사 페이지 → 키워드 사전 필터 → 로컬 모델 → Gemini 순서)
 
-            # 추출된 텍스트 길이 제한 (Gemini API 입력 크기 제한)
-            if len(cleaned_html) > 50000:
-                cleaned_html = cleaned_html[:50000]
+        Args:
+            url: 분석할 URL
+            cleaned_html: prepare_text()로 정제된 텍스트
+            local_probability: 미리 배치로 계산한 로컬 모델 확률 (None이면 필요할 때 계산)
 
-            prompt = self._build_prompt(url, cleaned_html)
-            response = self.model.generate_content(prompt)
+        Returns:
+            classify_url()과 같은 형식의 결과 딕셔너리
+        """
+        try:
+            # 같은 텍스트를 이미 분류한 적이 있으면 캐시된 결과 사용
+            cache_key = None
+            if self.cache:
+                cache_key = self.cache.make_key(cleaned_html, self.prompt_version)
+                cached = self.cache.get(cache_key)
+                # 파싱 실패를 합법으로 기록했던 예전 캐시 항목은 다시 분류
+                if cached is not None and cached.get("reason") != PARSE_FAILURE_REASON:
+                    CACHE_HITS.inc()
+                    CLASSIFICATIONS.inc(path="cache")
+                    cached["url"] = url
+                    # 캐시에는 Gemini 판정만 저장됨
+                    cached.setdefault("source", "gemini")
+                    if self.training_samples:
+                        self.training_samples.add(url, cleaned_html, cached)
+                    return cached
+
+            # 이미 분류한 클러스터의 유사 페이지면 그 판정을 상속
+            fingerprint = None
+            if self.near_duplicate_index:
+                fingerprint = self.near_duplicate_index.fingerprint(cleaned_html)
+                similar = self.near_duplicate_index.find_similar(fingerprint) if fingerprint is not None else None
+                if similar and similar["reason"] != PARSE_FAILURE_REASON:
+                    self._count("near_duplicate_hits")
+                    CLASSIFICATIONS.inc(path="near_duplicate")
+                    return {
+                        "url": url,
+                        "is_illegal": similar["is_illegal"],
+                        "confidence": similar["confidence"],
+                        "reason": f"유사 페이지 판정 상속 ({similar['url']}, 거리 {similar['distance']}): {similar['reason']}",
+                        "detected_keywords": similar["detected_keywords"],
+                        "cluster_id": similar["cluster_id"],
+                        "source": "near_duplicate",
+                        "error": None,
+                    }
+
+            # 키워드 점수가 명확한 페이지는 로컬에서 판정
+            if self.prefilter:
+                decision = self.prefilter.decide(url, cleaned_html)
+                if decision:
+                    self._count("prefilter_illegal" if decision["is_illegal"] else "prefilter_legal")
+                    CLASSIFICATIONS.inc(path="prefilter")
+                    decision["source"] = "prefilter"
+                    return decision
+
+            # 로컬 분류 모델의 확률이 명확하면 로컬에서 판정 (margin이 작으면 Gemini로)
+            if self.local_model:
+                if local_probability is None:
+                    local_probability = float(self.local_model.predict_proba([cleaned_html])[0])
+                decision = self.local_model.decide(url, local_probability)
+                if decision:
+                    self._count("local_model_illegal" if decision["is_illegal"] else "local_model_legal")
+                    CLASSIFICATIONS.inc(path="local_model")
+                    decision["source"] = "local_model"
+                    return decision
+
+            # 프롬프트에는 토큰 예산 안에서 고른 구간만 넣음 (캐시/유사 페이지/사전 필터는 전체 텍스트 기준)
+            prompt_text = self.content_selector.select(cleaned_html) if self.content_selector else cleaned_html
+            prompt = self._build_prompt(url, prompt_text)
+            self._count("gemini_calls")
+            response_text = self._generate_with_retry(prompt)
 
             # 응답 파싱
-            response_text = response.text
             result = self._parse_response(response_text)
 
-            return {
+            classification = {
                 "url": url,
                 "is_illegal": result.get("is_illegal", False),
                 "confidence": result.get("confidence", 0.0),
                 "reason": result.get("reason", ""),
                 "detected_keywords": result.get("detected_keywords", []),
+                "source": "gemini",
                 "error": None,
             }
 
-        except Exception as e:
-            return {
-                "url": url,
-                "is_illegal": False,
-                "confidence": 0.0,
-                "reason": "",
-                "detected_keywords": [],
-                "error": str(e),
-            }
+            if fingerprint is not None:
+                classification["cluster_id"] = self.near_duplicate_index.add(fingerprint, url, classification)
 
-    def _extract_text_from_html(self, html_content: str) -> str:
-        """
-        HTML에서 텍스트 콘텐츠만 추출
-        script, style, meta 등 불필요한 태그 제거
+            if cache_key:
+                self.cache.put(cache_key, classification)
 
-        Args:
-            html_content: 원본 HTML 콘텐츠
+            if self.training_samples:
+                self.training_samples.add(url, cleaned_html, classification)
 
-        Returns:
-            정제된 텍스트 콘텐츠
-        """
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-
-            # script, style, meta, noscript 태그 제거
-            for tag in soup.find_all(['script', 'style', 'meta', 'noscript', 'link', 'head']):
-                tag.decompose()
+            CLASSIFICATIONS.inc(path="gemini")
+            return classification
 
-            # 텍스트 추출
-            text = soup.get_text(separator=' ', strip=True)
+        except Exception as e:
+            ERRORS.inc(stage="classify")
+            return self._error_result(url, e)
+
+    def _error_result(self, url: str, error: Exception) -> Dict[str, Any]:
+        return {
+            "url": url,
+            "is_illegal": False,
+            "confidence": 0.0,
+            "reason": "",
+            "detected_keywords": [],
+            "error": str(error),
+            # 일시적인 API 오류면 True (페이지가 아니라 서비스 문제이므로 나중에 다시 분류해야 함)
+            "retryable": isinstance(error, (CircuitOpenError,) + RETRYABLE_ERRORS),
+        }
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] = self.stats.get(name, 0) + 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """분류 통계 (캐시 적중/실패 횟수, 판정 경로별 횟수)"""
+        cache_stats = self.cache.get_stats() if self.cache else {}
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats["cache_hits"] = cache_stats.get("hits", 0)
+        stats["cache_misses"] = cache_stats.get("misses", 0)
+        return stats
+
+    def classify_batch(self, items: Iterable[Tuple[str, str]]) -> Iterator[Dict[str, Any]]:
+        """
+        여러 (url, html_content)를 최대 max_workers개씩 동시에 분류하고 완료되는 순서대로 반환합니다.
+        items가 제너레이터여도 도착하는 대로 요청을 보내며, 처리 중인 요청이 많으면 입력 소비를 멈춥니다.
 
-            # 연속된 공백을 단일 공백으로 정리
-            text = re.sub(r'\s+', ' ', text)
+        Args:
+            items: (url, html_content) 쌍의 iterable
 
+        Yields:
+            classify_url()과 같은 형식의 결과 딕셔너리
+        """
+        max_in_flight = self.max_workers * 2
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = set()
+            for chunk in self._chunked(items, self.max_workers):
+                # 텍스트 추출 후 로컬 모델 확률은 청크 단위로 한 번에 계산
+                prepared = []
+                for url, html_content in chunk:
+                    try:
+                        prepared.append((url, self.prepare_text(html_content)))
+                    except Exception as e:
+                        yield self._error_result(url, e)
+                probabilities = [None] * len(prepared)
+                if self.local_model and prepared:
+                    try:
+                        probabilities = [float(p) for p in self.local_model.predict_proba([text for _, text in prepared])]
+                    except Exception as e:
+                        print(f"  ⚠️ 로컬 모델 배치 예측 실패: {e}")
+
+                for (url, text), probability in zip(prepared, probabilities):
+                    pending.add(executor.submit(self.classify_text, url, text, probability))
+
+                while len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+    @staticmethod
+    def _chunked(items: Iterable[Tuple[str, str]], size: int) -> Iterator[list]:
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _generate_with_retry(self, prompt: str) -> str:
+        """
+        할당량(RPM/TPM)을 지키며 Gemini API를 호출합니다.
+        429/5xx 오류는 지수 백오프로 재시도하고, 연속 실패가 쌓이면 서킷 브레이커가 요청을 차단합니다.
+        """
+        estimated_tokens = len(prompt) / CHARS_PER_TOKEN
+
+        for attempt in range(self.max_retries + 1):
+            if not self.circuit_breaker.allow():
+                raise CircuitOpenError("Gemini API 연속 실패로 서킷 브레이커가 열려 있습니다")
+
+            self.rate_limiter.acquire(estimated_tokens)
+            PROMPT_CHARS.inc(len(prompt))
+            started = time.perf_counter()
+            try:
+                response = self.model.generate_content(prompt)
+                text = response.text
+            except RETRYABLE_ERRORS as e:
+                LLM_CALL_SECONDS.observe(time.perf_counter() - started)
+                LLM_CALLS.inc(outcome="error")
+                self.circuit_breaker.record_failure()
+                if attempt >= self.max_retries:
+                    raise
+                backoff = min(60.0, 2 ** attempt) + random.uniform(0, 1)
+                print(f"  🔁 Gemini 재시도 {attempt + 1}/{self.max_retries} ({backoff:.1f}초 후): {e}")
+                time.sleep(backoff)
+                continue
+            except Exception:
+                # 안전 필터로 막힌 응답(response.text의 ValueError) 등 재시도하지 않는 오류는
+                # 서비스 장애가 아니므로 연속 실패로 세지 않고 half_open 시험 요청만 풀어 줌
+                LLM_CALL_SECONDS.observe(time.perf_counter() - started)
+                LLM_CALLS.inc(outcome="error")
+                self.circuit_breaker.release_trial()
+                raise
+
+            LLM_CALL_SECONDS.observe(time.perf_counter() - started)
+            LLM_CALLS.inc(outcome="ok")
+            self.circuit_breaker.record_success()
             return text
-        except Exception as e:
-            # 파싱 실패 시 원본 반환 (안전성)
-            return html_content
+
+    def _extract_text_from_html(self, html_content: str, max_chars: Optional[int] = None,
+                                keep_blocks: bool = False) -> str:
+        """HTML에서 텍스트 콘텐츠만 추출 (extract_text_from_html 참고)"""
+        return extract_text_from_html(html_content, max_chars=max_chars, keep_blocks=keep_blocks)
 
     def _build_prompt(self, url: str, text_content: str) -> str:
         """불법 도박 사이트 판별을 위한 프롬프트 작성"""
@@ -146,34 +467,34 @@ URL: {url}
         return prompt
 
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
-        """Gemini API 응답을 파싱하여 구조화된 데이터로 변환"""
+        """
+        Gemini API 응답을 파싱하여 구조화된 데이터로 변환
 
-        try:
-            # JSON 형식으로 응답 파싱
-            # 응답에 마크다운 코드 블록이 있을 수 있으므로 처리
-            cleaned_response = response_text.strip()
-            if cleaned_response.startswith("```"):
-                # 마크다운 코드 블록 제거
-                cleaned_response = cleaned_response.split("```")[1]
-                if cleaned_response.startswith("json"):
-                    cleaned_response = cleaned_response[4:]
-                cleaned_response = cleaned_response.strip()
+        Raises:
+            ResponseParseError: 응답이 JSON 객체가 아닌 경우 (합법 판정으로 취급하지 않고 분류 오류로 처리)
+        """
 
-            result = json.loads(cleaned_response)
+        # JSON 형식으로 응답 파싱
+        # 응답에 마크다운 코드 블록이 있을 수 있으므로 처리
+        cleaned_response = response_text.strip()
+        if cleaned_response.startswith("```"):
+            # 마크다운 코드 블록 제거
+            cleaned_response = cleaned_response.split("```")[1]
+            if cleaned_response.startswith("json"):
+                cleaned_response = cleaned_response[4:]
+            cleaned_response = cleaned_response.strip()
 
-            # 신뢰도 범위 확인
-            confidence = result.get("confidence", 0.0)
-            if not isinstance(confidence, (int, float)):
-                confidence = 0.0
-            result["confidence"] = max(0.0, min(1.0, confidence))
-
-            return result
-
-        except json.JSONDecodeError:
-            # JSON 파싱 실패 시 기본값 반환
-            return {
-                "is_illegal": False,
-                "confidence": 0.0,
-                "reason": "응답 파싱 실패",
-                "detected_keywords": [],
-            }
+        try:
+            result = json.loads(cleaned_response)
+        except json.JSONDecodeError as e:
+            raise ResponseParseError(f"{PARSE_FAILURE_REASON}: {e}") from e
+        if not isinstance(result, dict):
+            raise ResponseParseError(f"{PARSE_FAILURE_REASON}: JSON 객체가 아닙니다")
+
+        # 신뢰도 범위 확인
+        confidence = result.get("confidence", 0.0)
+        if not isinstance(confidence, (int, float)):
+            confidence = 0.0
+        result["confidence"] = max(0.0, min(1.0, confidence))
+
+        return result
@@ -0,0 +1,365 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Any, Optional, Iterable
+
+
+# 작업 상태: queued (대기) → leased (작업자가 가져감) → done (완료) / dead (재시도 횟수 초과)
+JOB_STATUSES = ("queued", "leased", "done", "dead")
+
+
+def default_worker_id() -> str:
+    """작업자 ID 기본값 (호스트 이름:프로세스 ID)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobQueue:
+    """
+    여러 크롤러 프로세스(여러 서버)가 함께 사용하는 작업 대기열 인터페이스
+
+    작업은 (kind, key) 쌍으로 구분합니다. kind는 "keyword" (검색어) 또는 "url" (분류할 URL)이며
+    같은 (kind, key) 작업은 하나만 존재합니다.
+
+    - claim: 대기 중인 작업을 lease_seconds 동안 빌려 옴 (다른 작업자는 가져갈 수 없음)
+    - heartbeat: 처리 중인 작업의 임대 기간 연장
+    - ack: 처리 완료 기록
+    - fail: 실패 기록 (max_attempts 미만이면 retry_delay 후 다시 대기열로, 아니면 dead)
+    - 임대 기간이 지나도록 ack/heartbeat가 없는 작업(작업자가 죽은 경우)은 requeue_expired가 다시 대기열로 돌림
+
+    구현체:
+    - PostgresJobQueue (postgres_job_queue.py): 기존 데이터베이스의 crawl_jobs 테이블 (SELECT ... FOR UPDATE SKIP LOCKED)
+    - SQLiteJobQueue: 한 서버 안의 여러 프로세스 또는 테스트용
+
+    settings.json의 "job_queue_backend" 값("postgres" 또는 "sqlite")으로 선택합니다 (create_job_queue 참고).
+    """
+
+    def __init__(self, lease_seconds: float = 300, max_attempts: int = 3, retry_delay: float = 60):
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def enqueue(self, kind: str, keys: Iterable[str], priority: int = 0, requeue_done: bool = False) -> int:
+        """
+        작업 추가 (이미 있는 작업은 그대로 두고, requeue_done이면 완료/dead 작업을 다시 대기열로)
+
+        Returns:
+            새로 추가되었거나 다시 대기열로 돌아간 작업 수
+        """
+        raise NotImplementedError
+
+    def claim(self, worker_id: str, kinds: Iterable[str] = ("keyword", "url"), limit: int = 1) -> List[Dict[str, Any]]:
+        """
+        대기 중인 작업을 최대 limit개 임대합니다 (우선순위가 높고 오래 기다린 작업부터)
+
+        Returns:
+            [{"id", "kind", "key", "attempts"}, ...]
+        """
+        raise NotImplementedError
+
+    def heartbeat(self, job_ids: List[int], worker_id: str) -> int:
+        """임대 기간 연장 (연장된 작업 수 반환, 임대를 잃은 작업은 제외)"""
+        raise NotImplementedError
+
+    def ack(self, job_id: int, worker_id: str, result: Optional[Dict[str, Any]] = None) -> bool:
+        """처리 완료 기록 (임대를 잃어 다른 작업자에게 넘어간 작업이면 False)"""
+        raise NotImplementedError
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> bool:
+        """실패 기록 (임대를 잃어 다른 작업자에게 넘어간 작업이면 False)"""
+        raise NotImplementedError
+
+    def release(self, job_id: int, worker_id: str, error: str, delay: float = 0) -> bool:
+        """재시도 횟수를 쓰지 않고 delay초 뒤에 다시 대기열로 (검색 차단처럼 작업 탓이 아닌 실패)"""
+        raise NotImplementedError
+
+    def requeue_expired(self) -> int:
+        """임대 기간이 지난 작업을 다시 대기열로 (재시도 횟수를 다 쓴 작업은 dead), 처리한 작업 수 반환"""
+        raise NotImplementedError
+
+    def get_counts(self) -> Dict[str, Dict[str, int]]:
+        """{kind: {status: 작업 수}}"""
+        raise NotImplementedError
+
+    def describe(self) -> str:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def keep_alive(self, job_ids: List[int], worker_id: str) -> "LeaseKeeper":
+        """처리하는 동안 백그라운드에서 임대 기간을 연장하는 컨텍스트 매니저"""
+        return LeaseKeeper(self, job_ids, worker_id, interval=self.lease_seconds / 3)
+
+
+class LeaseKeeper:
+    """
+    with 블록 동안 interval초마다 heartbeat를 보내 임대 기간을 연장합니다
+
+    사용 예:
+        with job_queue.keep_alive([job["id"]], worker_id):
+            process(job)
+    """
+
+    def __init__(self, job_queue: JobQueue, job_ids: List[int], worker_id: str, interval: float):
+        self.job_queue = job_queue
+        self.job_ids = list(job_ids)
+        self.worker_id = worker_id
+        self.interval = max(1.0, interval)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="job-heartbeat", daemon=True)
+
+    def __enter__(self) -> "LeaseKeeper":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                extended = self.job_queue.heartbeat(self.job_ids, self.worker_id)
+            except Exception as e:
+                # 일시적인 DB 오류: 다음 주기에 다시 시도 (임대 기간 안에 성공하면 문제 없음)
+                print(f"  ⚠️ 작업 임대 연장 실패: {e}")
+                continue
+            if extended < len(self.job_ids):
+                print(f"  ⚠️ {len(self.job_ids) - extended}개 작업의 임대가 만료되어 다른 작업자에게 넘어갔을 수 있습니다.")
+
+
+class SQLiteJobQueue(JobQueue):
+    """
+    SQLite 파일을 사용하는 작업 대기열 (한 서버 안의 여러 프로세스 또는 테스트용)
+
+    claim은 BEGIN IMMEDIATE로 쓰기 잠금을 잡은 뒤 작업을 고르므로
+    같은 파일을 여러 프로세스가 열어도 하나의 작업을 두 작업자가 가져가지 않습니다.
+    db_file을 ":memory:"로 주면 한 프로세스 안에서만 사용하는 대기열이 됩니다.
+    """
+
+    def __init__(self, db_file: str = "job_queue.sqlite3", lease_seconds: float = 300,
+                 max_attempts: int = 3, retry_delay: float = 60):
+        super().__init__(lease_seconds, max_attempts, retry_delay)
+        self.db_file = db_file
+        self._lock = threading.Lock()
+
+        # 트랜잭션은 직접 관리 (isolation_level=None)
+        self.connection = sqlite3.connect(db_file, timeout=30, check_same_thread=False, isolation_level=None)
+        if db_file != ":memory:":
+            self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS crawl_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                priority INTEGER NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL,
+                lease_owner TEXT,
+                lease_expires_at REAL,
+                last_error TEXT,
+                result TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                UNIQUE (kind, key)
+            )
+        """)
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_crawl_jobs_status ON crawl_jobs (status, kind, priority DESC, available_at)"
+        )
+
+    def _write(self, statements) -> Any:
+        """쓰기 잠금을 잡고(BEGIN IMMEDIATE) statements(cursor)를 실행한 뒤 커밋"""
+        with self._lock:
+            cursor = self.connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                result = statements(cursor)
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+            return result
+
+    def enqueue(self, kind: str, keys: Iterable[str], priority: int = 0, requeue_done: bool = False) -> int:
+        keys = list(dict.fromkeys(keys))
+        now = time.time()
+
+        def statements(cursor):
+            added = 0
+            for key in keys:
+                cursor.execute(
+                    """
+                    INSERT OR IGNORE INTO crawl_jobs (kind, key, priority, available_at, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (kind, key, priority, now, now, now)
+                )
+                added += cursor.rowcount
+                if not cursor.rowcount and requeue_done:
+                    cursor.execute(
+                        """
+                        UPDATE crawl_jobs
+                        SET status = 'queued', attempts = 0, priority = ?, available_at = ?,
+                            last_error = NULL, updated_at = ?
+                        WHERE kind = ? AND key = ? AND status IN ('done', 'dead')
+                        """,
+                        (priority, now, now, kind, key)
+                    )
+                    added += cursor.rowcount
+            return added
+
+        return self._write(statements)
+
+    def claim(self, worker_id: str, kinds: Iterable[str] = ("keyword", "url"), limit: int = 1) -> List[Dict[str, Any]]:
+        self.requeue_expired()
+        kinds = list(kinds)
+        now = time.time()
+
+        def statements(cursor):
+            cursor.execute(
+                f"""
+                SELECT id, kind, key, attempts FROM crawl_jobs
+                WHERE status = 'queued' AND kind IN ({", ".join("?" * len(kinds))}) AND available_at <= ?
+                ORDER BY priority DESC, available_at, id
+                LIMIT ?
+                """,
+                (*kinds, now, limit)
+            )
+            rows = cursor.fetchall()
+            cursor.executemany(
+                """
+                UPDATE crawl_jobs
+                SET status = 'leased', lease_owner = ?, attempts = attempts + 1,
+                    lease_expires_at = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                [(worker_id, now + self.lease_seconds, now, row[0]) for row in rows]
+            )
+            return rows
+
+        rows = self._write(statements)
+        return [{"id": row[0], "kind": row[1], "key": row[2], "attempts": row[3] + 1} for row in rows]
+
+    def heartbeat(self, job_ids: List[int], worker_id: str) -> int:
+        now = time.time()
+
+        def statements(cursor):
+            cursor.executemany(
+                """
+                UPDATE crawl_jobs SET lease_expires_at = ?, updated_at = ?
+                WHERE id = ? AND status = 'leased' AND lease_owner = ?
+                """,
+                [(now + self.lease_seconds, now, job_id, worker_id) for job_id in job_ids]
+            )
+            return cursor.rowcount
+
+        return self._write(statements)
+
+    def ack(self, job_id: int, worker_id: str, result: Optional[Dict[str, Any]] = None) -> bool:
+        def statements(cursor):
+            cursor.execute(
+                """
+                UPDATE crawl_jobs
+                SET status = 'done', result = ?, last_error = NULL,
+                    lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+                WHERE id = ? AND status = 'leased' AND lease_owner = ?
+                """,
+                (json.dumps(result, ensure_ascii=False) if result is not None else None,
+                 time.time(), job_id, worker_id)
+            )
+            return cursor.rowcount == 1
+
+        return self._write(statements)
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> bool:
+        now = time.time()
+
+        def statements(cursor):
+            cursor.execute(
+                """
+                UPDATE crawl_jobs
+                SET status = CASE WHEN attempts >= ? THEN 'dead' ELSE 'queued' END,
+                    available_at = ?, last_error = ?,
+                    lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+                WHERE id = ? AND status = 'leased' AND lease_owner = ?
+                """,
+                (self.max_attempts, now + self.retry_delay, error, now, job_id, worker_id)
+            )
+            return cursor.rowcount == 1
+
+        return self._write(statements)
+
+    def release(self, job_id: int, worker_id: str, error: str, delay: float = 0) -> bool:
+        now = time.time()
+
+        def statements(cursor):
+            cursor.execute(
+                """
+                UPDATE crawl_jobs
+                SET status = 'queued', attempts = MAX(attempts - 1, 0),
+                    available_at = ?, last_error = ?,
+                    lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+                WHERE id = ? AND status = 'leased' AND lease_owner = ?
+                """,
+                (now + delay, error, now, job_id, worker_id)
+            )
+            return cursor.rowcount == 1
+
+        return self._write(statements)
+
+    def requeue_expired(self) -> int:
+        now = time.time()
+
+        def statements(cursor):
+            cursor.execute(
+                """
+                UPDATE crawl_jobs
+                SET status = CASE WHEN attempts >= ? THEN 'dead' ELSE 'queued' END,
+                    last_error = '임대 만료 (' || COALESCE(lease_owner, '') || ')',
+                    lease_owner = NULL, lease_expires_at = NULL, available_at = ?, updated_at = ?
+                WHERE status = 'leased' AND lease_expires_at < ?
+                """,
+                (self.max_attempts, now, now, now)
+            )
+            return cursor.rowcount
+
+        return self._write(statements)
+
+    def get_counts(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT kind, status, COUNT(*) FROM crawl_jobs GROUP BY kind, status"
+            ).fetchall()
+        counts: Dict[str, Dict[str, int]] = {}
+        for kind, status, count in rows:
+            counts.setdefault(kind, {})[status] = count
+        return counts
+
+    def describe(self) -> str:
+        return f"SQLite {self.db_file}"
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
+
+
+def create_job_queue(settings: Dict[str, Any]) -> JobQueue:
+    """settings.json 설정에 맞는 작업 대기열 생성"""
+    backend = settings.get("job_queue_backend", "postgres")
+    options = {
+        "lease_seconds": settings.get("job_lease_seconds", 300),
+        "max_attempts": settings.get("job_max_attempts", 3),
+        "retry_delay": settings.get("job_retry_delay", 60),
+    }
+
+    if backend == "postgres":
+        from .postgres_job_queue import PostgresJobQueue
+        return PostgresJobQueue(**options)
+    if backend == "sqlite":
+        return SQLiteJobQueue(settings.get("job_queue_file", "job_queue.sqlite3"), **options)
+    raise ValueError(f"알 수 없는 job_queue_backend: {backend} (postgres 또는 sqlite)")
@@ -1,45 +1,64 @@
+import argparse
 import json
 import os
-from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 
+from .metrics import STORED_ROWS, STORAGE_WRITE_SECONDS, ERRORS
+from .storage import ResultStorage
 
-class JSONStorage:
-    def __init__(self, output_file: str = "results.json"):
-        self.output_file = output_file
 
-    def save_results(self, urls: List[str], keyword: str, classification_results: List[Dict[str, Any]] = None) -> None:
-        timestamp = datetime.now().isoformat()
-
-        new_entries = []
-        for i, url in enumerate(urls):
-            entry = {
-                "url": url,
-                "keyword_used": keyword,
-                "collected_at": timestamp
-            }
+class JSONStorage(ResultStorage):
+    """
+    수집 결과 저장소
 
-            # 분류 결과가 있으면 추가
-            if classification_results and i < len(classification_results):
-                result = classification_results[i]
-                entry["is_illegal"] = result.get("is_illegal", False)
-                entry["gemini_confidence"] = result.get("confidence", 0.0)
-                entry["gemini_reason"] = result.get("reason", "")
-                entry["gemini_error"] = result.get("error", None)
-                if result.get("detected_keywords"):
-                    entry["detected_keywords"] = result.get("detected_keywords")
+    - output_file 확장자가 .jsonl이면 한 줄에 한 항목씩 덧붙이는(append-only) JSONL 형식으로 저장합니다.
+      키워드마다 한 번의 write + fsync로 저장하고, URL/오프셋/키워드를 담은 사이드카 인덱스
+      (output_file + ".idx")를 시작 시 한 번만 읽어 중복 확인과 통계를 메모리에서 처리합니다.
+      저장 도중 종료되어 마지막 줄이 잘렸거나 인덱스가 뒤처진 경우 시작 시 복구합니다.
+    - 그 외(.json)는 기존처럼 전체 목록을 하나의 JSON 배열로 저장합니다.
 
-            new_entries.append(entry)
+    JSONL 파일이 아직 없고 같은 이름의 .json 파일(예: results.json)이 있으면 처음 열 때 옮겨 담고,
+    원본은 .json.migrated로 이름을 바꿉니다 (DB로 임포트하며 JSONL 파일을 지운 뒤 다시 옮겨 담지 않도록).
+    """
 
-        existing_data = self.load_existing_data()
-        existing_data.extend(new_entries)
+    def __init__(self, output_file: str = "results.json", fsync: bool = True):
+        self.output_file = output_file
+        self.fsync = fsync
+        self.is_jsonl = output_file.endswith(".jsonl")
+        self.index_file = output_file + ".idx"
+
+        # JSONL 모드에서 인덱스로부터 읽어 유지하는 상태
+        self._offsets: Dict[str, int] = {}
+        self._keywords: set = set()
+        self._total_entries = 0
+        self._data_handle = None
+        self._index_handle = None
+
+        if self.is_jsonl:
+            self._open_jsonl()
 
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, indent=2, ensure_ascii=False)
+    def save_results(self, urls: List[str], keyword: str, classification_results: List[Dict[str, Any]] = None) -> None:
+        new_entries = self.build_entries(urls, keyword, classification_results)
+
+        try:
+            with STORAGE_WRITE_SECONDS.time(backend="json"):
+                if self.is_jsonl:
+                    self._append_entries(new_entries)
+                else:
+                    existing_data = self.load_existing_data()
+                    existing_data.extend(new_entries)
+                    self._write_json_atomically(existing_data)
+        except Exception:
+            ERRORS.inc(stage="storage")
+            raise
+        STORED_ROWS.inc(len(new_entries), backend="json")
 
         print(f"  💾 {len(new_entries)}개 URL 저장 완료 (키워드: '{keyword}')")
 
     def load_existing_data(self) -> List[Dict[str, Any]]:
+        if self.is_jsonl:
+            return list(self.iter_entries())
+
         if not os.path.exists(self.output_file):
             return []
 
@@ -49,11 +68,46 @@ class JSONStorage:
         except (json.JSONDecodeError, FileNotFoundError):
             return []
 
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """저장된 항목을 하나씩 읽기 (JSONL은 파일 전체를 메모리에 올리지 않음)"""
+        if not self.is_jsonl:
+            yield from self.load_existing_data()
+            return
+        if not os.path.exists(self.output_file):
+            return
+        with open(self.output_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def get_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        """URL로 저장된 (가장 최근) 항목 조회 (JSONL은 인덱스의 오프셋으로 해당 줄만 읽음)"""
+        if not self.is_jsonl:
+            matches = [entry for entry in self.load_existing_data() if entry.get("url") == url]
+            return matches[-1] if matches else None
+
+        offset = self._offsets.get(url)
+        if offset is None:
+            return None
+        with open(self.output_file, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
     def get_existing_urls(self) -> set:
+        if self.is_jsonl:
+            return set(self._offsets)
         existing_data = self.load_existing_data()
         return {entry.get("url", "") for entry in existing_data}
 
     def get_stats(self) -> Dict[str, Any]:
+        if self.is_jsonl:
+            return {
+                "total_entries": self._total_entries,
+                "unique_urls": len(self._offsets),
+                "keywords_used": len(self._keywords),
+                "keywords": list(self._keywords)
+            }
+
         existing_data = self.load_existing_data()
         total_urls = len(existing_data)
         unique_urls = len(set(entry.get("url", "") for entry in existing_data))
@@ -65,3 +119,203 @@ class JSONStorage:
             "keywords_used": len(keywords_used),
             "keywords": list(keywords_used)
         }
+
+    def describe(self) -> str:
+        return self.output_file
+
+    def close(self) -> None:
+        for handle in (self._data_handle, self._index_handle):
+            if handle:
+                handle.close()
+        self._data_handle = None
+        self._index_handle = None
+
+    # ---- JSON 배열 모드 ----
+
+    def _write_json_atomically(self, data: List[Dict[str, Any]]) -> None:
+        """임시 파일에 쓴 뒤 교체하여 쓰는 도중 종료되어도 기존 파일이 깨지지 않도록 함"""
+        temp_file = self.output_file + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(temp_file, self.output_file)
+
+    # ---- JSONL 모드 ----
+
+    def _open_jsonl(self) -> None:
+        legacy_file = os.path.splitext(self.output_file)[0] + ".json"
+        if not os.path.exists(self.output_file) and os.path.exists(legacy_file):
+            migrated = migrate_json_to_jsonl(legacy_file, self.output_file, fsync=self.fsync)
+            # 옮긴 원본이 남아 있으면 JSONL 파일이 없어질 때마다(임포트 후 삭제 등) 오래된 항목을 다시 옮기게 됨
+            os.replace(legacy_file, legacy_file + ".migrated")
+            print(f"📦 기존 {legacy_file}의 {migrated}개 항목을 {self.output_file}로 옮겼습니다. "
+                  f"(원본은 {legacy_file}.migrated로 보관)")
+
+        data_size = self._repair_data_file()
+        indexed_size = self._load_index(data_size)
+
+        self._data_handle = open(self.output_file, 'ab')
+        self._index_handle = open(self.index_file, 'ab')
+
+        # 데이터는 저장되었지만 인덱스에 반영되지 않은 항목 (인덱스 기록 전 종료된 경우)
+        if indexed_size < data_size:
+            recovered = self._index_data_from(indexed_size)
+            print(f"🔧 인덱스에 없던 {recovered}개 항목을 {self.index_file}에 복구했습니다.")
+
+    def _repair_data_file(self) -> int:
+        """마지막 줄이 잘린 경우(쓰는 도중 종료) 잘린 부분을 잘라내고 파일 크기 반환"""
+        if not os.path.exists(self.output_file):
+            return 0
+
+        with open(self.output_file, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return 0
+            f.seek(size - 1)
+            if f.read(1) == b'\n':
+                return size
+
+            # 마지막 줄바꿈 위치를 뒤에서부터 찾기
+            position = size
+            while position > 0:
+                step = min(65536, position)
+                position -= step
+                f.seek(position)
+                last_newline = f.read(step).rfind(b'\n')
+                if last_newline != -1:
+                    position += last_newline + 1
+                    break
+            f.truncate(position)
+            print(f"🔧 {self.output_file}의 잘린 마지막 줄({size - position} bytes)을 제거했습니다.")
+            return position
+
+    def _load_index(self, data_size: int) -> int:
+        """
+        사이드카 인덱스를 읽어 메모리 상태를 구성합니다
+
+        Returns:
+            인덱스가 반영하는 데이터 파일의 끝 위치 (이후 부분은 다시 인덱싱 필요)
+        """
+        if not os.path.exists(self.index_file):
+            return 0
+
+        indexed_size = 0
+        valid_size = 0
+        with open(self.index_file, 'rb') as f:
+            for line in f:
+                try:
+                    offset, length, url, keyword = json.loads(line)
+                except (ValueError, TypeError):
+                    # 잘린 마지막 줄 등 손상된 부분부터는 버리고 데이터 파일에서 다시 인덱싱
+                    break
+                if offset != indexed_size or offset + length > data_size:
+                    break
+                self._track(url, keyword, offset)
+                indexed_size = offset + length
+                valid_size += len(line)
+
+        if valid_size != os.path.getsize(self.index_file):
+            with open(self.index_file, 'rb+') as f:
+                f.truncate(valid_size)
+        return indexed_size
+
+    def _index_data_from(self, start: int) -> int:
+        """데이터 파일의 start 위치부터 끝까지 읽어 인덱스에 추가"""
+        index_lines = []
+        with open(self.output_file, 'rb') as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    index_lines.append(self._index_line(offset, len(line), entry))
+                    self._track(entry.get("url", ""), entry.get("keyword_used", ""), offset)
+                offset += len(line)
+        self._write_durably(self._index_handle, b"".join(index_lines))
+        return len(index_lines)
+
+    def _append_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """항목들을 한 번의 write + fsync로 덧붙이고 인덱스 갱신"""
+        if not entries:
+            return
+
+        offset = self._data_handle.seek(0, os.SEEK_END)
+        data_lines = []
+        index_lines = []
+        offsets = []
+        for entry in entries:
+            line = (json.dumps(entry, ensure_ascii=False) + "\n").encode('utf-8')
+            data_lines.append(line)
+            index_lines.append(self._index_line(offset, len(line), entry))
+            offsets.append(offset)
+            offset += len(line)
+
+        # 데이터가 디스크에 기록된 뒤에 인덱스를 기록 (인덱스가 데이터보다 앞서지 않도록)
+        self._write_durably(self._data_handle, b"".join(data_lines))
+        self._write_durably(self._index_handle, b"".join(index_lines))
+
+        for entry, entry_offset in zip(entries, offsets):
+            self._track(entry.get("url", ""), entry.get("keyword_used", ""), entry_offset)
+
+    def _write_durably(self, handle, data: bytes) -> None:
+        handle.write(data)
+        handle.flush()
+        if self.fsync:
+            os.fsync(handle.fileno())
+
+    @staticmethod
+    def _index_line(offset: int, length: int, entry: Dict[str, Any]) -> bytes:
+        record = [offset, length, entry.get("url", ""), entry.get("keyword_used", "")]
+        return (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+
+    def _track(self, url: str, keyword: str, offset: int) -> None:
+        self._offsets[url] = offset
+        self._keywords.add(keyword)
+        self._total_entries += 1
+
+
+def migrate_json_to_jsonl(json_file: str, jsonl_file: str, fsync: bool = True) -> int:
+    """
+    기존 JSON 배열 결과 파일을 JSONL 파일로 옮겨 담습니다 (원본 파일은 그대로 유지)
+
+    임시 파일에 모두 쓴 뒤 이름을 바꾸므로 도중에 종료되어도 반쯤 옮겨진 파일이 남지 않습니다.
+    인덱스는 JSONStorage가 JSONL 파일을 처음 열 때 만듭니다.
+
+    Returns:
+        옮긴 항목 수
+    """
+    with open(json_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    temp_file = jsonl_file + ".tmp"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+    os.replace(temp_file, jsonl_file)
+
+    # 이전 인덱스가 남아 있으면 새 데이터와 맞지 않으므로 삭제
+    if os.path.exists(jsonl_file + ".idx"):
+        os.remove(jsonl_file + ".idx")
+    return len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="results.json → results.jsonl 변환")
+    parser.add_argument("json_file", nargs="?", default="results.json", help="기존 JSON 결과 파일")
+    parser.add_argument("jsonl_file", nargs="?", default="results.jsonl", help="생성할 JSONL 파일")
+    args = parser.parse_args()
+
+    migrated = migrate_json_to_jsonl(args.json_file, args.jsonl_file)
+    storage = JSONStorage(args.jsonl_file)
+    stats = storage.get_stats()
+    storage.close()
+    print(f"✅ {migrated}개 항목 변환 완료 (고유 URL {stats['unique_urls']}개): {args.jsonl_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 import json
 from itertools import combinations
-from typing import List
+from typing import List, Iterator
 
 
 class KeywordManager:
@@ -30,4 +30,22 @@ class KeywordManager:
         for combo in combinations(self.keywords, 2):
             all_keywords.append(" ".join(combo))
 
-        return all_keywords
\ No newline at end of file
+        return all_keywords
+
+    def iter_combinations(self, max_size: int = 2, priority: List[str] = None) -> Iterator[str]:
+        """
+        키워드 1개부터 max_size개 조합까지 필요할 때마다 하나씩 생성합니다 (전체 목록을 미리 만들지 않음)
+
+        Args:
+            max_size: 조합할 최대 키워드 수
+            priority: 조합을 만들 키워드 순서 (앞쪽 키워드가 들어간 조합이 먼저 생성됨, 기본값은 keywords.json 순서)
+                      조합 문자열은 항상 keywords.json 순서로 이어 붙이므로 같은 조합은 항상 같은 검색어가 됩니다.
+        """
+        if not self.keywords:
+            self.load_keywords()
+
+        position = {keyword: i for i, keyword in enumerate(self.keywords)}
+        ordered = [keyword for keyword in (priority or self.keywords) if keyword in position]
+        for size in range(1, max_size + 1):
+            for combo in combinations(ordered, size):
+                yield " ".join(sorted(combo, key=position.get))
@@ -0,0 +1,158 @@
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# 불법 도박 사이트 신호 어휘와 가중치 (GeminiClassifier 프롬프트의 판단 기준을 따름)
+# 양수는 불법 도박 신호, 음수는 일반 블로그/쇼핑몰/뉴스 신호
+DEFAULT_SIGNAL_WEIGHTS = {
+    # 1. 베팅/도박 관련 키워드
+    "카지노": 2.0, "바카라": 3.0, "슬롯": 1.5, "슬롯머신": 2.0, "포커": 1.5, "홀덤": 2.0,
+    "토토": 2.0, "사설토토": 4.0, "스포츠베팅": 2.5, "스포츠 배팅": 2.5, "배팅": 1.5, "베팅": 1.5,
+    "파워볼": 2.5, "미니게임": 1.5, "라이브카지노": 3.0, "블랙잭": 2.0, "룰렛": 1.5,
+    "casino": 2.0, "baccarat": 3.0, "betting": 1.5, "sportsbook": 2.5, "slots": 1.5, "poker": 1.0,
+    # 2. 결제 수단 (충전/환전)
+    "충전": 1.0, "환전": 2.0, "입금": 1.0, "출금": 1.0, "가상계좌": 1.5, "테더": 1.5, "usdt": 1.5,
+    "deposit": 1.0, "withdraw": 1.0,
+    # 3. 회원가입/프로모션
+    "가입첫충전": 4.0, "첫충": 3.0, "매충": 3.0, "신규가입": 1.0, "가입코드": 2.5, "추천코드": 1.5,
+    "꽁머니": 4.0, "페이백": 2.0, "돌발이벤트": 2.5,
+    # 4. 불법성을 암시하는 표현
+    "먹튀": 2.0, "먹튀검증": 2.5, "안전놀이터": 4.0, "메이저놀이터": 4.0, "놀이터": 1.5,
+    "vpn": 1.0, "anonymous": 0.5, "추적 불가": 2.0,
+    # 5. 규제 회피
+    "우회": 1.0, "offshore": 1.5, "해외 라이센스": 1.5, "bypass": 0.5,
+    # 6. 도박 은어
+    "롤링": 2.5, "더블업": 2.0, "마진": 0.5, "핸디캡": 1.5, "배당률": 1.5, "배당": 1.0, "단폴": 3.0,
+    "다폴": 3.0, "올인구조대": 3.0,
+    # 합법/무관 페이지 신호
+    "장바구니": -2.0, "무료배송": -2.0, "도박 중독": -3.0, "도박중독": -3.0, "한국도박문제예방치유원": -4.0,
+    "기자": -1.0, "뉴스": -1.0, "구독": -0.5, "블로그": -1.0, "댓글": -0.5,
+}
+
+
+class AhoCorasickMatcher:
+    """
+    여러 패턴을 한 번의 텍스트 순회로 찾는 Aho-Corasick 매처
+
+    패턴 수와 무관하게 텍스트 길이에 비례하는 시간으로 모든 출현 위치를 찾습니다.
+    """
+
+    def __init__(self, patterns: List[str]):
+        # 상태 전이(goto), 실패 링크(fail), 상태별 매칭 패턴(outputs)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[str]] = [[]]
+
+        for pattern in patterns:
+            self._add(pattern)
+        self._build_failure_links()
+
+    def _add(self, pattern: str) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append(pattern)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+    def count_matches(self, text: str) -> Dict[str, int]:
+        """텍스트에 등장한 패턴별 출현 횟수 (겹치는 출현 포함)"""
+        counts: Dict[str, int] = {}
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern in outputs[state]:
+                counts[pattern] = counts.get(pattern, 0) + 1
+        return counts
+
+
+class KeywordPrefilter:
+    """
+    LLM 호출 전 가중치 키워드 점수로 명확한 페이지를 로컬에서 판정하는 사전 필터
+
+    - 점수 >= high_score: 불법 도박 사이트로 판정
+    - 점수 <= low_score: 불법 도박 사이트 아님으로 판정 (본문이 min_text_chars 이상일 때만)
+    - 그 사이: 판단 보류 (Gemini로 전달)
+
+    패턴별 점수는 min(출현 횟수, max_hits_per_pattern) * 가중치로 계산하여
+    같은 단어가 반복되는 페이지의 점수가 과도하게 커지지 않도록 합니다.
+    """
+
+    def __init__(self, high_score: float = 15.0, low_score: float = 1.0, min_text_chars: int = 500,
+                 weights: Optional[Dict[str, float]] = None, max_hits_per_pattern: int = 3):
+        self.high_score = high_score
+        self.low_score = low_score
+        # 본문이 짧으면 신호가 없는 것인지 내용이 없는 것인지 알 수 없으므로 합법 판정하지 않음
+        self.min_text_chars = min_text_chars
+        self.max_hits_per_pattern = max_hits_per_pattern
+        # 영문 패턴은 소문자로 비교
+        self.weights = {pattern.lower(): weight for pattern, weight in (weights or DEFAULT_SIGNAL_WEIGHTS).items()}
+        self.matcher = AhoCorasickMatcher(list(self.weights))
+
+    def score(self, text: str) -> Tuple[float, Dict[str, int]]:
+        """
+        텍스트의 가중치 점수 계산
+
+        Returns:
+            (점수, {패턴: 출현 횟수}) 튜플
+        """
+        matches = self.matcher.count_matches(text.lower())
+        total = sum(min(count, self.max_hits_per_pattern) * self.weights[pattern]
+                    for pattern, count in matches.items())
+        return total, matches
+
+    def decide(self, url: str, text: str) -> Optional[Dict[str, Any]]:
+        """
+        점수가 명확하면 로컬 판정 결과를, 애매하면 None을 반환합니다
+
+        Returns:
+            GeminiClassifier.classify_url()과 같은 형식의 결과 딕셔너리 또는 None
+        """
+        total, matches = self.score(text)
+        if self.low_score < total < self.high_score:
+            return None
+        if total <= self.low_score and len(text) < self.min_text_chars:
+            return None
+
+        is_illegal = total >= self.high_score
+        signal_keywords = sorted(
+            (pattern for pattern, count in matches.items() if self.weights[pattern] > 0),
+            key=lambda pattern: -self.weights[pattern] * min(matches[pattern], self.max_hits_per_pattern)
+        )
+
+        # 임계값에서 멀어질수록 신뢰도가 높아지도록 0.7~0.99 범위로 환산
+        if is_illegal:
+            distance = (total - self.high_score) / max(self.high_score, 1.0)
+        else:
+            distance = (self.low_score - total) / max(self.high_score - self.low_score, 1.0)
+        confidence = round(min(0.99, 0.7 + 0.29 * min(1.0, distance)), 2)
+
+        verdict = "불법 도박 신호 키워드 다수" if is_illegal else "도박 신호 키워드 거의 없음"
+        return {
+            "url": url,
+            "is_illegal": is_illegal,
+            "confidence": confidence,
+            "reason": f"키워드 사전 필터 판정: {verdict} (점수 {total:.1f})",
+            "detected_keywords": signal_keywords[:10] if is_illegal else [],
+            "error": None,
+        }
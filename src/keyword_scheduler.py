@@ -0,0 +1,191 @@
+import random
+import time
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional
+
+from .crawl_state import CrawlStateStore
+from .keyword_manager import KeywordManager
+
+
+# 키워드 상태를 다시 읽을 때 마지막으로 읽은 시각보다 이만큼(초) 앞부터 읽음
+# (읽는 동안 기록 중이던 변경을 놓치지 않도록)
+STATS_REFRESH_MARGIN = 5.0
+
+class KeywordScheduler:
+    """
+    검색 성과(검색당 불법 사이트 탐지 수)에 따라 다음 검색어를 고르는 스케줄러
+
+    키워드 조합을 미리 모두 만들지 않고 필요할 때 하나씩 생성하며,
+    하루 검색 예산(daily_budget) 안에서 다음 순서로 검색어를 고릅니다.
+
+    1. 이전 실행에서 중단되었거나 실패 후 재시도가 남은 검색어
+    2. exploration_rate 확률로(또는 재검색할 기존 검색어의 점수가 검색하지 않은 조합의 기본 점수보다 낮으면)
+       아직 검색하지 않은 조합 (탐색)
+       - 단일 키워드 성과가 좋은 키워드가 들어간 조합부터 생성
+    3. 그 외에는 평활화한 탐지율 (탐지 수 + prior_detections) / (검색 수 + prior_searches)이
+       가장 높은 기존 검색어 (활용)
+       - research_interval_hours 안에 검색한 검색어, 재시도 횟수를 다 써 failed인 검색어와
+         serp_dedup_window_hours 안에 다른 검색과 같은 검색 결과를 낸 검색어는 제외
+
+    검색 기록과 성과는 CrawlStateStore에 저장되므로 실행이 바뀌어도 이어집니다.
+    검색어마다 전체 상태를 다시 읽지 않고 마지막으로 읽은 뒤 바뀐 키워드만 읽어 갱신합니다.
+    """
+
+    def __init__(self, keyword_manager: KeywordManager, crawl_state: CrawlStateStore,
+                 max_combination_size: int = 2, daily_budget: int = 300,
+                 exploration_rate: float = 0.2, research_interval_hours: float = 24,
+                 serp_dedup_window_hours: float = 72, prior_detections: float = 1.0,
+                 prior_searches: float = 2.0, rng: Optional[random.Random] = None):
+        self.keyword_manager = keyword_manager
+        self.crawl_state = crawl_state
+        self.max_combination_size = max(1, max_combination_size)
+        self.daily_budget = daily_budget
+        self.exploration_rate = exploration_rate
+        self.research_interval = research_interval_hours * 3600
+        self.serp_dedup_window = serp_dedup_window_hours * 3600
+        self.prior_detections = prior_detections
+        self.prior_searches = prior_searches
+        self.rng = rng or random.Random()
+
+        if not self.keyword_manager.keywords:
+            self.keyword_manager.load_keywords()
+        self._keyword_tokens = [keyword.split() for keyword in self.keyword_manager.keywords]
+
+        self._stats_loaded_at = time.time() - STATS_REFRESH_MARGIN
+        self._keyword_stats = self.crawl_state.get_keyword_stats()
+        # 검색어 → split_query 결과가 있는지 (키워드 목록은 실행 중에 바뀌지 않음)
+        self._valid_queries: Dict[str, bool] = {}
+        self._unexplored = self._iter_unexplored()
+        self.stats = {"resumed": 0, "explored": 0, "exploited": 0}
+        # 이번 실행에서 이미 고른 검색어 (파이프라인에서 처리 중인 검색어를 다시 재개하지 않도록)
+        self._issued = set()
+
+    def next_query(self) -> Optional[str]:
+        """다음에 검색할 검색어 (오늘 예산을 다 썼거나 검색할 검색어가 없으면 None)"""
+        searches_today = self.searches_today()
+        if searches_today >= self.daily_budget:
+            print(f"💰 오늘 검색 예산({self.daily_budget}회)을 모두 사용했습니다.")
+            return None
+
+        self._refresh_keyword_stats()
+
+        query = self._next_resumed()
+        if query:
+            self._issued.add(query)
+            self.stats["resumed"] += 1
+            print(f"  ↪️ 중단된 검색어 다시 진행: {query}")
+            return query
+
+        best = self._best_known()
+        unseen_score = self.prior_detections / self.prior_searches
+        if best is None or best[1] < unseen_score or self.rng.random() < self.exploration_rate:
+            query = next(self._unexplored, None)
+            if query:
+                self._issued.add(query)
+                self.stats["explored"] += 1
+                print(f"  🧭 새 조합 탐색: {query}")
+                return query
+
+        if best is None:
+            return None
+        query, rate = best
+        self._issued.add(query)
+        self.stats["exploited"] += 1
+        keyword_stats = self._keyword_stats[query]
+        print(f"  🎯 성과 기반 선택: {query} (탐지 {keyword_stats['detections']}회 / 검색 {keyword_stats['searches']}회, "
+              f"점수 {rate:.2f})")
+        return query
+
+    def searches_today(self) -> int:
+        """오늘(로컬 시간 자정 이후) 시작한 검색 수"""
+        midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        return self.crawl_state.count_searches_since(midnight.timestamp())
+
+    def remaining_budget(self) -> int:
+        return max(0, self.daily_budget - self.searches_today())
+
+    def score(self, keyword_stats: Dict[str, Any]) -> float:
+        """평활화한 검색당 탐지율 (검색 횟수가 적은 검색어가 우연한 결과로 과대평가되지 않도록 함)"""
+        return ((keyword_stats["detections"] + self.prior_detections) /
+                (keyword_stats["searches"] + self.prior_searches))
+
+    def split_query(self, query: str) -> Optional[List[int]]:
+        """
+        검색어를 keywords.json 순서의 서로 다른 기본 키워드들로 나눕니다
+
+        Returns:
+            기본 키워드 인덱스 목록 (현재 키워드로 만들 수 있는 max_combination_size 이하의 조합이 아니면 None)
+        """
+        tokens = query.split()
+
+        def split_from(position: int, first_index: int, remaining: int) -> Optional[List[int]]:
+            if position == len(tokens):
+                return []
+            if remaining == 0:
+                return None
+            for index in range(first_index, len(self._keyword_tokens)):
+                keyword_tokens = self._keyword_tokens[index]
+                if keyword_tokens and tokens[position:position + len(keyword_tokens)] == keyword_tokens:
+                    rest = split_from(position + len(keyword_tokens), index + 1, remaining - 1)
+                    if rest is not None:
+                        return [index] + rest
+            return None
+
+        if not tokens:
+            return None
+        return split_from(0, 0, self.max_combination_size)
+
+    def _refresh_keyword_stats(self) -> None:
+        """마지막으로 읽은 뒤 상태가 바뀐 키워드만 다시 읽어 갱신"""
+        loaded_at = time.time() - STATS_REFRESH_MARGIN
+        self._keyword_stats.update(self.crawl_state.get_keyword_stats(updated_since=self._stats_loaded_at))
+        self._stats_loaded_at = loaded_at
+
+    def _is_valid_query(self, query: str) -> bool:
+        valid = self._valid_queries.get(query)
+        if valid is None:
+            valid = self._valid_queries[query] = self.split_query(query) is not None
+        return valid
+
+    def _next_resumed(self) -> Optional[str]:
+        """중단된(in_progress) 검색어 또는 실패 후 재시도가 남은(pending, attempts > 0) 검색어"""
+        for query, keyword_stats in self._keyword_stats.items():
+            if query in self._issued:
+                continue
+            interrupted = keyword_stats["status"] == "in_progress"
+            retrying = keyword_stats["status"] == "pending" and keyword_stats["attempts"] > 0
+            if (interrupted or retrying) and self._is_valid_query(query):
+                return query
+        return None
+
+    def _best_known(self) -> Optional[tuple]:
+        """재검색 가능한 기존 검색어 중 점수가 가장 높은 (검색어, 점수)"""
+        now = time.time()
+        best = None
+        for query, keyword_stats in self._keyword_stats.items():
+            if not keyword_stats["searches"] or keyword_stats["status"] == "failed":
+                continue
+            if keyword_stats["last_run"] and now - keyword_stats["last_run"] < self.research_interval:
+                continue
+            if keyword_stats["duplicate_at"] and now - keyword_stats["duplicate_at"] < self.serp_dedup_window:
+                continue
+            if not self._is_valid_query(query):
+                continue
+            rate = self.score(keyword_stats)
+            if best is None or rate > best[1]:
+                best = (query, rate)
+        return best
+
+    def _iter_unexplored(self) -> Iterator[str]:
+        """아직 검색하지 않은 조합을 단일 키워드 성과가 좋은 키워드부터 생성"""
+        unseen = {"detections": 0, "searches": 0}
+        priority = sorted(
+            self.keyword_manager.keywords,
+            key=lambda keyword: self.score(self._keyword_stats.get(keyword, unseen)),
+            reverse=True
+        )
+        for query in self.keyword_manager.iter_combinations(self.max_combination_size, priority=priority):
+            keyword_stats = self._keyword_stats.get(query)
+            if keyword_stats and keyword_stats["last_run"]:
+                continue
+            yield query
@@ -0,0 +1,418 @@
+import argparse
+import glob
+import json
+import os
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import minimize
+
+
+# 해시 계산용 상수 (64비트 정수 연산에서 자연스럽게 overflow 되도록 uint64 사용)
+_ROLLING_PRIME = np.uint64(1099511628211)
+_MIX_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+class CharNgramHashingVectorizer:
+    """
+    문자 n-gram TF-IDF 벡터화기 (feature hashing)
+
+    어휘 사전 대신 n-gram을 2^n_features_bits 개의 버킷으로 해싱하므로
+    메모리 사용량이 고정되고, 텍스트마다 NumPy 연산 몇 번으로 벡터화가 끝납니다.
+    """
+
+    def __init__(self, ngram_range: Tuple[int, int] = (2, 4), n_features_bits: int = 18,
+                 max_chars: int = 20000):
+        self.ngram_range = tuple(ngram_range)
+        self.n_features_bits = n_features_bits
+        self.n_features = 1 << n_features_bits
+        self.max_chars = max_chars
+        self.idf: Optional[np.ndarray] = None
+
+    def _hash_ngrams(self, text: str) -> np.ndarray:
+        """텍스트의 모든 문자 n-gram을 버킷 번호 배열로 변환"""
+        text = text[:self.max_chars].lower()
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+        shift = np.uint64(64 - self.n_features_bits)
+
+        buckets = []
+        for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+            count = len(codes) - n + 1
+            if count <= 0:
+                continue
+            # n-gram 크기별로 다른 시드에서 시작하는 롤링 해시
+            hashes = np.full(count, n, dtype=np.uint64)
+            for offset in range(n):
+                hashes = hashes * _ROLLING_PRIME + codes[offset:offset + count]
+            buckets.append((hashes * _MIX_MULTIPLIER) >> shift)
+
+        if not buckets:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(buckets).astype(np.int64)
+
+    def _term_frequencies(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """로그 스케일 TF 희소 행렬 (문서 x 버킷)"""
+        indptr = [0]
+        indices = []
+        data = []
+        for text in texts:
+            bucket_ids, counts = np.unique(self._hash_ngrams(text), return_counts=True)
+            indices.append(bucket_ids)
+            data.append(1.0 + np.log(counts))
+            indptr.append(indptr[-1] + len(bucket_ids))
+
+        matrix = sparse.csr_matrix(
+            (np.concatenate(data) if data else np.empty(0),
+             np.concatenate(indices) if indices else np.empty(0, dtype=np.int64),
+             np.array(indptr)),
+            shape=(len(texts), self.n_features),
+            dtype=np.float64
+        )
+        return matrix
+
+    def fit_transform(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        tf = self._term_frequencies(texts)
+        document_frequency = np.bincount(tf.indices, minlength=self.n_features)
+        self.idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1.0
+        return self._apply_idf(tf)
+
+    def transform(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        if self.idf is None:
+            raise ValueError("벡터화기가 학습되지 않았습니다")
+        return self._apply_idf(self._term_frequencies(texts))
+
+    def _apply_idf(self, tf: sparse.csr_matrix) -> sparse.csr_matrix:
+        tfidf = tf.multiply(self.idf).tocsr()
+        # 행 단위 L2 정규화
+        norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.diags(1.0 / norms) @ tfidf
+
+
+class LocalTextClassifier:
+    """
+    Gemini 판정 결과로 학습하는 경량 로컬 분류기 (문자 n-gram TF-IDF + 로지스틱 회귀)
+
+    GPU 없이 배치 단위로 확률을 계산하며, 확률이 high 이상/low 이하인 명확한 페이지만
+    로컬에서 판정하고 애매한(margin이 작은) 페이지는 Gemini로 넘깁니다.
+    """
+
+    MODEL_PREFIX = "local_classifier"
+
+    def __init__(self, vectorizer: Optional[CharNgramHashingVectorizer] = None,
+                 high: float = 0.9, low: float = 0.1):
+        self.vectorizer = vectorizer or CharNgramHashingVectorizer()
+        self.high = high
+        self.low = low
+        self.coef: Optional[np.ndarray] = None
+        self.intercept = 0.0
+        self.metadata: Dict[str, Any] = {}
+
+    @property
+    def version(self) -> str:
+        return self.metadata.get("version", "untrained")
+
+    def fit(self, texts: Sequence[str], labels: Sequence[bool], sample_weight: Optional[Sequence[float]] = None,
+            l2: float = 1e-4, max_iter: int = 200) -> "LocalTextClassifier":
+        """
+        L2 정규화 로지스틱 회귀를 L-BFGS로 학습합니다 (클래스 불균형은 가중치로 보정)
+
+        Args:
+            texts: 정제된 페이지 텍스트
+            labels: 불법 도박 사이트 여부
+            sample_weight: 샘플 가중치 (예: Gemini 신뢰도)
+            l2: L2 정규화 계수
+            max_iter: 최대 반복 횟수
+        """
+        y = np.asarray(labels, dtype=np.float64)
+        if len(np.unique(y)) < 2:
+            raise ValueError("학습 데이터에 불법/합법 두 클래스가 모두 있어야 합니다")
+
+        X = self.vectorizer.fit_transform(texts)
+        weights = np.ones(len(y)) if sample_weight is None else np.asarray(sample_weight, dtype=np.float64)
+
+        # 클래스별 가중치 합이 같아지도록 보정
+        positive = y == 1
+        weights = weights.copy()
+        weights[positive] *= 0.5 * weights.sum() / max(weights[positive].sum(), 1e-12)
+        weights[~positive] *= 0.5 * weights.sum() / max(weights[~positive].sum(), 1e-12)
+        weights /= weights.sum()
+
+        def loss_and_gradient(params):
+            w, b = params[:-1], params[-1]
+            z = X @ w + b
+            p = 1.0 / (1.0 + np.exp(-z))
+            # log(1 + e^z) - y*z 를 수치적으로 안정적으로 계산
+            loss = np.sum(weights * (np.logaddexp(0, z) - y * z)) + 0.5 * l2 * np.dot(w, w)
+            residual = weights * (p - y)
+            gradient = np.empty_like(params)
+            gradient[:-1] = X.T @ residual + l2 * w
+            gradient[-1] = residual.sum()
+            return loss, gradient
+
+        initial = np.zeros(X.shape[1] + 1)
+        optimum = minimize(loss_and_gradient, initial, jac=True, method="L-BFGS-B",
+                           options={"maxiter": max_iter})
+        self.coef = optimum.x[:-1]
+        self.intercept = float(optimum.x[-1])
+
+        created_at = datetime.now()
+        self.metadata = {
+            "version": created_at.strftime("v%Y%m%d%H%M%S"),
+            "created_at": created_at.isoformat(),
+            "n_samples": int(len(y)),
+            "n_positive": int(positive.sum()),
+            "ngram_range": list(self.vectorizer.ngram_range),
+            "n_features_bits": self.vectorizer.n_features_bits,
+            "max_chars": self.vectorizer.max_chars,
+            "l2": l2,
+        }
+        return self
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """텍스트 배치의 불법 도박 사이트 확률 (벡터화 계산)"""
+        if self.coef is None:
+            raise ValueError("모델이 학습되지 않았습니다")
+        if not texts:
+            return np.empty(0)
+        z = self.vectorizer.transform(texts) @ self.coef + self.intercept
+        return 1.0 / (1.0 + np.exp(-z))
+
+    def decide(self, url: str, probability: float) -> Optional[Dict[str, Any]]:
+        """
+        확률이 명확하면 로컬 판정 결과를, margin이 작으면 None을 반환합니다
+
+        Returns:
+            GeminiClassifier.classify_url()과 같은 형식의 결과 딕셔너리 또는 None
+        """
+        if self.low < probability < self.high:
+            return None
+
+        is_illegal = probability >= self.high
+        return {
+            "url": url,
+            "is_illegal": bool(is_illegal),
+            "confidence": round(float(probability if is_illegal else 1.0 - probability), 2),
+            "reason": f"로컬 분류 모델 판정 ({self.version}, 확률 {probability:.2f})",
+            "detected_keywords": [],
+            "error": None,
+        }
+
+    def save(self, model_dir: str = "models") -> str:
+        """버전이 붙은 모델 파일로 저장하고 경로를 반환합니다"""
+        if self.coef is None:
+            raise ValueError("모델이 학습되지 않았습니다")
+        os.makedirs(model_dir, exist_ok=True)
+        path = os.path.join(model_dir, f"{self.MODEL_PREFIX}-{self.version}.npz")
+        np.savez_compressed(
+            path,
+            coef=self.coef.astype(np.float32),
+            intercept=np.array([self.intercept]),
+            idf=self.vectorizer.idf.astype(np.float32),
+            metadata=np.array(json.dumps(self.metadata, ensure_ascii=False))
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: str, high: float = 0.9, low: float = 0.1) -> "LocalTextClassifier":
+        with np.load(path) as artifact:
+            metadata = json.loads(str(artifact["metadata"]))
+            vectorizer = CharNgramHashingVectorizer(
+                ngram_range=tuple(metadata["ngram_range"]),
+                n_features_bits=metadata["n_features_bits"],
+                max_chars=metadata["max_chars"]
+            )
+            vectorizer.idf = artifact["idf"].astype(np.float64)
+            model = cls(vectorizer, high=high, low=low)
+            model.coef = artifact["coef"].astype(np.float64)
+            model.intercept = float(artifact["intercept"][0])
+            model.metadata = metadata
+        return model
+
+    @classmethod
+    def latest_model_path(cls, model_dir: str = "models") -> Optional[str]:
+        """model_dir에서 가장 최신 버전의 모델 파일 경로 (없으면 None)"""
+        paths = sorted(glob.glob(os.path.join(model_dir, f"{cls.MODEL_PREFIX}-v*.npz")))
+        return paths[-1] if paths else None
+
+
+def _split_holdout(count: int, holdout_ratio: float, seed: int = 42) -> Tuple[np.ndarray, np.ndarray]:
+    order = np.random.default_rng(seed).permutation(count)
+    holdout_size = int(count * holdout_ratio)
+    return order[holdout_size:], order[:holdout_size]
+
+
+def train_from_samples(samples_file: str = "training_samples.sqlite3", model_dir: str = "models",
+                       limit: Optional[int] = None, holdout_ratio: float = 0.2, include_database: bool = False,
+                       max_text_chars: Optional[int] = None, keep_blocks: bool = False) -> Optional[str]:
+    """
+    분류할 때 저장한 Gemini 판정 표본(TrainingSampleStore)으로 로컬 분류기를 학습합니다
+
+    표본에는 판정 당시의 정제된 텍스트와 불법/합법 판정이 모두 있으므로 URL을 다시 가져오지 않으며,
+    Gemini 신뢰도를 샘플 가중치로 사용합니다. include_database가 True면 표본에 없는
+    gambling_urls의 기존 판정 결과도 URL을 다시 가져와 추가합니다 (train_from_database 참고).
+
+    Returns:
+        저장된 모델 파일 경로 (학습 데이터가 부족하면 None)
+    """
+    from .training_samples import TrainingSampleStore
+
+    texts: List[str] = []
+    labels: List[bool] = []
+    weights: List[float] = []
+    sample_urls = set()
+    if os.path.exists(samples_file):
+        store = TrainingSampleStore(samples_file, max_entries=0)
+        try:
+            for sample in store.iter_samples(limit=limit):
+                sample_urls.add(sample["url"])
+                texts.append(sample["text"])
+                labels.append(sample["is_illegal"])
+                weights.append(float(sample["confidence"] or 0.5))
+        finally:
+            store.close()
+    print(f"📄 학습 표본 {len(texts)}개를 읽었습니다 (불법 {sum(labels)}개): {samples_file}")
+
+    if include_database:
+        # 표본에 있는 URL은 판정 당시 텍스트를 쓰므로 다시 가져오지 않음
+        db_texts, db_labels, db_weights = _fetch_database_samples(limit, max_text_chars, keep_blocks, sample_urls)
+        texts += db_texts
+        labels += db_labels
+        weights += db_weights
+
+    return _fit_and_save(texts, labels, weights, model_dir, holdout_ratio)
+
+
+def train_from_database(model_dir: str = "models", limit: Optional[int] = None,
+                        holdout_ratio: float = 0.2, max_text_chars: Optional[int] = None,
+                        keep_blocks: bool = False) -> Optional[str]:
+    """
+    gambling_urls 테이블의 Gemini 판정 결과만으로 로컬 분류기를 학습합니다
+
+    판정 후 바뀐 페이지로 학습될 수 있고 테이블에는 불법 판정만 저장되므로,
+    학습 표본 저장소가 없을 때(판정 경로를 기록하기 전의 데이터)만 사용합니다.
+
+    Returns:
+        저장된 모델 파일 경로 (학습 데이터가 부족하면 None)
+    """
+    texts, labels, weights = _fetch_database_samples(limit, max_text_chars, keep_blocks)
+    return _fit_and_save(texts, labels, weights, model_dir, holdout_ratio)
+
+
+def _fetch_database_samples(limit: Optional[int], max_text_chars: Optional[int],
+                            keep_blocks: bool, skip_urls: Optional[set] = None) -> Tuple[List[str], List[bool], List[float]]:
+    """
+    gambling_urls의 Gemini 판정 결과를 읽고 각 URL을 다시 가져와 텍스트를 추출합니다
+
+    max_text_chars와 keep_blocks는 GeminiClassifier.prepare_text의 설정과 맞춥니다 (text_options_from_settings 참고).
+
+    Returns:
+        (텍스트 목록, 불법 여부 목록, 가중치 목록)
+    """
+    from .async_fetcher import AsyncFetcher
+    from .database import DatabaseManager
+    from .gemini_classifier import extract_text_from_html, MAX_TEXT_CHARS
+
+    max_text_chars = max_text_chars or MAX_TEXT_CHARS
+    db = DatabaseManager()
+    db.connect()
+    rows = db.get_labelled_urls(limit=limit)
+    db.disconnect()
+    print(f"📄 DB에서 {len(rows)}개의 판정 결과를 읽었습니다 (URL을 다시 가져오므로 판정 후 바뀐 페이지가 섞일 수 있음).")
+
+    labels_by_url = {row["url"]: row for row in rows if row["url"] not in (skip_urls or ())}
+    texts: List[str] = []
+    labels: List[bool] = []
+    weights: List[float] = []
+
+    fetcher = AsyncFetcher()
+    try:
+        for fetch_result in fetcher.iter_fetch(list(labels_by_url)):
+            if not fetch_result["html"] or fetch_result["error"]:
+                continue
+            text = extract_text_from_html(fetch_result["html"], max_chars=max_text_chars, keep_blocks=keep_blocks)
+            if not text:
+                continue
+            row = labels_by_url[fetch_result["url"]]
+            texts.append(text)
+            labels.append(bool(row["is_illegal"]))
+            weights.append(float(row["gemini_confidence"] or 0.5))
+    finally:
+        fetcher.close()
+    return texts, labels, weights
+
+
+def _fit_and_save(texts: List[str], labels: List[bool], weights: List[float],
+                  model_dir: str, holdout_ratio: float) -> Optional[str]:
+    """홀드아웃 평가 후 전체 데이터로 학습하여 모델 저장 (두 클래스가 모두 없으면 None)"""
+    print(f"📥 학습 데이터 {len(texts)}개 (불법 {sum(labels)}개)")
+    if len(set(labels)) < 2:
+        print("⚠️ 불법/합법 두 클래스가 모두 있어야 학습할 수 있습니다.")
+        return None
+
+    # 홀드아웃 정확도 측정 후 전체 데이터로 다시 학습
+    train_idx, holdout_idx = _split_holdout(len(texts), holdout_ratio)
+    holdout_accuracy = None
+    holdout_coverage = None
+    train_labels = [labels[i] for i in train_idx]
+    if len(holdout_idx) and len(set(train_labels)) == 2:
+        model = LocalTextClassifier().fit([texts[i] for i in train_idx], train_labels,
+                                          [weights[i] for i in train_idx])
+        probabilities = model.predict_proba([texts[i] for i in holdout_idx])
+        truth = np.array([labels[i] for i in holdout_idx])
+        holdout_accuracy = float(np.mean((probabilities >= 0.5) == truth))
+        decided = (probabilities >= model.high) | (probabilities <= model.low)
+        holdout_coverage = float(np.mean(decided))
+        print(f"📊 홀드아웃 정확도: {holdout_accuracy:.3f}, 로컬 판정 비율: {holdout_coverage:.3f}")
+
+    model = LocalTextClassifier().fit(texts, labels, weights)
+    model.metadata["holdout_accuracy"] = holdout_accuracy
+    model.metadata["holdout_local_decision_rate"] = holdout_coverage
+    path = model.save(model_dir)
+    print(f"✅ 모델 저장 완료: {path}")
+    return path
+
+
+def text_options_from_settings(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    크롤러의 GeminiClassifier.prepare_text와 같은 텍스트 추출 설정
+
+    본문 선택기를 쓰면 블록 구조를 남겨 content_max_scan_chars까지, 아니면 MAX_TEXT_CHARS까지 추출합니다.
+    """
+    from .gemini_classifier import MAX_TEXT_CHARS
+
+    if settings.get("content_selector_enabled", True):
+        return {"max_text_chars": settings.get("content_max_scan_chars", 200000), "keep_blocks": True}
+    return {"max_text_chars": MAX_TEXT_CHARS, "keep_blocks": False}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 텍스트 분류 모델 관리")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    train_parser = subcommands.add_parser("train", help="분류할 때 저장한 Gemini 판정 표본으로 모델 학습")
+    train_parser.add_argument("--model-dir", default="models", help="모델 저장 디렉터리")
+    train_parser.add_argument("--samples", default=None,
+                              help="학습 표본 파일 (기본값: 설정 파일의 training_samples_file)")
+    train_parser.add_argument("--include-database", action="store_true",
+                              help="gambling_urls의 기존 판정 결과도 URL을 다시 가져와 추가")
+    train_parser.add_argument("--limit", type=int, default=None, help="학습에 사용할 최대 행 수")
+    train_parser.add_argument("--holdout", type=float, default=0.2, help="홀드아웃 평가 비율")
+    train_parser.add_argument("--settings", default="settings.json",
+                              help="텍스트 추출 설정을 읽을 크롤러 설정 파일 (없으면 기본값)")
+
+    args = parser.parse_args()
+    if args.command == "train":
+        settings = {}
+        if os.path.exists(args.settings):
+            with open(args.settings, 'r', encoding='utf-8') as f:
+                settings = json.load(f)
+        samples_file = args.samples or settings.get("training_samples_file") or "training_samples.sqlite3"
+        train_from_samples(samples_file, args.model_dir, args.limit, args.holdout,
+                           include_database=args.include_database, **text_options_from_settings(settings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# 지연 시간 히스토그램 기본 구간 (초)
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _label_key(labels: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(label_key: Tuple[Tuple[str, str], ...], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(label_key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = [
+        f'{name}="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in pairs
+    ]
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    """증가만 하는 값 (검색 수, 오류 수, 가져온 바이트 수 등)"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._values: Dict[Tuple[Tuple[str, str], ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0)
+
+    def expose(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(key)} {_format_value(value)}" for key, value in values]
+
+    def to_dict(self) -> Dict[str, float]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return {_format_labels(key) or "total": value for key, value in values}
+
+
+class Histogram:
+    """값의 분포 (지연 시간 등): 구간별 누적 개수, 합계, 개수"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, description: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[Tuple[Tuple[str, str], ...], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series["counts"][i] += 1
+                    break
+            series["sum"] += value
+            series["count"] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록의 실행 시간(초)을 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _snapshot(self) -> List[Tuple[Tuple[Tuple[str, str], ...], List[int], float, int]]:
+        with self._lock:
+            return [(key, list(series["counts"]), series["sum"], series["count"])
+                    for key, series in sorted(self._values.items())]
+
+    def expose(self) -> List[str]:
+        lines = []
+        for key, counts, total, count in self._snapshot():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', _format_value(bound)))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, ('le', '+Inf'))} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        result = {}
+        for key, counts, total, count in self._snapshot():
+            cumulative = 0
+            buckets = {}
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                buckets[_format_value(bound)] = cumulative
+            buckets["+Inf"] = count
+            result[_format_labels(key) or "total"] = {
+                "count": count,
+                "sum": round(total, 6),
+                "avg": round(total / count, 6) if count else 0.0,
+                "p50": self._quantile(counts, count, 0.5),
+                "p99": self._quantile(counts, count, 0.99),
+                "buckets": buckets,
+            }
+        return result
+
+    def _quantile(self, counts: List[int], count: int, q: float) -> Optional[float]:
+        """구간 상한으로 추정한 분위수 (마지막 구간을 넘으면 None)"""
+        if not count:
+            return None
+        target = q * count
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return bound
+        return None
+
+
+class MetricsRegistry:
+    """지표 모음: Prometheus 텍스트 형식(/metrics)과 JSON으로 내보냄"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.started_at = datetime.now()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, description: str) -> Counter:
+        return self._register(Counter(name, description))
+
+    def histogram(self, name: str, description: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, description, buckets))
+
+    def expose(self) -> str:
+        """Prometheus 텍스트 형식"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            "started_at": self.started_at.isoformat(),
+            "generated_at": datetime.now().isoformat(),
+            "counters": {metric.name: metric.to_dict() for metric in metrics if metric.type_name == "counter"},
+            "histograms": {metric.name: metric.to_dict() for metric in metrics if metric.type_name == "histogram"},
+        }
+
+    def dump_json(self, file_path: str) -> None:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+REGISTRY = MetricsRegistry()
+
+# 검색 / 방문
+SEARCHES = REGISTRY.counter("crawler_searches_total", "Google 검색 수")
+SERP_LOAD_SECONDS = REGISTRY.histogram("crawler_serp_load_seconds", "검색 결과 페이지 로딩 시간 (검색 간격 대기 제외)")
+SEARCH_BLOCKS = REGISTRY.counter("crawler_search_blocks_total", "검색 중 CAPTCHA/차단 페이지를 만난 수 (kind: captcha)")
+PACING_WAIT_SECONDS = REGISTRY.counter("crawler_pacing_wait_seconds_total", "검색 요청 간격을 지키느라 대기한 시간 합계 (초)")
+PAGE_VISITS = REGISTRY.counter("crawler_page_visits_total", "검색 결과 링크 방문 수 (tier: http / browser)")
+PAGE_LOAD_SECONDS = REGISTRY.histogram("crawler_page_load_seconds", "검색 결과 링크 로딩 시간 (tier: http / browser)")
+BYTES_FETCHED = REGISTRY.counter("crawler_fetched_bytes_total", "가져온 페이지 크기 (tier: http / browser)")
+ERRORS = REGISTRY.counter("crawler_errors_total", "단계별 오류 수 (stage: search / visit / fetch / classify / storage)")
+
+# 브라우저 렌더링 프로파일
+BLOCKED_REQUESTS = REGISTRY.counter("crawler_blocked_requests_total", "렌더링 프로파일로 차단한 요청 수")
+BROWSER_TRANSFERRED_BYTES = REGISTRY.counter(
+    "crawler_browser_transferred_bytes_total", "브라우저 방문 시 실제로 전송된 바이트 (문서 + 하위 리소스)"
+)
+BYTES_SAVED = REGISTRY.counter(
+    "crawler_browser_bytes_saved_estimate_total", "차단으로 아낀 바이트 추정치 (차단 없이 로딩한 표본 기준)"
+)
+
+# 분류
+TEXT_EXTRACTION_SECONDS = REGISTRY.histogram(
+    "crawler_text_extraction_seconds", "HTML 텍스트 추출 시간",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+)
+CLASSIFICATIONS = REGISTRY.counter(
+    "crawler_classifications_total", "판정 경로별 분류 수 (path: cache / near_duplicate / prefilter / local_model / gemini)"
+)
+CACHE_HITS = REGISTRY.counter("crawler_classification_cache_hits_total", "분류 캐시 적중 수")
+LLM_CALL_SECONDS = REGISTRY.histogram("crawler_llm_call_seconds", "Gemini API 호출 한 번의 응답 시간")
+LLM_CALLS = REGISTRY.counter("crawler_llm_calls_total", "Gemini API 호출 수 (outcome: ok / error, 재시도마다 따로 셈)")
+PROMPT_CHARS = REGISTRY.counter("crawler_prompt_chars_total", "Gemini에 보낸 프롬프트 글자 수")
+DETECTIONS = REGISTRY.counter("crawler_detections_total", "불법 도박 사이트로 판정된 페이지 수")
+
+# 저장
+STORED_ROWS = REGISTRY.counter("crawler_stored_rows_total", "저장소에 기록한 행 수 (backend: json / postgres)")
+STORAGE_WRITE_SECONDS = REGISTRY.histogram("crawler_storage_write_seconds", "저장소 기록 시간 (backend: json / postgres)")
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?")[0] == "/metrics":
+            body = self.registry.expose().encode('utf-8')
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        elif self.path.split("?")[0] == "/metrics.json":
+            body = json.dumps(self.registry.to_dict(), ensure_ascii=False).encode('utf-8')
+            content_type = "application/json; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 요청마다 로그를 남기지 않음
+        pass
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """
+    /metrics (Prometheus 텍스트 형식)와 /metrics.json을 제공하는 HTTP 서버를 백그라운드 스레드로 시작합니다
+
+    Returns:
+        서버 객체 (종료할 때 shutdown() 호출)
+    """
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    print(f"📈 지표 서버 시작: http://{host}:{server.server_address[1]}/metrics")
+    return server
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+
+# 64비트 SimHash를 16비트씩 4개 밴드로 나눔.
+# 해밍 거리가 3 이하인 두 지문은 비둘기집 원리에 의해 최소 한 밴드가 완전히 일치하므로
+# 밴드 인덱스만으로 후보를 빠짐없이 찾을 수 있습니다.
+SIMHASH_BITS = 64
+BAND_COUNT = 4
+BAND_BITS = SIMHASH_BITS // BAND_COUNT
+BAND_MASK = (1 << BAND_BITS) - 1
+
+_WORD_PATTERN = re.compile(r'\w+')
+_BIT_SHIFTS = np.arange(SIMHASH_BITS, dtype=np.uint64)
+
+
+def _to_signed(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64비트)에 저장하기 위해 변환"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def simhash(text: str, shingle_size: int = 3) -> Optional[int]:
+    """
+    텍스트의 단어 n-gram(shingle) 빈도로 64비트 SimHash 지문을 계산합니다
+
+    Returns:
+        64비트 정수 지문 (단어가 없으면 None)
+    """
+    words = _WORD_PATTERN.findall(text.lower())
+    if not words:
+        return None
+
+    if len(words) < shingle_size:
+        shingles = Counter([" ".join(words)])
+    else:
+        shingles = Counter(
+            " ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)
+        )
+
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+         for shingle in shingles),
+        dtype=np.uint64, count=len(shingles)
+    )
+    weights = np.fromiter(shingles.values(), dtype=np.int64, count=len(shingles))
+
+    # 각 비트 위치마다 (비트가 1이면 +가중치, 0이면 -가중치)를 합산
+    bits = ((hashes[:, None] >> _BIT_SHIFTS) & np.uint64(1)).astype(np.int64)
+    totals = weights @ (bits * 2 - 1)
+
+    fingerprint = 0
+    for position in np.nonzero(totals > 0)[0]:
+        fingerprint |= 1 << int(position)
+    return fingerprint
+
+
+class NearDuplicateIndex:
+    """
+    SimHash 기반 유사(미러) 페이지 인덱스 (SQLite에 영구 저장)
+
+    분류가 끝난 페이지의 텍스트 지문을 클러스터 ID, 판정 결과와 함께 저장해 두고,
+    새 페이지의 지문과 해밍 거리가 max_distance 이하인 페이지가 있으면
+    같은 클러스터로 보고 그 판정을 상속합니다.
+    밴드별 인덱스로 후보만 조회하므로 10^6건 규모에서도 조회는 수 밀리초 안에 끝납니다.
+    """
+
+    def __init__(self, db_file: str = "near_duplicate_index.sqlite3", max_distance: int = 3,
+                 min_text_chars: int = 200):
+        # 밴드 방식은 BAND_COUNT - 1 까지의 거리만 빠짐없이 찾을 수 있음
+        self.max_distance = min(max_distance, BAND_COUNT - 1)
+        self.min_text_chars = min_text_chars
+        self._lock = threading.Lock()
+
+        self.connection = sqlite3.connect(db_file, check_same_thread=False)
+        # 후보를 잘라내기 전에 SQL 안에서 정확한 해밍 거리로 거르고 정렬하기 위한 함수
+        self.connection.create_function(
+            "hamming_distance", 2,
+            lambda a, b: hamming_distance(_to_unsigned(a), _to_unsigned(b)),
+            deterministic=True
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS near_duplicate_index (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                simhash INTEGER NOT NULL,
+                band0 INTEGER NOT NULL,
+                band1 INTEGER NOT NULL,
+                band2 INTEGER NOT NULL,
+                band3 INTEGER NOT NULL,
+                cluster_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                is_illegal INTEGER NOT NULL,
+                confidence REAL,
+                reason TEXT,
+                detected_keywords TEXT,
+                created_at REAL NOT NULL
+            )
+        """)
+        for band in range(BAND_COUNT):
+            self.connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_near_duplicate_band{band} ON near_duplicate_index(band{band})"
+            )
+        self.connection.commit()
+
+    def fingerprint(self, text: str) -> Optional[int]:
+        """인덱싱할 만큼 충분히 긴 텍스트면 SimHash 지문 반환, 아니면 None"""
+        if len(text) < self.min_text_chars:
+            return None
+        return simhash(text)
+
+    @staticmethod
+    def _bands(fingerprint: int) -> list:
+        return [(fingerprint >> (band * BAND_BITS)) & BAND_MASK for band in range(BAND_COUNT)]
+
+    def find_similar(self, fingerprint: int) -> Optional[Dict[str, Any]]:
+        """
+        지문과 가장 가까운 (해밍 거리 max_distance 이하) 인덱스 항목을 찾습니다
+
+        Returns:
+            {"cluster_id", "url", "is_illegal", "confidence", "reason", "detected_keywords", "distance"}
+            또는 None
+        """
+        # 흔한 밴드 값은 후보가 많으므로, 밴드가 일치하는 행을 모두 정확한 거리로 거른 뒤 가장 가까운 항목만 가져옴
+        bands = self._bands(fingerprint)
+        where = " OR ".join(f"band{band} = ?" for band in range(BAND_COUNT))
+        with self._lock:
+            row = self.connection.execute(
+                f"""
+                SELECT cluster_id, url, is_illegal, confidence, reason, detected_keywords,
+                       hamming_distance(simhash, ?) AS distance
+                FROM near_duplicate_index
+                WHERE ({where}) AND distance <= ?
+                ORDER BY distance, id
+                LIMIT 1
+                """,
+                (_to_signed(fingerprint), *bands, self.max_distance)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return {
+            "cluster_id": row[0],
+            "url": row[1],
+            "is_illegal": bool(row[2]),
+            "confidence": row[3],
+            "reason": row[4],
+            "detected_keywords": json.loads(row[5]) if row[5] else [],
+            "distance": row[6],
+        }
+
+    def add(self, fingerprint: int, url: str, result: Dict[str, Any], cluster_id: Optional[str] = None) -> str:
+        """
+        분류된 페이지를 인덱스에 추가합니다
+
+        Args:
+            fingerprint: 페이지 텍스트의 SimHash 지문
+            url: 페이지 URL
+            result: 분류 결과 (is_illegal, confidence, reason, detected_keywords)
+            cluster_id: 소속 클러스터 ID (None이면 유사 항목의 클러스터를 찾거나 새로 생성)
+
+        Returns:
+            페이지가 속한 클러스터 ID
+        """
+        if cluster_id is None:
+            similar = self.find_similar(fingerprint)
+            cluster_id = similar["cluster_id"] if similar else uuid.uuid4().hex[:16]
+
+        with self._lock:
+            self.connection.execute(
+                """
+                INSERT INTO near_duplicate_index (
+                    simhash, band0, band1, band2, band3, cluster_id, url,
+                    is_illegal, confidence, reason, detected_keywords, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    _to_signed(fingerprint), *self._bands(fingerprint), cluster_id, url,
+                    int(bool(result.get("is_illegal"))), result.get("confidence"), result.get("reason"),
+                    json.dumps(result.get("detected_keywords", []), ensure_ascii=False), time.time()
+                )
+            )
+            self.connection.commit()
+        return cluster_id
+
+    def count(self) -> int:
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM near_duplicate_index").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
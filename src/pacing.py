@@ -0,0 +1,172 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional
+
+from .metrics import SEARCH_BLOCKS, PACING_WAIT_SECONDS
+
+
+# 검색 결과 페이지 상태 확인 스크립트: 결과 영역이 있으면 "ok", CAPTCHA/차단 페이지면 "captcha", 아직 로딩 중이면 null
+SERP_STATE_SCRIPT = """
+if (location.pathname.indexOf('/sorry/') === 0
+        || document.querySelector('#captcha-form, .g-recaptcha, iframe[src*="recaptcha"]')) {
+    return 'captcha';
+}
+if (document.querySelector('div#search')) {
+    return 'ok';
+}
+return null;
+"""
+
+# 페이지 준비 상태 확인 스크립트: [document.readyState, 지금까지 요청한 하위 리소스 수]
+PAGE_STATE_SCRIPT = "return [document.readyState, performance.getEntriesByType('resource').length];"
+
+
+def wait_for_page_ready(driver, timeout: float = 10, idle_seconds: float = 0.5,
+                        poll_interval: float = 0.1) -> bool:
+    """
+    현재 페이지가 준비될 때까지 대기 (고정 시간 대신 DOM/네트워크 유휴 신호 사용)
+
+    document.readyState가 loading을 벗어나고, idle_seconds 동안 새 하위 리소스 요청이 없으면
+    (Performance API 리소스 항목 수가 그대로면) 준비된 것으로 봅니다.
+
+    Returns:
+        timeout 안에 준비됐는지 여부 (시간이 지나면 그때까지 로딩된 상태로 진행)
+    """
+    deadline = time.monotonic() + timeout
+    last_count = None
+    last_change = time.monotonic()
+    while True:
+        now = time.monotonic()
+        try:
+            ready_state, resource_count = driver.execute_script(PAGE_STATE_SCRIPT)
+        except Exception:
+            # 페이지 이동 중에는 스크립트 실행이 실패할 수 있음
+            ready_state, resource_count = "loading", None
+
+        if resource_count != last_count:
+            last_count = resource_count
+            last_change = now
+        elif ready_state != "loading" and now - last_change >= idle_seconds:
+            return True
+
+        if now >= deadline:
+            return False
+        time.sleep(min(poll_interval, max(0.0, deadline - now)))
+
+
+def wait_for_serp(driver, timeout: float = 10, poll_interval: float = 0.1) -> Optional[str]:
+    """
+    검색 결과 영역(div#search)이나 CAPTCHA/차단 페이지가 나타날 때까지 대기
+
+    Returns:
+        "ok" / "captcha" (timeout 안에 둘 다 나타나지 않으면 None)
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            state = driver.execute_script(SERP_STATE_SCRIPT)
+        except Exception:
+            state = None
+        if state:
+            return state
+        now = time.monotonic()
+        if now >= deadline:
+            return None
+        time.sleep(min(poll_interval, deadline - now))
+
+
+class SearchPacer:
+    """
+    Google 검색 요청 간격을 조절하는 AIMD 방식 속도 조절기 (스레드 안전)
+
+    요청 간격은 이전 요청을 보낸 시각부터 잽니다. 그 사이 링크 방문이나 분류에 쓴 시간도
+    간격에 포함되므로 따로 고정 대기를 더하지 않습니다.
+
+    - 검색이 성공하고 최근 window개 검색의 차단 비율이 target_block_rate 이하면
+      간격을 decrease_step초씩 줄임 (additive decrease, 최소 min_interval)
+    - CAPTCHA/차단 페이지가 나오면 간격을 backoff_factor배로 늘림 (multiplicative increase, 최대 max_interval)
+
+    실제 대기 시간에는 ±jitter 비율의 무작위 변동을 더해 요청 시각이 규칙적이지 않게 합니다.
+    """
+
+    def __init__(self, initial_interval: float = 5, min_interval: float = 2, max_interval: float = 120,
+                 decrease_step: float = 0.5, backoff_factor: float = 2.0, jitter: float = 0.3,
+                 target_block_rate: float = 0.02, window: int = 50, rng: Optional[random.Random] = None):
+        if min_interval > max_interval:
+            raise ValueError(f"min_interval({min_interval})이 max_interval({max_interval})보다 큽니다")
+        if backoff_factor <= 1:
+            raise ValueError(f"backoff_factor는 1보다 커야 합니다: {backoff_factor}")
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min(max(initial_interval, min_interval), max_interval)
+        self.decrease_step = decrease_step
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.target_block_rate = target_block_rate
+        self.rng = rng or random.Random()
+
+        self._lock = threading.Lock()
+        self._last_request = None
+        # 최근 검색 결과 (True: 차단됨)
+        self._recent = deque(maxlen=window)
+        self.consecutive_blocks = 0
+        self.stats = {"requests": 0, "successes": 0, "blocks": 0, "waited_seconds": 0.0}
+
+    def wait(self) -> float:
+        """
+        다음 검색 요청을 보내도 될 때까지 대기한 뒤 요청 시각을 기록합니다
+
+        Returns:
+            대기한 시간 (초)
+        """
+        with self._lock:
+            interval = self.interval * (1 + self.rng.uniform(-self.jitter, self.jitter))
+            waited = 0.0
+            if self._last_request is not None:
+                waited = max(0.0, self._last_request + interval - time.monotonic())
+            # 다른 스레드도 이 시각 이후로 요청하도록 미리 기록
+            self._last_request = time.monotonic() + waited
+            self.stats["requests"] += 1
+            self.stats["waited_seconds"] += waited
+
+        if waited > 0:
+            PACING_WAIT_SECONDS.inc(waited)
+            time.sleep(waited)
+        return waited
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._recent.append(False)
+            self.consecutive_blocks = 0
+            self.stats["successes"] += 1
+            if self._block_rate() <= self.target_block_rate:
+                self.interval = max(self.min_interval, self.interval - self.decrease_step)
+
+    def record_block(self, kind: str = "captcha") -> float:
+        """
+        CAPTCHA/차단 발생을 기록하고 요청 간격을 늘립니다
+
+        Returns:
+            늘어난 요청 간격 (초)
+        """
+        with self._lock:
+            self._recent.append(True)
+            self.consecutive_blocks += 1
+            self.stats["blocks"] += 1
+            self.interval = min(self.max_interval, self.interval * self.backoff_factor)
+            interval = self.interval
+        SEARCH_BLOCKS.inc(kind=kind)
+        return interval
+
+    def _block_rate(self) -> float:
+        return sum(self._recent) / len(self._recent) if self._recent else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["interval"] = self.interval
+            stats["recent_block_rate"] = self._block_rate()
+        return stats
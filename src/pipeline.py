@@ -0,0 +1,174 @@
+import queue
+import threading
+import time
+from typing import Callable, Dict, Any, Iterable, List, Optional
+
+
+# 작업자 스레드 종료 신호
+_STOP = object()
+
+
+class PipelineStage:
+    """
+    파이프라인의 한 단계: 제한된 크기의 입력 큐와 작업자 스레드들
+
+    handler(item)는 다음 단계로 넘길 항목들의 iterable을 반환합니다 (빈 리스트면 여기서 끝).
+    입력 큐가 가득 차면 이전 단계의 put이 대기하므로, 느린 단계가 앞 단계의 속도를 자연스럽게 늦춥니다 (backpressure).
+    """
+
+    def __init__(self, name: str, handler: Callable[[Any], Iterable[Any]], workers: int = 1,
+                 queue_size: int = 100, on_error: Optional[Callable[[Any, Exception], None]] = None):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_size))
+        self.on_error = on_error
+        self.next_stage: Optional["PipelineStage"] = None
+        self.pipeline: Optional["Pipeline"] = None
+
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self.stats = {"processed": 0, "errors": 0, "busy": 0, "busy_seconds": 0.0}
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"pipeline-{self.name}-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """남은 항목을 모두 처리한 뒤 작업자 스레드 종료 (이전 단계가 먼저 멈춰 있어야 함)"""
+        for _ in self._threads:
+            self.queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        stats["queued"] = self.queue.qsize()
+        stats["capacity"] = self.queue.maxsize
+        stats["workers"] = self.workers
+        return stats
+
+    def _run(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                return
+
+            with self._lock:
+                self.stats["busy"] += 1
+            started = time.monotonic()
+            outputs = []
+            error = None
+            try:
+                outputs = list(self.handler(item) or [])
+            except Exception as e:
+                error = e
+            elapsed = time.monotonic() - started
+
+            with self._lock:
+                self.stats["busy"] -= 1
+                self.stats["busy_seconds"] += elapsed
+                self.stats["processed"] += 1
+                if error is not None:
+                    self.stats["errors"] += 1
+
+            if error is not None:
+                if self.on_error:
+                    self.on_error(item, error)
+                else:
+                    print(f"  ❌ [{self.name}] 처리 오류: {error}")
+                self.pipeline.item_done(item, error)
+            elif self.next_stage is None or not outputs:
+                # 마지막 단계를 지났거나 이 단계에서 걸러진 항목
+                self.pipeline.item_done(item, None)
+            else:
+                for output in outputs:
+                    self.next_stage.queue.put(output)
+
+
+class Pipeline:
+    """
+    제한된 크기의 큐로 이어진 단계별 생산자/소비자 파이프라인
+
+    각 단계는 자기 작업자 수만큼 동시에 항목을 처리하고, 결과를 다음 단계의 큐에 넣습니다.
+    close()는 앞 단계부터 차례로 남은 항목을 모두 처리한 뒤 작업자를 종료합니다.
+    report_interval초마다 단계별 큐 깊이와 바쁜 작업자 수를 출력하여 병목 단계를 보여 줍니다.
+
+    사용 예:
+        pipeline = Pipeline(on_item_done=finish)
+        pipeline.add_stage("fetch", fetch, workers=4)
+        pipeline.add_stage("store", store)
+        pipeline.start()
+        for url in urls:
+            pipeline.put(url)
+        pipeline.close()
+    """
+
+    def __init__(self, on_item_done: Optional[Callable[[Any, Optional[Exception]], None]] = None,
+                 report_interval: float = 30):
+        self.stages: List[PipelineStage] = []
+        self.on_item_done = on_item_done
+        self.report_interval = report_interval
+        self._reporter: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+
+    def add_stage(self, name: str, handler: Callable[[Any], Iterable[Any]], workers: int = 1,
+                  queue_size: int = 100, on_error: Optional[Callable[[Any, Exception], None]] = None) -> PipelineStage:
+        stage = PipelineStage(name, handler, workers, queue_size, on_error)
+        stage.pipeline = self
+        if self.stages:
+            self.stages[-1].next_stage = stage
+        self.stages.append(stage)
+        return stage
+
+    def start(self) -> None:
+        for stage in self.stages:
+            stage.start()
+        if self.report_interval:
+            self._reporter = threading.Thread(target=self._report_loop, name="pipeline-reporter", daemon=True)
+            self._reporter.start()
+
+    def put(self, item: Any) -> None:
+        """첫 단계에 항목 추가 (첫 단계 큐가 가득 차면 대기)"""
+        self.stages[0].queue.put(item)
+
+    def item_done(self, item: Any, error: Optional[Exception]) -> None:
+        """항목이 파이프라인을 벗어날 때 호출 (마지막 단계 완료, 중간 단계에서 걸러짐, 오류)"""
+        if not self.on_item_done:
+            return
+        try:
+            self.on_item_done(item, error)
+        except Exception as e:
+            # 완료 처리 오류로 작업자 스레드가 죽지 않도록 함
+            print(f"  ❌ 파이프라인 완료 처리 오류: {e}")
+
+    def close(self) -> None:
+        """앞 단계부터 남은 항목을 모두 처리하고 작업자 종료"""
+        for stage in self.stages:
+            stage.stop()
+        self._closed.set()
+        if self._reporter:
+            self._reporter.join()
+        self.print_report(final=True)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 통계 {단계 이름: {"queued", "capacity", "workers", "busy", "processed", "errors", "busy_seconds"}}"""
+        return {stage.name: stage.get_stats() for stage in self.stages}
+
+    def print_report(self, final: bool = False) -> None:
+        parts = []
+        for name, stats in self.get_stats().items():
+            if final:
+                parts.append(f"{name} {stats['processed']}개 ({stats['busy_seconds']:.0f}초)")
+            else:
+                parts.append(f"{name} {stats['queued']}/{stats['capacity']} (작업 중 {stats['busy']}/{stats['workers']})")
+        label = "📦 파이프라인 처리량" if final else "📦 파이프라인 큐"
+        print(f"  {label}: " + " → ".join(parts))
+
+    def _report_loop(self) -> None:
+        while not self._closed.wait(self.report_interval):
+            self.print_report()
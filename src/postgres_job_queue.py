@@ -0,0 +1,184 @@
+from typing import List, Dict, Any, Optional, Iterable
+
+from psycopg2.extras import Json, execute_values
+
+from .database import DatabaseManager
+from .job_queue import JobQueue
+
+
+class PostgresJobQueue(JobQueue):
+    """
+    기존 데이터베이스의 crawl_jobs 테이블을 사용하는 작업 대기열
+
+    claim은 SELECT ... FOR UPDATE SKIP LOCKED로 다른 작업자가 잠근 행을 건너뛰므로
+    작업자가 늘어나도 서로 기다리지 않고 각자 다른 작업을 가져갑니다.
+    시각 비교는 모두 데이터베이스의 now()를 사용하므로 서버 간 시계 차이의 영향을 받지 않습니다.
+    """
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, lease_seconds: float = 300,
+                 max_attempts: int = 3, retry_delay: float = 60):
+        super().__init__(lease_seconds, max_attempts, retry_delay)
+        self.db = db_manager or DatabaseManager()
+        if self.db.pool is None:
+            self.db.connect()
+        self.create_table()
+
+    def create_table(self) -> None:
+        with self.db.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_jobs (
+                    id BIGSERIAL PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    priority INTEGER NOT NULL DEFAULT 0,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    available_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                    lease_owner TEXT,
+                    lease_expires_at TIMESTAMPTZ,
+                    last_error TEXT,
+                    result JSONB,
+                    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                    UNIQUE (kind, key)
+                );
+            """)
+            # 대기 중인 작업을 우선순위 순으로 찾기 위한 부분 인덱스
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_crawl_jobs_queued
+                ON crawl_jobs (kind, priority DESC, available_at, id) WHERE status = 'queued';
+            """)
+            # 만료된 임대를 찾기 위한 부분 인덱스
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_crawl_jobs_leased
+                ON crawl_jobs (lease_expires_at) WHERE status = 'leased';
+            """)
+
+    def enqueue(self, kind: str, keys: Iterable[str], priority: int = 0, requeue_done: bool = False) -> int:
+        rows = [(kind, key, priority) for key in dict.fromkeys(keys)]
+        if not rows:
+            return 0
+
+        conflict_action = "DO NOTHING"
+        if requeue_done:
+            conflict_action = """
+                DO UPDATE SET status = 'queued', attempts = 0, priority = EXCLUDED.priority,
+                    available_at = now(), last_error = NULL, updated_at = now()
+                WHERE crawl_jobs.status IN ('done', 'dead')
+            """
+        with self.db.get_connection() as connection, connection.cursor() as cursor:
+            results = execute_values(
+                cursor,
+                f"INSERT INTO crawl_jobs (kind, key, priority) VALUES %s ON CONFLICT (kind, key) {conflict_action} "
+                "RETURNING id",
+                rows,
+                page_size=1000,
+                fetch=True
+            )
+        return len(results)
+
+    def claim(self, worker_id: str, kinds: Iterable[str] = ("keyword", "url"), limit: int = 1) -> List[Dict[str, Any]]:
+        self.requeue_expired()
+        with self.db.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                """
+                WITH next_jobs AS (
+                    SELECT id FROM crawl_jobs
+                    WHERE status = 'queued' AND kind = ANY(%s) AND available_at <= now()
+                    ORDER BY priority DESC, available_at, id
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE crawl_jobs
+                SET status = 'leased', lease_owner = %s, attempts = attempts + 1,
+                    lease_expires_at = now() + %s * INTERVAL '1 second', updated_at = now()
+                FROM next_jobs
+                WHERE crawl_jobs.id = next_jobs.id
+                RETURNING crawl_jobs.id, crawl_jobs.kind, crawl_jobs.key, crawl_jobs.attempts
+                """,
+                (list(kinds), limit, worker_id, self.lease_seconds)
+            )
+            rows = cursor.fetchall()
+        return [{"id": row[0], "kind": row[1], "key": row[2], "attempts": row[3]} for row in rows]
+
+    def heartbeat(self, job_ids: List[int], worker_id: str) -> int:
+        with self.db.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE crawl_jobs
+                SET lease_expires_at = now() + %s * INTERVAL '1 second', updated_at = now()
+                WHERE id = ANY(%s) AND status = 'leased' AND lease_owner = %s
+                """,
+                (self.lease_seconds, list(job_ids), worker_id)
+            )
+            return cursor.rowcount
+
+    def ack(self, job_id: int, worker_id: str, result: Optional[Dict[str, Any]] = None) -> bool:
+        with self.db.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE crawl_jobs
+                SET status = 'done', result = %s, last_error = NULL,
+                    lease_owner = NULL, lease_expires_at = NULL, updated_at = now()
+                WHERE id = %s AND status = 'leased' AND lease_owner = %s
+                """,
+                (Json(result) if result is not None else None, job_id, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> bool:
+        with self.db.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE crawl_jobs
+                SET status = CASE WHEN attempts >= %s THEN 'dead' ELSE 'queued' END,
+                    available_at = now() + %s * INTERVAL '1 second', last_error = %s,
+                    lease_owner = NULL, lease_expires_at = NULL, updated_at = now()
+                WHERE id = %s AND status = 'leased' AND lease_owner = %s
+                """,
+                (self.max_attempts, self.retry_delay, error, job_id, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def release(self, job_id: int, worker_id: str, error: str, delay: float = 0) -> bool:
+        with self.db.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE crawl_jobs
+                SET status = 'queued', attempts = GREATEST(attempts - 1, 0),
+                    available_at = now() + %s * INTERVAL '1 second', last_error = %s,
+                    lease_owner = NULL, lease_expires_at = NULL, updated_at = now()
+                WHERE id = %s AND status = 'leased' AND lease_owner = %s
+                """,
+                (delay, error, job_id, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def requeue_expired(self) -> int:
+        with self.db.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE crawl_jobs
+                SET status = CASE WHEN attempts >= %s THEN 'dead' ELSE 'queued' END,
+                    last_error = '임대 만료 (' || COALESCE(lease_owner, '') || ')',
+                    lease_owner = NULL, lease_expires_at = NULL, available_at = now(), updated_at = now()
+                WHERE status = 'leased' AND lease_expires_at < now()
+                """,
+                (self.max_attempts,)
+            )
+            return cursor.rowcount
+
+    def get_counts(self) -> Dict[str, Dict[str, int]]:
+        with self.db.get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute("SELECT kind, status, COUNT(*) FROM crawl_jobs GROUP BY kind, status")
+            rows = cursor.fetchall()
+        counts: Dict[str, Dict[str, int]] = {}
+        for kind, status, count in rows:
+            counts.setdefault(kind, {})[status] = count
+        return counts
+
+    def describe(self) -> str:
+        return "PostgreSQL crawl_jobs"
+
+    def close(self) -> None:
+        self.db.disconnect()
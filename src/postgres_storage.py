@@ -0,0 +1,185 @@
+import json
+import os
+import queue
+import threading
+import time
+from typing import List, Dict, Any, Optional
+
+from .database import DatabaseManager
+from .metrics import STORED_ROWS, STORAGE_WRITE_SECONDS, ERRORS
+from .storage import ResultStorage
+
+
+class PostgresStorage(ResultStorage):
+    """
+    분류 결과를 gambling_urls 테이블에 바로 기록하는 저장소
+
+    save_results는 항목을 제한된 크기의 큐에 넣고 바로 반환하며,
+    백그라운드 스레드가 batch_size개가 모이거나 flush_interval초가 지나면
+    DatabaseManager.bulk_upsert_url_data로 한 번에 반영합니다.
+
+    - 큐가 가득 차면(max_pending) DB가 따라올 때까지 save_results가 대기합니다 (backpressure)
+    - 반영에 max_retries번 실패한 배치는 spill_file(JSONL)에 남겨 나중에 import_from_json으로 옮길 수 있게 합니다
+    - DB가 형식 오류 등으로 거부한 행은 다시 넣어도 실패하므로 spill_file이 아닌
+      rejected_file(<spill_file>.rejected.jsonl)에 오류 메시지와 함께 따로 남깁니다
+    """
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, batch_size: int = 500,
+                 flush_interval: float = 5.0, max_pending: int = 10000,
+                 spill_file: str = "results_spill.jsonl", max_retries: int = 3):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spill_file = spill_file
+        self.rejected_file = os.path.splitext(spill_file)[0] + ".rejected.jsonl"
+        self.max_retries = max_retries
+
+        self.db = db_manager or DatabaseManager()
+        if self.db.pool is None:
+            self.db.connect()
+        self.db.create_tables()
+
+        # 중복 확인용 URL 집합 (시작 시 한 번만 읽고 이후에는 메모리에서 갱신)
+        self._existing_urls = self.db.get_all_urls()
+
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self.stats = {"queued": 0, "flushed": 0, "failed": 0, "spilled": 0, "rejected": 0, "flushes": 0}
+
+        self._thread = threading.Thread(target=self._run, name="postgres-storage", daemon=True)
+        self._thread.start()
+
+    def save_results(self, urls: List[str], keyword: str, classification_results: List[Dict[str, Any]] = None) -> None:
+        new_entries = self.build_entries(urls, keyword, classification_results)
+
+        waited = time.monotonic()
+        for entry in new_entries:
+            self._queue.put(entry)
+        waited = time.monotonic() - waited
+        if waited > 1.0:
+            print(f"  ⏳ DB 저장 대기열이 가득 차 {waited:.1f}초 대기했습니다.")
+
+        self._existing_urls.update(urls)
+        with self._lock:
+            self.stats["queued"] += len(new_entries)
+
+        print(f"  💾 {len(new_entries)}개 URL 저장 대기열 추가 (키워드: '{keyword}')")
+
+    def get_existing_urls(self) -> set:
+        return set(self._existing_urls)
+
+    def flush(self) -> None:
+        """대기열의 모든 항목이 반영(또는 spill)될 때까지 대기"""
+        self._queue.join()
+
+    def get_stats(self) -> Dict[str, Any]:
+        self.flush()
+        statistics = self.db.get_statistics()
+        keywords = self.db.get_keywords_used()
+        return {
+            "total_entries": statistics["total_urls"],
+            "unique_urls": statistics["total_urls"],
+            "keywords_used": len(keywords),
+            "keywords": keywords
+        }
+
+    def describe(self) -> str:
+        with self._lock:
+            stats = dict(self.stats)
+        description = f"PostgreSQL gambling_urls (반영 {stats['flushed']}행, {stats['flushes']}회)"
+        if stats["failed"]:
+            description += f", 실패 {stats['failed']}행"
+        if stats["spilled"]:
+            description += f", {self.spill_file}에 {stats['spilled']}행 보관"
+        if stats["rejected"]:
+            description += f", 거부된 {stats['rejected']}행은 {self.rejected_file}에 기록"
+        return description
+
+    def close(self) -> None:
+        """남은 항목을 모두 반영하고 백그라운드 스레드와 DB 연결 종료"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self.db.disconnect()
+
+    def _run(self) -> None:
+        """대기열에서 항목을 모아 크기/시간 조건을 만족하면 반영하는 백그라운드 루프"""
+        batch: List[Dict[str, Any]] = []
+        deadline = None
+        stopping = False
+
+        while not stopping:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                entry = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                entry = None
+            else:
+                if entry is None:
+                    stopping = True
+                    self._queue.task_done()
+                else:
+                    batch.append(entry)
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+
+            if batch and (stopping or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                try:
+                    self._flush_batch(batch)
+                except Exception as e:
+                    # 보관(spill)까지 실패해도 대기 중인 flush()/close()가 멈추지 않도록 계속 진행
+                    print(f"  ❌ {len(batch)}행 저장 실패: {e}")
+                    with self._lock:
+                        self.stats["failed"] += len(batch)
+                for _ in batch:
+                    self._queue.task_done()
+                batch = []
+                deadline = None
+
+    def _flush_batch(self, batch: List[Dict[str, Any]]) -> None:
+        for attempt in range(self.max_retries):
+            try:
+                with STORAGE_WRITE_SECONDS.time(backend="postgres"):
+                    result = self.db.bulk_upsert_url_data(batch, chunk_size=self.batch_size)
+            except Exception as e:
+                # 연결 끊김 등: 잠시 후 재시도
+                ERRORS.inc(stage="storage")
+                print(f"  ⚠️ DB 반영 실패 ({attempt + 1}/{self.max_retries}): {e}")
+                time.sleep(min(30, 2 ** attempt))
+                continue
+
+            with self._lock:
+                self.stats["flushed"] += result["upserted"]
+                self.stats["failed"] += result["failed"]
+                self.stats["flushes"] += 1
+            STORED_ROWS.inc(result["upserted"], backend="postgres")
+            if result["rejected"]:
+                # 형식 오류 등으로 DB가 거부한 행은 재시도해도 실패하므로 spill_file에 넣지 않고 따로 기록
+                self._write_rejected(result["rejected"], dict(result["bad_rows"]))
+            return
+
+        self._spill(batch)
+
+    def _spill(self, batch: List[Dict[str, Any]]) -> None:
+        """DB에 반영하지 못한 배치를 JSONL 파일에 보관"""
+        with open(self.spill_file, 'a', encoding='utf-8') as f:
+            for entry in batch:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        with self._lock:
+            self.stats["spilled"] += len(batch)
+        print(f"  🗂️ DB에 반영하지 못한 {len(batch)}행을 {self.spill_file}에 보관했습니다.")
+
+    def _write_rejected(self, rejected: List[Dict[str, Any]], errors: Dict[str, str]) -> None:
+        """DB가 거부한 행을 오류 메시지와 함께 rejected_file(JSONL)에 기록"""
+        ERRORS.inc(len(rejected), stage="storage")
+        with open(self.rejected_file, 'a', encoding='utf-8') as f:
+            for entry in rejected:
+                record = dict(entry) if isinstance(entry, dict) else {"entry": entry}
+                record["rejected_error"] = errors.get(record.get("url"))
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        with self._lock:
+            self.stats["rejected"] += len(rejected)
+        print(f"  🚫 DB가 거부한 {len(rejected)}행을 {self.rejected_file}에 기록했습니다.")
@@ -0,0 +1,128 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    토큰 버킷 기반 속도 제한기 (스레드 안전)
+
+    분당 rate_per_minute개의 토큰이 일정한 속도로 채워지며,
+    버킷 크기(capacity)만큼 순간적으로 몰아서 사용할 수 있습니다.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._last_refill = now
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """
+        amount개의 토큰을 사용할 수 있을 때까지 대기한 뒤 차감합니다
+
+        Returns:
+            대기한 시간 (초)
+        """
+        # 버킷 크기보다 큰 요청은 버킷을 가득 채운 만큼만 기다림
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                wait_time = (amount - self._tokens) / self.rate_per_second
+            time.sleep(wait_time)
+            waited += wait_time
+
+
+class QuotaLimiter:
+    """분당 요청 수(RPM)와 분당 토큰 수(TPM) 할당량을 함께 지키는 제한기"""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: Optional[float] = None):
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    def acquire(self, tokens: float = 0) -> float:
+        """요청 1회와 tokens개의 토큰 할당량을 확보합니다 (대기한 시간 반환)"""
+        waited = self.request_bucket.acquire(1)
+        if self.token_bucket and tokens:
+            waited += self.token_bucket.acquire(tokens)
+        return waited
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않을 때 발생하는 예외"""
+    pass
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold번 발생하면 cooldown초 동안 요청을 차단하는 서킷 브레이커
+
+    - closed: 정상 상태, 모든 요청 허용
+    - open: 차단 상태, cooldown이 지날 때까지 모든 요청 거부
+    - half_open: cooldown 이후 시험 요청 1건만 허용, 성공하면 closed, 실패하면 다시 open
+      (시험 요청 결과가 cooldown초 안에 기록되지 않으면 잃어버린 것으로 보고 새 시험 요청 허용)
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """지금 요청을 보내도 되는지 확인합니다"""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    return False
+                self.state = "half_open"
+                self._trial_in_flight = False
+            # half_open: 시험 요청은 한 번에 하나만
+            if self._trial_in_flight and time.monotonic() - self._trial_started_at < self.cooldown:
+                return False
+            self._trial_in_flight = True
+            self._trial_started_at = time.monotonic()
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self.state = "closed"
+
+    def release_trial(self):
+        """
+        서비스 상태와 무관한 오류(안전 필터 차단 등)로 끝난 요청 기록
+
+        연속 실패 횟수에는 넣지 않고, half_open 시험 요청이었다면 다음 시험 요청을 허용합니다.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                if self.state != "open":
+                    print(f"  🔌 서킷 브레이커 열림: {self.cooldown:.0f}초 동안 요청 중단 (연속 실패 {self._failures}회)")
+                self.state = "open"
+                self._opened_at = time.monotonic()
@@ -0,0 +1,209 @@
+import json
+import random
+import threading
+from fnmatch import fnmatch
+from typing import Dict, Any, Iterable, Optional
+
+from .metrics import BLOCKED_REQUESTS, BROWSER_TRANSFERRED_BYTES, BYTES_SAVED
+
+
+# 리소스 종류별 차단 URL 패턴 (Network.setBlockedURLs 와일드카드 형식)
+RESOURCE_TYPE_PATTERNS = {
+    "image": [".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg", ".ico", ".bmp"],
+    "font": [".woff", ".woff2", ".ttf", ".otf", ".eot"],
+    "media": [".mp4", ".webm", ".m3u8", ".mp3", ".ogg", ".wav", ".mov", ".avi", ".flv"],
+    "stylesheet": [".css"],
+}
+
+# 광고/추적/채팅 위젯/동영상 임베드 등 텍스트와 무관한 외부 호스트
+DEFAULT_BLOCKED_HOSTS = [
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com", "google-analytics.com",
+    "googletagmanager.com", "adservice.google.com", "facebook.net", "connect.facebook.com",
+    "criteo.com", "criteo.net", "taboola.com", "outbrain.com", "scorecardresearch.com", "hotjar.com",
+    "youtube.com/embed", "player.vimeo.com", "livechatinc.com", "tawk.to", "channel.io", "zopim.com",
+]
+
+
+class RenderProfile:
+    """
+    브라우저 렌더링 프로파일: 텍스트 추출에 필요 없는 리소스를 차단하고 eager 로딩 전략 사용
+
+    Chrome DevTools의 Network.setBlockedURLs로 이미지/폰트/동영상 등 리소스 종류(확장자)와
+    광고/추적 호스트 요청을 차단합니다. 차단은 탭(target)마다 적용되므로 새 탭은 apply()를 다시 호출해야 합니다.
+
+    방문마다 Chrome 성능 로그(Network 이벤트)로 전송 바이트와 차단 요청 수를 계산하고,
+    baseline_sample_rate 비율의 방문은 차단 없이 로딩하여 "차단됐을 요청"의 평균 크기를 측정한 뒤
+    이를 바탕으로 페이지당 절약한 바이트를 추정합니다.
+    """
+
+    def __init__(self, blocked_resource_types: Iterable[str] = ("image", "media", "font"),
+                 blocked_hosts: Iterable[str] = tuple(DEFAULT_BLOCKED_HOSTS),
+                 extra_blocked_patterns: Iterable[str] = (), page_load_strategy: str = "eager",
+                 baseline_sample_rate: float = 0.05, rng: Optional[random.Random] = None):
+        unknown = [t for t in blocked_resource_types if t not in RESOURCE_TYPE_PATTERNS]
+        if unknown:
+            raise ValueError(f"알 수 없는 리소스 종류: {', '.join(unknown)} (가능: {', '.join(RESOURCE_TYPE_PATTERNS)})")
+
+        self.blocked_resource_types = list(blocked_resource_types)
+        self.blocked_hosts = list(blocked_hosts)
+        self.page_load_strategy = page_load_strategy
+        self.baseline_sample_rate = baseline_sample_rate
+        self.rng = rng or random.Random()
+
+        patterns = []
+        for resource_type in self.blocked_resource_types:
+            for extension in RESOURCE_TYPE_PATTERNS[resource_type]:
+                # 쿼리 문자열이 붙은 URL도 차단 (예: logo.png?v=3)
+                patterns += [f"*{extension}", f"*{extension}?*"]
+        patterns += [f"*{host}/*" if "/" not in host else f"*{host}*" for host in self.blocked_hosts]
+        patterns += list(extra_blocked_patterns)
+        self.blocked_url_patterns = patterns
+
+        self._lock = threading.Lock()
+        # 표본 방문으로 차단을 해제한 드라이버 (방문 도중 예외가 나면 다음 방문 전에 다시 차단)
+        self._unblocked = set()
+        self.stats = {
+            "visits": 0, "sampled_visits": 0, "transferred_bytes": 0, "blocked_requests": 0,
+            "bytes_saved_estimate": 0, "sampled_blockable_requests": 0, "sampled_blockable_bytes": 0,
+        }
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> Optional["RenderProfile"]:
+        """설정으로 프로파일 생성 (render_profile_enabled가 false면 None)"""
+        if not settings.get("render_profile_enabled", False):
+            return None
+        return cls(
+            blocked_resource_types=settings.get("render_blocked_resource_types", ["image", "media", "font"]),
+            blocked_hosts=settings.get("render_blocked_hosts", DEFAULT_BLOCKED_HOSTS),
+            extra_blocked_patterns=settings.get("render_extra_blocked_patterns", []),
+            page_load_strategy=settings.get("render_page_load_strategy", "eager"),
+            baseline_sample_rate=settings.get("render_baseline_sample_rate", 0.05),
+        )
+
+    def configure_options(self, chrome_options) -> None:
+        """Chrome 옵션에 로딩 전략과 성능 로그(Network 이벤트 수집) 설정"""
+        chrome_options.page_load_strategy = self.page_load_strategy
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    def apply(self, driver, blocking: bool = True) -> bool:
+        """현재 탭에 요청 차단 적용 (blocking=False면 해제). DevTools를 쓸 수 없는 드라이버면 False"""
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_url_patterns if blocking else []})
+            return True
+        except Exception:
+            return False
+
+    def is_blockable(self, url: str) -> bool:
+        return any(fnmatch(url, pattern) for pattern in self.blocked_url_patterns)
+
+    def begin_visit(self, driver, sample: bool = True) -> bool:
+        """
+        방문 직전에 호출: 이전 로그를 비우고, 표본으로 뽑히면 이번 방문은 차단 없이 로딩
+        (sample=False면 표본으로 뽑지 않음, 여러 탭을 동시에 여는 경우 등)
+
+        Returns:
+            이번 방문이 차단 없이 로딩하는 표본인지 여부 (end_visit에 전달)
+        """
+        self._read_network_log(driver)
+        sampled = sample and self.baseline_sample_rate > 0 and self.rng.random() < self.baseline_sample_rate
+        with self._lock:
+            was_unblocked = id(driver) in self._unblocked
+        if sampled:
+            if not self.apply(driver, blocking=False):
+                return False
+            with self._lock:
+                self._unblocked.add(id(driver))
+        elif was_unblocked:
+            self._restore_blocking(driver)
+        return sampled
+
+    def _restore_blocking(self, driver) -> None:
+        self.apply(driver, blocking=True)
+        with self._lock:
+            self._unblocked.discard(id(driver))
+
+    def end_visit(self, driver, sampled: bool = False, pages: int = 1) -> Optional[Dict[str, Any]]:
+        """
+        방문(또는 여러 탭 동시 방문) 직후 호출: 전송 바이트, 차단 요청 수, 절약 바이트 추정치 계산
+
+        Returns:
+            {"transferred_bytes", "blocked_requests", "bytes_saved_estimate", "sampled"} (로그를 읽을 수 없으면 None)
+        """
+        log = self._read_network_log(driver)
+        if sampled:
+            self._restore_blocking(driver)
+        if log is None:
+            return None
+
+        with self._lock:
+            self.stats["visits"] += pages
+            self.stats["transferred_bytes"] += log["transferred_bytes"]
+            if sampled:
+                self.stats["sampled_visits"] += pages
+                self.stats["sampled_blockable_requests"] += log["blockable_requests"]
+                self.stats["sampled_blockable_bytes"] += log["blockable_bytes"]
+            average = (self.stats["sampled_blockable_bytes"] / self.stats["sampled_blockable_requests"]
+                       if self.stats["sampled_blockable_requests"] else None)
+            saved = int(log["blocked_requests"] * average) if average is not None else None
+            self.stats["blocked_requests"] += log["blocked_requests"]
+            self.stats["bytes_saved_estimate"] += saved or 0
+
+        BLOCKED_REQUESTS.inc(log["blocked_requests"])
+        BROWSER_TRANSFERRED_BYTES.inc(log["transferred_bytes"])
+        if saved:
+            BYTES_SAVED.inc(saved)
+        return {
+            "transferred_bytes": log["transferred_bytes"],
+            "blocked_requests": log["blocked_requests"],
+            "bytes_saved_estimate": saved,
+            "sampled": sampled,
+        }
+
+    @staticmethod
+    def format_report(report: Optional[Dict[str, Any]], pages: int = 1) -> str:
+        if not report:
+            return ""
+        per_page = f" (페이지당 평균, {pages}개 탭)" if pages > 1 else ""
+        transferred = report["transferred_bytes"] / pages / 1024
+        if report["sampled"]:
+            return f"🪶 전송 {transferred:.0f}KB (차단 없이 로딩한 표본){per_page}"
+        saved = report["bytes_saved_estimate"]
+        saved_note = f", 약 {saved / pages / 1024:.0f}KB 절약" if saved is not None else ""
+        return f"🪶 전송 {transferred:.0f}KB, 차단 요청 {report['blocked_requests'] // pages}개{saved_note}{per_page}"
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        blocked_visits = stats["visits"] - stats["sampled_visits"]
+        stats["bytes_saved_per_page"] = stats["bytes_saved_estimate"] / blocked_visits if blocked_visits else 0
+        return stats
+
+    def _read_network_log(self, driver) -> Optional[Dict[str, int]]:
+        """성능 로그의 Network 이벤트를 읽어 비우고 전송/차단 합계를 계산 (로그를 쓸 수 없으면 None)"""
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            return None
+
+        urls: Dict[str, str] = {}
+        result = {"transferred_bytes": 0, "blocked_requests": 0, "blockable_requests": 0, "blockable_bytes": 0}
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                urls[params.get("requestId")] = params.get("request", {}).get("url", "")
+            elif method == "Network.loadingFinished":
+                size = int(params.get("encodedDataLength") or 0)
+                result["transferred_bytes"] += size
+                url = urls.get(params.get("requestId"))
+                if url and self.is_blockable(url):
+                    result["blockable_requests"] += 1
+                    result["blockable_bytes"] += size
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                result["blocked_requests"] += 1
+        return result
@@ -0,0 +1,275 @@
+import codecs
+import json
+import os
+import re
+from json import JSONDecodeError
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+from .database import DatabaseManager
+
+
+# 파일에서 한 번에 읽는 크기
+READ_CHUNK_BYTES = 1024 * 1024
+
+_JSON_DECODER = json.JSONDecoder()
+# 배열 원소 사이에서 건너뛰는 문자
+_WHITESPACE_PATTERN = re.compile(r"[ \t\r\n]*")
+_SEPARATOR_PATTERN = re.compile(r"[ \t\r\n,]*")
+
+
+def _detect_format(file_path: str) -> str:
+    """첫 번째 공백이 아닌 문자가 '['이면 JSON 배열, 아니면 JSONL"""
+    with open(file_path, 'rb') as f:
+        head = f.read(4096).lstrip(codecs.BOM_UTF8).lstrip()
+    return "json" if head.startswith(b"[") else "jsonl"
+
+
+def iter_jsonl_records(file_path: str, start_offset: int = 0) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    JSONL 파일의 항목을 하나씩 읽습니다
+
+    Yields:
+        (항목, 항목 다음 줄이 시작하는 바이트 오프셋)
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(start_offset)
+        offset = start_offset
+        for line in f:
+            offset += len(line)
+            if not line.endswith(b"\n"):
+                # 마지막 줄이 줄바꿈 없이 끝났으면 완전한 JSON일 때만 사용 (쓰는 도중 잘린 줄이면 오류)
+                try:
+                    record = json.loads(line)
+                except JSONDecodeError:
+                    raise ValueError(f"마지막 줄이 잘려 있습니다: {file_path}")
+                yield record, offset
+                return
+            if line.strip():
+                yield json.loads(line), offset
+
+
+def iter_json_array_records(file_path: str, start_offset: int = 0) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    JSON 배열 파일([{...}, {...}, ...])의 원소를 파일 전체를 읽지 않고 하나씩 읽습니다
+
+    Args:
+        start_offset: 0이면 파일 처음부터, 아니면 이전에 반환한 오프셋(원소 바로 뒤)부터
+
+    Yields:
+        (원소, 원소가 끝나는 바로 다음 바이트 오프셋)
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ""
+    # 다음에 읽을 buffer 위치와 그 위치의 파일 바이트 오프셋
+    # (원소마다 buffer를 잘라 내지 않고 위치만 옮기며, 앞부분은 파일을 더 읽을 때 한 번에 버림)
+    pos = 0
+    pos_offset = start_offset
+    expect_open_bracket = start_offset == 0
+    eof = False
+
+    with open(file_path, 'rb') as f:
+        f.seek(start_offset)
+        if start_offset == 0:
+            bom = f.read(len(codecs.BOM_UTF8))
+            if bom == codecs.BOM_UTF8:
+                pos_offset = len(bom)
+            else:
+                f.seek(0)
+
+        def fill() -> bool:
+            nonlocal buffer, pos, eof
+            chunk = f.read(READ_CHUNK_BYTES)
+            if not chunk:
+                eof = True
+                buffer = buffer[pos:] + decoder.decode(b"", final=True)
+                pos = 0
+                return False
+            buffer = buffer[pos:] + decoder.decode(chunk)
+            pos = 0
+            return True
+
+        def skip(pattern) -> None:
+            """pos 위치의 공백(과 구분자)을 건너뛰고 오프셋 갱신 (건너뛰는 문자는 모두 ASCII)"""
+            nonlocal pos, pos_offset
+            while True:
+                end = pattern.match(buffer, pos).end()
+                pos_offset += end - pos
+                pos = end
+                if pos < len(buffer) or eof or not fill():
+                    return
+
+        if expect_open_bracket:
+            skip(_WHITESPACE_PATTERN)
+            if not buffer.startswith("[", pos):
+                raise ValueError(f"JSON 배열이 아닙니다: {file_path}")
+            pos += 1
+            pos_offset += 1
+
+        while True:
+            skip(_SEPARATOR_PATTERN)
+            if pos >= len(buffer):
+                raise ValueError(f"JSON 배열이 닫히지 않았습니다: {file_path}")
+            if buffer.startswith("]", pos):
+                return
+
+            while True:
+                try:
+                    record, end = _JSON_DECODER.raw_decode(buffer, pos)
+                except JSONDecodeError:
+                    # 원소가 버퍼 끝에서 잘린 경우 더 읽고 다시 시도
+                    if eof or not fill():
+                        raise
+                    continue
+                # 숫자 등은 버퍼 끝에서 잘려도 파싱되므로 뒤에 구분자가 올 때까지 확인
+                if end == len(buffer) and not eof and fill():
+                    continue
+                break
+
+            pos_offset += len(buffer[pos:end].encode('utf-8'))
+            pos = end
+            yield record, pos_offset
+
+
+def iter_result_records(file_path: str, start_offset: int = 0,
+                        file_format: Optional[str] = None) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """결과 파일(JSON 배열 또는 JSONL)의 항목을 (항목, 다음 바이트 오프셋)으로 하나씩 읽기"""
+    file_format = file_format or _detect_format(file_path)
+    if file_format == "json":
+        return iter_json_array_records(file_path, start_offset)
+    return iter_jsonl_records(file_path, start_offset)
+
+
+class ImportCheckpoint:
+    """
+    가져오기 진행 위치(바이트 오프셋) 기록 파일 (<원본 파일>.import-checkpoint.json)
+
+    JSON 배열 파일은 다시 쓰이면 오프셋이 의미가 없어지므로 크기/수정 시각이 바뀌었으면 처음부터 시작합니다.
+    JSONL 파일은 뒤에 덧붙여지기만 하므로 크기가 오프셋 이상이면 이어서 진행합니다.
+    """
+
+    def __init__(self, source_file: str):
+        self.source_file = source_file
+        self.checkpoint_file = source_file + ".import-checkpoint.json"
+
+    def load(self, file_format: str) -> Dict[str, Any]:
+        empty = {"offset": 0, "records": 0, "upserted": 0, "failed": 0, "verified": True}
+        if not os.path.exists(self.checkpoint_file):
+            return empty
+        try:
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+        except (JSONDecodeError, OSError):
+            return empty
+
+        stat = os.stat(self.source_file)
+        if checkpoint.get("format") != file_format or stat.st_size < checkpoint.get("offset", 0):
+            return empty
+        if file_format == "json" and (checkpoint.get("size") != stat.st_size or
+                                      checkpoint.get("mtime_ns") != stat.st_mtime_ns):
+            print(f"⚠️ {self.source_file}이 변경되어 처음부터 다시 가져옵니다.")
+            return empty
+        return checkpoint
+
+    def save(self, file_format: str, offset: int, records: int, upserted: int,
+             failed: int, verified: bool) -> None:
+        stat = os.stat(self.source_file)
+        checkpoint = {
+            "format": file_format,
+            "offset": offset,
+            "records": records,
+            "upserted": upserted,
+            "failed": failed,
+            "verified": verified,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        temp_file = self.checkpoint_file + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.checkpoint_file)
+
+    def remove(self) -> None:
+        if os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+
+
+def import_results_file(file_path: str, db: DatabaseManager, batch_size: int = 5000,
+                        delete_after_import: bool = True) -> Dict[str, Any]:
+    """
+    결과 파일을 batch_size개씩 읽어 bulk_upsert_url_data로 반영합니다
+
+    배치가 커밋될 때마다 진행 위치를 기록하므로 중단되어도 다음 실행에서 이어서 가져옵니다.
+    배치마다 반영된 URL이 실제로 테이블에 있는지 확인하고,
+    파일 끝까지 실패한 행 없이 확인된 경우에만 원본 파일을 삭제합니다.
+
+    Returns:
+        {"records", "upserted", "failed", "verified", "completed", "deleted"}
+    """
+    file_format = _detect_format(file_path)
+    checkpoint = ImportCheckpoint(file_path)
+    state = checkpoint.load(file_format)
+    if state["offset"]:
+        print(f"↪️ 이전 가져오기 위치에서 이어서 진행합니다 ({state['records']}개 완료, {state['offset']:,} bytes)")
+
+    # 이전 실행에서 이미 반영한 배치의 결과도 이어받음 (실패가 있었다면 원본을 삭제하지 않도록)
+    records = state["records"]
+    upserted = state["upserted"]
+    failed = state.get("failed", 0)
+    verified = state.get("verified", True)
+    completed = False
+
+    batch = []
+    batch_end_offset = state["offset"]
+
+    def flush_batch() -> None:
+        nonlocal records, upserted, failed, verified, batch
+        result = db.bulk_upsert_url_data(batch, chunk_size=batch_size)
+        batch_urls = {entry["url"] for entry in batch if isinstance(entry, dict) and entry.get("url")}
+        found = db.count_existing_urls(batch_urls)
+        if result["failed"] or found != len(batch_urls):
+            verified = False
+            print(f"  ⚠️ 배치 확인 실패: 실패 {result['failed']}행, 테이블 확인 {found}/{len(batch_urls)}개")
+
+        records += len(batch)
+        upserted += result["upserted"]
+        failed += result["failed"]
+        checkpoint.save(file_format, batch_end_offset, records, upserted, failed, verified)
+        batch = []
+
+    try:
+        for record, next_offset in iter_result_records(file_path, state["offset"], file_format):
+            batch.append(record)
+            batch_end_offset = next_offset
+            if len(batch) >= batch_size:
+                flush_batch()
+        if batch:
+            flush_batch()
+        completed = True
+    except (JSONDecodeError, ValueError) as e:
+        print(f"❌ 파일을 끝까지 읽지 못했습니다 ({batch_end_offset:,} bytes 이후): {e}")
+
+    print(f"✅ {records}개 항목 처리, {upserted}개 반영, {failed}개 실패")
+
+    deleted = False
+    if completed:
+        # 끝까지 처리했으면 진행 위치는 더 이상 필요 없음 (다시 실행하면 처음부터 재시도)
+        checkpoint.remove()
+        if verified and failed == 0 and records > 0 and delete_after_import:
+            os.remove(file_path)
+            # JSONL 저장소의 URL 인덱스도 함께 삭제
+            if os.path.exists(file_path + ".idx"):
+                os.remove(file_path + ".idx")
+            deleted = True
+        elif delete_after_import and records > 0:
+            print(f"⚠️ 모든 행이 반영되었는지 확인되지 않아 {file_path}을 삭제하지 않습니다.")
+
+    return {
+        "records": records,
+        "upserted": upserted,
+        "failed": failed,
+        "verified": verified,
+        "completed": completed,
+        "deleted": deleted,
+    }
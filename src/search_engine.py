@@ -1,18 +1,56 @@
 import time
-import random
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from concurrent.futures import ThreadPoolExecutor
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException
+
+from .driver_pool import create_chrome_driver
+from .url_extractor import URLExtractor
+from .render_profile import RenderProfile
+from .pacing import SearchPacer, wait_for_page_ready, wait_for_serp
+from .metrics import SEARCHES, SERP_LOAD_SECONDS, PAGE_VISITS, PAGE_LOAD_SECONDS, BYTES_FETCHED, ERRORS
+
+
+class SearchBlockedError(Exception):
+    """Google이 검색 요청에 CAPTCHA/차단 페이지를 돌려준 경우"""
+    pass
 
 
 class SearchEngine:
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, visit_mode: str = "click",
+                 parallel_tabs: int = 4, page_load_timeout: int = 15,
+                 driver_pool=None, driver_cache_file: str = ".chromedriver_path.json",
+                 serp_pages: int = 1, url_extractor: URLExtractor = None,
+                 render_profile: RenderProfile = None, pacer: SearchPacer = None,
+                 serp_timeout: float = 10, page_idle_seconds: float = 0.5):
         self.headless = headless
         self.driver = None
+
+        # Google 검색 요청 간격 조절기 (CAPTCHA/차단 비율에 따라 간격을 줄이거나 늘림)
+        self.pacer = pacer or SearchPacer()
+        # 검색 결과 영역이 나타날 때까지 기다리는 최대 시간, 링크 방문 후 네트워크 유휴로 보는 시간 (초)
+        self.serp_timeout = serp_timeout
+        self.page_idle_seconds = page_idle_seconds
+
+        # 리소스 차단/eager 로딩 렌더링 프로파일 (없으면 모든 리소스를 로딩)
+        self.render_profile = render_profile
+
+        # 드라이버 풀 (없으면 단독 드라이버 사용)
+        self.driver_pool = driver_pool
+        self.driver_cache_file = driver_cache_file
+        self._leased_pages = 0
+
+        # 링크 방문 방식: "click" (클릭 후 뒤로가기) 또는 "parallel" (여러 탭/드라이버 동시 로딩)
+        self.visit_mode = visit_mode
+        self.parallel_tabs = max(1, parallel_tabs)
+        self.page_load_timeout = page_load_timeout
+
+        # 검색어마다 가져올 검색 결과 페이지 수 (2 이상이면 같은 세션에서 start=10, 20, ... 페이지도 가져옴)
+        self.serp_pages = max(1, serp_pages)
+        # 검색 결과 HTML(page_source)을 한 번만 파싱하여 얻은 [(url, 원래 href), ...]
+        self.url_extractor = url_extractor or URLExtractor()
+        self._serp_links = []
         
         # 뉴스 사이트 도메인 목록 (제외할 사이트)
         self.news_domains = [
@@ -25,36 +63,34 @@ class SearchEngine:
         ]
 
     def setup_driver(self):
-        # Chrome 옵션 설정
-        chrome_options = Options()
-        if self.headless:
-            chrome_options.add_argument("--headless=new")
-
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-
-        # User-Agent 랜덤 설정
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ]
-        chrome_options.add_argument(f"--user-agent={random.choice(user_agents)}")
-
-        # ChromeDriver 설치 및 초기화
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        # 드라이버 풀이 있으면 풀에서 대여, 없으면 단독 드라이버 생성
+        if self.driver_pool:
+            self.driver = self.driver_pool.acquire()
+            self._leased_pages = 0
+        else:
+            self.driver = create_chrome_driver(self.headless, self.driver_cache_file, self.render_profile)
 
-        # 자동화 탐지 우회
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    def _release_driver(self, broken: bool = False):
+        """대여한 드라이버를 풀에 반납합니다 (풀이 없으면 종료)"""
+        if not self.driver:
+            return
+        if self.driver_pool:
+            self.driver_pool.release(self.driver, pages=self._leased_pages, broken=broken)
+        elif broken:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+        else:
+            self.driver.quit()
+        self.driver = None
+        self._leased_pages = 0
 
     def search_google(self, keyword: str) -> str:
+        # 풀을 사용하는 경우 검색마다 드라이버를 반납하여 재활용 기회를 줌
+        if self.driver_pool and self.driver:
+            self._release_driver()
+
         # 드라이버가 없으면 초기화
         if not self.driver:
             self.setup_driver()
@@ -65,135 +101,385 @@ class SearchEngine:
             _ = self.driver.current_url
         except Exception as e:
             print(f"  ⚠️ 브라우저 세션 끊김, 드라이버 재초기화 중... ({e})")
-            self.driver = None
+            self._release_driver(broken=True)
             self.setup_driver()
 
         # Google 검색 실행
+        SEARCHES.inc()
         search_url = f"https://www.google.com/search?q={keyword}"
-        self.driver.get(search_url)
+        self._serp_links = []
+        try:
+            serp_html = self._load_serp_page(search_url)
+        except Exception:
+            ERRORS.inc(stage="search")
+            raise
+        self._add_serp_links(serp_html)
 
-        # 랜덤 딜레이 (봇 탐지 회피)
-        random_delay = random.uniform(2, 4)
-        time.sleep(random_delay)
+        # 다음 검색 결과 페이지도 같은 세션에서 이어서 가져옴 (검색 한 번에 더 많은 후보 URL)
+        for page in range(2, self.serp_pages + 1):
+            try:
+                html_content = self._load_serp_page(f"{search_url}&start={(page - 1) * 10}")
+            except Exception as e:
+                ERRORS.inc(stage="search")
+                print(f"  ⚠️ 검색 결과 {page}페이지 로딩 실패, {page - 1}페이지까지만 사용합니다: {e}")
+                break
+            if not self._add_serp_links(html_content):
+                # 더 이상 새로운 결과가 없음
+                break
 
-        # 검색 결과 로딩 대기
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div#search"))
-        )
+        return serp_html
 
-        # 추가 딜레이
-        time.sleep(random.uniform(1, 2))
-        
+    def _load_serp_page(self, url: str) -> str:
+        """
+        검색 결과 페이지 하나를 로딩하고 HTML을 반환
+
+        요청 전에 pacer가 정한 간격만큼 기다리고(로딩 시간에는 포함하지 않음),
+        검색 결과 영역이 나타나는 즉시 진행합니다. CAPTCHA/차단 페이지면 간격을 늘리고 SearchBlockedError를 발생시킵니다.
+        """
+        self.pacer.wait()
+        started = time.perf_counter()
+        self.driver.get(url)
+        self._leased_pages += 1
+
+        # 검색 결과 영역 또는 CAPTCHA 페이지가 나타날 때까지 대기
+        state = wait_for_serp(self.driver, timeout=self.serp_timeout)
+        SERP_LOAD_SECONDS.observe(time.perf_counter() - started)
+
+        if state == "captcha":
+            interval = self.pacer.record_block("captcha")
+            print(f"  🚧 CAPTCHA/차단 페이지 감지, 검색 간격을 {interval:.1f}초로 늘립니다.")
+            raise SearchBlockedError(f"CAPTCHA/차단 페이지: {self.driver.current_url}")
+        if state is None:
+            raise TimeoutException(f"검색 결과 로딩 시간 초과 ({self.serp_timeout}초): {url}")
+
+        self.pacer.record_success()
         return self.driver.page_source
 
-    def visit_search_result_links(self, max_links: int = 10) -> list:
+    def _add_serp_links(self, html_content: str) -> int:
+        """검색 결과 HTML의 링크를 추가하고 새로 추가된 링크 수를 반환"""
+        seen = {url for url, _ in self._serp_links}
+        added = 0
+        for url, href in self.url_extractor.extract_search_result_links(html_content):
+            if url not in seen:
+                seen.add(url)
+                self._serp_links.append((url, href))
+                added += 1
+        return added
+
+    def _record_visit(self, started: float, html_content: str) -> None:
+        """브라우저로 방문한 페이지의 로딩 시간과 크기를 지표에 기록"""
+        PAGE_VISITS.inc(tier="browser")
+        PAGE_LOAD_SECONDS.observe(time.perf_counter() - started, tier="browser")
+        BYTES_FETCHED.inc(len(html_content.encode('utf-8', errors='ignore')), tier="browser")
+
+    def _begin_visit(self, driver, sample: bool = True) -> bool:
+        if not self.render_profile:
+            return False
+        return self.render_profile.begin_visit(driver, sample=sample)
+
+    def _end_visit(self, driver, sampled: bool, pages: int = 1) -> None:
+        """렌더링 프로파일의 전송/차단/절약 바이트를 출력"""
+        if not self.render_profile or not pages:
+            return
+        report = self.render_profile.end_visit(driver, sampled, pages=pages)
+        line = RenderProfile.format_report(report, pages=pages)
+        if line:
+            print(f"    {line}")
+
+    def _is_news_site(self, href: str) -> bool:
+        return any(news_domain in href for news_domain in self.news_domains)
+
+    def collect_search_result_links(self, max_links: int = 10) -> list:
         """
-        검색 결과 페이지에서 링크를 찾아 각각 방문하고 HTML을 수집합니다.
-        
+        search_google()에서 한 번 파싱해 둔 검색 결과 링크 중 방문할 URL 목록을 반환합니다 (뉴스 사이트 제외).
+
         Args:
-            max_links: 방문할 최대 링크 수
-            
+            max_links: 수집할 최대 링크 수
+
+        Returns:
+            방문할 URL 문자열 리스트 (중복 제거, 검색 결과 순서 유지)
+        """
+        urls = []
+        for url, _ in self._serp_links:
+            if self._is_news_site(url):
+                print(f"    ⏭️ 뉴스 사이트 건너뛰기: {url}")
+                continue
+            urls.append(url)
+
+        links_to_visit = urls[:max_links]
+        print(f"  📋 {len(urls)}개의 유효 링크 발견, {len(links_to_visit)}개 방문 예정")
+        return links_to_visit
+
+    def _wait_for_document_ready(self, deadline: float) -> bool:
+        """현재 탭의 DOM이 로딩되고 네트워크가 잠잠해질 때까지 deadline까지 대기"""
+        return wait_for_page_ready(self.driver, timeout=max(0.0, deadline - time.time()),
+                                   idle_seconds=self.page_idle_seconds)
+
+    def visit_links_parallel(self, urls: list) -> list:
+        """
+        URL 목록을 여러 탭에서 동시에 로딩하고 HTML을 수집합니다.
+
+        parallel_tabs 개씩 새 탭을 한꺼번에 열어 브라우저가 병렬로 로딩하게 한 뒤,
+        (빈 탭에 차단을 먼저 적용하고 검색 결과 탭에서 탭 이름으로 이동을 시작하므로 탭끼리 로딩을 기다리지 않음)
+        각 탭을 순서대로 확인하며 page_load_timeout 안에 로딩된 HTML을 수집합니다.
+        시간 안에 로딩이 끝나지 않은 탭은 로딩을 중단하고 그때까지의 HTML을 사용합니다.
+
+        Args:
+            urls: 방문할 URL 리스트
+
         Returns:
             [(url, html_content), ...] 형태의 리스트
         """
         results = []
-        
-        try:
-            # rso 영역에서 링크 요소들 찾기
-            rso_element = self.driver.find_element(By.ID, "rso")
-            link_elements = rso_element.find_elements(By.TAG_NAME, "a")
-            
-            # 유효한 링크만 필터링 (href 속성이 있고 http로 시작하는 것)
-            valid_links = []
-            for link_element in link_elements:
-                href = link_element.get_attribute("href")
-                if href and (href.startswith("http://") or href.startswith("https://")):
-                    # 구글 내부 링크 및 data: URL 제외
-                    if "google.com" not in href and not href.startswith("data:"):
-                        # 뉴스 사이트 제외
-                        is_news_site = any(news_domain in href for news_domain in self.news_domains)
-                        if not is_news_site:
-                            valid_links.append(link_element)
-                        else:
-                            print(f"    ⏭️ 뉴스 사이트 건너뛰기: {href}")
-            
-            # 최대 링크 수만큼만 방문
-            links_to_visit = valid_links[:max_links]
-            print(f"  📋 {len(valid_links)}개의 유효 링크 발견, {len(links_to_visit)}개 방문 예정")
-            
-            # 각 링크 방문
-            for i, link_element in enumerate(links_to_visit, 1):
+        if not urls:
+            return results
+
+        serp_handle = self.driver.current_window_handle
+
+        for batch_start in range(0, len(urls), self.parallel_tabs):
+            batch = urls[batch_start:batch_start + self.parallel_tabs]
+            self._begin_visit(self.driver, sample=False)
+
+            # 1) 배치의 탭을 모두 빈 탭으로 열고, 렌더링 프로파일이 있으면 탭마다 차단 적용
+            #    (이동 중인 탭으로 전환하면 chromedriver가 로딩이 끝날 때까지 기다리므로 이동 전에 적용)
+            tabs = []
+            for offset, target_url in enumerate(batch, batch_start + 1):
+                name = f"visit-tab-{offset}"
                 try:
-                    # 링크 URL 저장 (클릭 후에는 접근 불가능)
-                    target_url = link_element.get_attribute("href")
-                    print(f"    [{i}/{len(links_to_visit)}] 🔗 클릭: {target_url}")
-                    
-                    # 링크 클릭
-                    link_element.click()
-                    
-                    # 페이지 로딩 대기
-                    time.sleep(random.uniform(2, 3))
-                    
-                    # 현재 페이지의 HTML 수집
+                    existing_handles = set(self.driver.window_handles)
+                    self.driver.execute_script("window.open('about:blank', arguments[0]);", name)
+                    new_handles = [h for h in self.driver.window_handles if h not in existing_handles]
+                    if not new_handles:
+                        print(f"    ❌ 탭 열기 실패: {target_url}")
+                        continue
+                    if self.render_profile:
+                        self.driver.switch_to.window(new_handles[0])
+                        self.render_profile.apply(self.driver)
+                    tabs.append((offset, target_url, name, new_handles[0]))
+                except Exception as e:
+                    ERRORS.inc(stage="visit")
+                    print(f"    ❌ 탭 열기 오류 {target_url}: {e}")
+            if self.render_profile:
+                self.driver.switch_to.window(serp_handle)
+
+            # 2) 검색 결과 탭에서 탭 이름으로 모든 이동을 한꺼번에 시작 (탭을 오가지 않으므로 서로의 로딩을 기다리지 않음)
+            opened = []
+            started = time.perf_counter()
+            for offset, target_url, name, handle in tabs:
+                print(f"    [{offset}/{len(urls)}] 🗂️ 새 탭에서 열기: {target_url}")
+                try:
+                    existing_handles = set(self.driver.window_handles)
+                    self.driver.execute_script("window.open(arguments[0], arguments[1]);", target_url, name)
+                    new_handles = [h for h in self.driver.window_handles if h not in existing_handles]
+                    if new_handles:
+                        # 이름으로 탭을 찾지 못해 새 탭에서 열린 경우: 빈 탭은 닫고 새 탭에서 수집
+                        self.driver.switch_to.window(handle)
+                        self.driver.close()
+                        self.driver.switch_to.window(serp_handle)
+                        handle = new_handles[0]
+                    opened.append((target_url, handle))
+                except Exception as e:
+                    ERRORS.inc(stage="visit")
+                    print(f"    ❌ 탭 열기 오류 {target_url}: {e}")
+
+            # 모든 탭이 같은 시간에 로딩을 시작했으므로 배치 단위로 타임아웃 계산
+            deadline = time.time() + self.page_load_timeout
+
+            for target_url, handle in opened:
+                try:
+                    self.driver.switch_to.window(handle)
+                    if not self._wait_for_document_ready(deadline):
+                        print(f"    ⏱️ 로딩 시간 초과 ({self.page_load_timeout}초), 현재까지의 HTML 사용: {target_url}")
+                        self.driver.execute_script("window.stop();")
+
                     current_url = self.driver.current_url
                     html_content = self.driver.page_source
-                    
+                    self._record_visit(started, html_content)
                     results.append((current_url, html_content))
+                    self._leased_pages += 1
                     print(f"    ✅ HTML 수집 완료: {current_url}")
-                    
-                    # 뒤로가기 (다음 검색을 위해 항상 검색 결과 페이지로 돌아감)
-                    is_last_link = (i == len(links_to_visit))
-                    # 뒤로가기
-                    self.driver.back()
-                    
-                    # 검색 결과 페이지 로딩 대기
-                    time.sleep(random.uniform(1, 2))
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.ID, "rso"))
-                    )
-                    
-                    # 마지막 링크가 아니면 다음 링크 준비
-                    if not is_last_link:
-                        # rso 영역 다시 찾기 (페이지가 새로 로드되었으므로)
-                        rso_element = self.driver.find_element(By.ID, "rso")
-                        link_elements = rso_element.find_elements(By.TAG_NAME, "a")
-                        
-                        # 다음 링크를 위해 valid_links 재구성
-                        valid_links = []
-                        for link_element in link_elements:
-                            href = link_element.get_attribute("href")
-                            if href and (href.startswith("http://") or href.startswith("https://")):
-                                if "google.com" not in href and not href.startswith("data:"):
-                                    # 뉴스 사이트 제외
-                                    is_news_site = any(news_domain in href for news_domain in self.news_domains)
-                                    if not is_news_site:
-                                        valid_links.append(link_element)
-                        
-                        # 다음에 방문할 링크 업데이트 (이미 방문한 것 제외)
-                        links_to_visit = valid_links[:max_links]
-                    
                 except Exception as e:
-                    print(f"    ❌ 링크 방문 오류: {e}")
-                    # 에러 발생 시 검색 결과 페이지로 돌아가기 시도
+                    ERRORS.inc(stage="visit")
+                    print(f"    ❌ 링크 방문 오류 {target_url}: {e}")
+                finally:
+                    # 수집이 끝난 탭 닫기
                     try:
-                        self.driver.back()
-                        time.sleep(1)
-                        # 검색 결과 페이지 확인
-                        WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((By.ID, "rso"))
-                        )
-                    except:
-                        print(f"    ⚠️ 검색 결과 페이지로 복귀 실패")
+                        self.driver.switch_to.window(handle)
+                        self.driver.close()
+                    except Exception:
                         pass
-                    continue
-        
-        except Exception as e:
-            print(f"  ❌ 검색 결과 링크 찾기 오류: {e}")
+
+            # 검색 결과 탭으로 복귀
+            self.driver.switch_to.window(serp_handle)
+            self._end_visit(self.driver, False, pages=len(opened))
+
+        return results
+
+    def _visit_with_pooled_driver(self, target_url: str):
+        """풀에서 드라이버를 대여하여 URL 하나를 로딩하고 (url, html)을 반환합니다"""
+        with self.driver_pool.lease(pages=1) as driver:
+            driver.set_page_load_timeout(self.page_load_timeout)
+            sampled = self._begin_visit(driver)
+            started = time.perf_counter()
+            try:
+                driver.get(target_url)
+            except TimeoutException:
+                print(f"    ⏱️ 로딩 시간 초과 ({self.page_load_timeout}초), 현재까지의 HTML 사용: {target_url}")
+                driver.execute_script("window.stop();")
+            html_content = driver.page_source
+            self._record_visit(started, html_content)
+            self._end_visit(driver, sampled)
+            return driver.current_url, html_content
+
+    def render_url(self, target_url: str) -> tuple:
+        """
+        브라우저로 URL 하나를 렌더링하고 (final_url, html)을 반환합니다.
+        풀이 있으면 풀의 드라이버를, 없으면 검색용 드라이버를 사용합니다.
+        """
+        if self.driver_pool:
+            return self._visit_with_pooled_driver(target_url)
+
+        if not self.driver:
+            self.setup_driver()
+        self.driver.set_page_load_timeout(self.page_load_timeout)
+        sampled = self._begin_visit(self.driver)
+        started = time.perf_counter()
+        try:
+            self.driver.get(target_url)
+        except TimeoutException:
+            print(f"    ⏱️ 로딩 시간 초과 ({self.page_load_timeout}초), 현재까지의 HTML 사용: {target_url}")
+            self.driver.execute_script("window.stop();")
+        self._leased_pages += 1
+        html_content = self.driver.page_source
+        self._record_visit(started, html_content)
+        self._end_visit(self.driver, sampled)
+        return self.driver.current_url, html_content
+
+    def visit_links_with_pool(self, urls: list) -> list:
+        """
+        URL 목록을 드라이버 풀의 여러 드라이버로 동시에 로딩하고 HTML을 수집합니다.
+        검색 결과 페이지를 들고 있는 드라이버를 제외한 나머지 드라이버 수만큼 병렬로 방문합니다.
+
+        Returns:
+            [(url, html_content), ...] 형태의 리스트 (입력 순서 유지)
+        """
+        results = []
+        if not urls:
+            return results
+
+        # 생성 실패로 풀이 줄어들 수 있으므로 살아 있는 드라이버 수 기준 (검색용 드라이버 제외)
+        spare_drivers = self.driver_pool.live_count - 1
+        if spare_drivers < 1:
+            # 여유 드라이버가 없으면 URL마다 acquire_timeout까지 기다리게 되므로 탭 단위 방문으로 대체
+            print("    ⚠️ 풀에 여유 드라이버가 없어 탭 단위로 방문합니다")
+            return self.visit_links_parallel(urls)
+        max_workers = min(len(urls), spare_drivers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._visit_with_pooled_driver, url) for url in urls]
+            for i, (target_url, future) in enumerate(zip(urls, futures), 1):
+                try:
+                    current_url, html_content = future.result()
+                    results.append((current_url, html_content))
+                    print(f"    [{i}/{len(urls)}] ✅ HTML 수집 완료: {current_url}")
+                except Exception as e:
+                    ERRORS.inc(stage="visit")
+                    print(f"    [{i}/{len(urls)}] ❌ 링크 방문 오류 {target_url}: {e}")
+
+        return results
+
+    def visit_links(self, urls: list) -> list:
+        """
+        이미 수집한 링크들을 병렬로 방문하여 HTML을 수집합니다
+
+        풀에 검색용 외의 여유 드라이버가 있으면 드라이버 단위로, 없으면 탭 단위로 병렬 방문합니다.
+
+        Returns:
+            [(url, html_content), ...] 형태의 리스트
+        """
+        if self.driver_pool and self.driver_pool.size > 1:
+            return self.visit_links_with_pool(urls)
+        return self.visit_links_parallel(urls)
+
+    def visit_search_result_links(self, max_links: int = 10) -> list:
+        """
+        검색 결과 페이지에서 링크를 찾아 각각 방문하고 HTML을 수집합니다.
         
+        Args:
+            max_links: 방문할 최대 링크 수
+            
+        Returns:
+            [(url, html_content), ...] 형태의 리스트
+        """
+        if self.visit_mode == "parallel":
+            return self.visit_links(self.collect_search_result_links(max_links=max_links))
+
+        results = []
+        links_to_visit = self.collect_search_result_links(max_links=max_links)
+        hrefs = dict(self._serp_links)
+        serp_url = self.driver.current_url
+
+        # 각 링크 방문
+        for i, target_url in enumerate(links_to_visit, 1):
+            try:
+                print(f"    [{i}/{len(links_to_visit)}] 🔗 클릭: {target_url}")
+                sampled = self._begin_visit(self.driver)
+                started = time.perf_counter()
+
+                # 파싱해 둔 href로 링크 요소를 한 번에 찾아 클릭
+                # (현재 검색 결과 페이지에 없는 링크(다음 페이지의 결과 등)는 직접 이동)
+                link_element = self._find_result_link(hrefs.get(target_url))
+                if link_element is not None:
+                    link_element.click()
+                else:
+                    self.driver.get(target_url)
+
+                # 페이지 로딩 대기 (DOM 로딩 + 네트워크 유휴, 최대 page_load_timeout초)
+                if not wait_for_page_ready(self.driver, timeout=self.page_load_timeout,
+                                           idle_seconds=self.page_idle_seconds):
+                    print(f"    ⏱️ 로딩 시간 초과 ({self.page_load_timeout}초), 현재까지의 HTML 사용: {target_url}")
+
+                # 현재 페이지의 HTML 수집
+                current_url = self.driver.current_url
+                html_content = self.driver.page_source
+                self._record_visit(started, html_content)
+                self._end_visit(self.driver, sampled)
+
+                results.append((current_url, html_content))
+                self._leased_pages += 1
+                print(f"    ✅ HTML 수집 완료: {current_url}")
+            except Exception as e:
+                ERRORS.inc(stage="visit")
+                print(f"    ❌ 링크 방문 오류: {e}")
+            finally:
+                # 다음 링크를 위해 항상 검색 결과 페이지로 돌아감
+                self._return_to_serp(serp_url)
+
         return results
 
+    def _find_result_link(self, href: str):
+        """검색 결과 영역에서 href 속성값이 같은 링크 요소 찾기 (없으면 None)"""
+        if not href:
+            return None
+        escaped = href.replace("\\", "\\\\").replace('"', '\\"')
+        try:
+            return self.driver.find_element(By.CSS_SELECTOR, f'#rso a[href="{escaped}"]')
+        except Exception:
+            return None
+
+    def _return_to_serp(self, serp_url: str) -> None:
+        """링크 방문 후 뒤로가기로 검색 결과 페이지에 복귀"""
+        try:
+            if self.driver.current_url == serp_url:
+                return
+            self.driver.back()
+
+            # 검색 결과 페이지 로딩 대기
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.ID, "rso"))
+            )
+        except Exception:
+            print(f"    ⚠️ 검색 결과 페이지로 복귀 실패")
+
     def close(self):
-        # 드라이버 종료
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
\ No newline at end of file
+        # 드라이버 종료 (풀을 사용하는 경우 풀에 반납)
+        self._release_driver()
\ No newline at end of file
@@ -0,0 +1,85 @@
+from datetime import datetime
+from typing import List, Dict, Any
+
+
+class ResultStorage:
+    """
+    크롤러가 분류 결과를 기록하는 저장소 인터페이스
+
+    구현체:
+    - JSONStorage (json_storage.py): results.json / results.jsonl 파일
+    - PostgresStorage (postgres_storage.py): gambling_urls 테이블에 백그라운드로 일괄 반영
+
+    settings.json의 "storage_backend" 값("json" 또는 "postgres")으로 선택합니다 (create_storage 참고).
+    """
+
+    def save_results(self, urls: List[str], keyword: str, classification_results: List[Dict[str, Any]] = None) -> None:
+        raise NotImplementedError
+
+    def get_existing_urls(self) -> set:
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict[str, Any]:
+        """{"total_entries", "unique_urls", "keywords_used", "keywords"} 딕셔너리"""
+        raise NotImplementedError
+
+    def describe(self) -> str:
+        """결과 요약에 표시할 저장 위치 설명"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    @staticmethod
+    def build_entries(urls: List[str], keyword: str,
+                      classification_results: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """URL과 분류 결과로 저장할 항목 목록 생성 (모든 저장소가 같은 형식 사용)"""
+        timestamp = datetime.now().isoformat()
+
+        new_entries = []
+        for i, url in enumerate(urls):
+            entry = {
+                "url": url,
+                "keyword_used": keyword,
+                "collected_at": timestamp
+            }
+
+            # 분류 결과가 있으면 추가
+            if classification_results and i < len(classification_results):
+                result = classification_results[i]
+                entry["is_illegal"] = result.get("is_illegal", False)
+                entry["gemini_confidence"] = result.get("confidence", 0.0)
+                entry["gemini_reason"] = result.get("reason", "")
+                entry["gemini_error"] = result.get("error", None)
+                # 판정 경로 (gemini / prefilter / local_model / near_duplicate, 로컬 모델 학습 데이터 선별용)
+                if result.get("source"):
+                    entry["classification_source"] = result.get("source")
+                if result.get("detected_keywords"):
+                    entry["detected_keywords"] = result.get("detected_keywords")
+                if result.get("fetch_tier"):
+                    entry["fetch_tier"] = result.get("fetch_tier")
+                if result.get("cluster_id"):
+                    entry["cluster_id"] = result.get("cluster_id")
+
+            new_entries.append(entry)
+        return new_entries
+
+
+def create_storage(settings: Dict[str, Any]) -> ResultStorage:
+    """settings.json 설정에 맞는 저장소 생성"""
+    backend = settings.get("storage_backend", "json")
+
+    if backend == "postgres":
+        from .postgres_storage import PostgresStorage
+        return PostgresStorage(
+            batch_size=settings.get("db_flush_batch_size", 500),
+            flush_interval=settings.get("db_flush_interval", 5),
+            max_pending=settings.get("db_max_pending", 10000),
+            spill_file=settings.get("db_spill_file", "results_spill.jsonl")
+        )
+
+    if backend != "json":
+        raise ValueError(f"알 수 없는 storage_backend: {backend} (json 또는 postgres)")
+
+    from .json_storage import JSONStorage
+    return JSONStorage(settings.get("output_file", "results.json"))
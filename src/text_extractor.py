@@ -0,0 +1,286 @@
+import re
+from html.entities import html5
+from html.parser import HTMLParser
+from typing import Optional
+
+
+# 내용 전체를 버리는 태그 (GeminiClassifier가 decompose 하던 태그와 동일)
+SKIP_TAGS = {'script', 'style', 'meta', 'noscript', 'link', 'head'}
+
+# BeautifulSoup이 별도 문자열 타입으로 분류하여 get_text()에서 제외하는 태그
+NON_TEXT_CONTAINER_TAGS = {'rt', 'rp', 'style', 'script', 'template'}
+
+# 닫는 태그 없이 바로 닫히는 빈 요소 (BeautifulSoup html.parser 트리 빌더 기준)
+VOID_TAGS = {
+    'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command', 'embed', 'frame', 'hr', 'image',
+    'img', 'input', 'isindex', 'keygen', 'link', 'menuitem', 'meta', 'nextid', 'param', 'source',
+    'spacer', 'track', 'wbr'
+}
+
+# 줄을 바꾸는 블록 요소 (keep_blocks=True일 때 블록마다 한 줄로 나눔)
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'button', 'caption', 'dd', 'details', 'dialog', 'div',
+    'dl', 'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hr', 'li', 'main', 'nav', 'ol', 'option', 'p', 'pre', 'section', 'summary', 'table', 'td',
+    'th', 'title', 'tr', 'ul'
+}
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+
+# keep_blocks=True일 때 제목/소제목 줄 앞에 붙이는 표시
+TITLE_PREFIX = "# "
+HEADING_PREFIX = "## "
+
+# &#128; ~ &#159; 참조를 Windows-1252 문자로 해석 (HTML 표준의 숫자 참조 처리 규칙)
+_WINDOWS_1252_CONTROLS = {
+    code: bytes([code]).decode('windows-1252')
+    for code in range(0x80, 0xA0)
+    if code not in (0x81, 0x8D, 0x8F, 0x90, 0x9D)
+}
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_DECIMAL_REFERENCE = re.compile(r'^([0-9]+)(.*)', re.DOTALL)
+_HEX_REFERENCE = re.compile(r'^([0-9a-f]+)(.*)', re.DOTALL)
+
+
+class _BudgetReached(Exception):
+    pass
+
+
+class StreamingTextExtractor(HTMLParser):
+    """
+    HTML을 토큰 단위로 읽으면서 본문 텍스트만 모으는 추출기
+
+    BeautifulSoup(html.parser)으로 트리를 만든 뒤 script/style/head 등을 제거하고
+    get_text(separator=' ', strip=True) 후 공백을 정리하던 결과와 같은 텍스트를 만들되,
+    트리를 만들지 않고 제외할 태그 안의 내용은 모으지 않으며,
+    max_chars 글자를 채우는 순간 파싱을 멈춥니다.
+
+    keep_blocks=True면 블록 요소마다 줄을 바꾸고, <title>은 "# ", h1~h6은 "## "로 시작하는 줄로 남깁니다
+    (글자 수는 같은 방식으로 세므로 공백 하나 대신 줄바꿈이 들어가는 것 외에는 같은 텍스트).
+    """
+
+    def __init__(self, max_chars: Optional[int] = None, keep_blocks: bool = False):
+        # 문자 참조는 BeautifulSoup과 같은 규칙으로 직접 처리
+        super().__init__(convert_charrefs=False)
+        self.max_chars = max_chars
+        self.keep_blocks = keep_blocks
+        # 마지막 조각 이후 블록 경계를 지났는지 (다음 조각을 새 줄로 시작)
+        self._at_block_start = True
+        self._separators = []
+
+        # 열린 태그 스택과 그 안의 제외/비텍스트 태그 수
+        self._open_tags = []
+        self._open_counts = {}
+        self._skip_depth = 0
+        self._container_stack = []
+        self._already_closed_void = []
+
+        # 다음 태그 경계까지 이어지는 텍스트 조각 (하나의 텍스트 노드)
+        self._pending = []
+        self._pending_length = 0
+        self._pieces = []
+        self._length = 0
+
+    # ---- 텍스트 수집 ----
+
+    def _remaining(self) -> Optional[int]:
+        if self.max_chars is None:
+            return None
+        # 이미 모은 조각이 있으면 구분자 공백 한 칸이 추가됨
+        return self.max_chars - self._length - (1 if self._pieces else 0)
+
+    def _collecting(self) -> bool:
+        if self.keep_blocks and self._in_title():
+            return True
+        return self._skip_depth == 0 and not (
+            self._container_stack and self._container_stack[-1] in NON_TEXT_CONTAINER_TAGS
+        )
+
+    def _flush(self) -> None:
+        """태그 경계에서 모아둔 텍스트 노드를 정리하여 결과에 추가"""
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending = []
+        self._pending_length = 0
+        text = _WHITESPACE_PATTERN.sub(' ', text).strip()
+        if not text:
+            return
+        self._append(text)
+
+    def _in_title(self) -> bool:
+        # <head> 안의 <title>은 제외 영역이지만 keep_blocks=True면 제목 줄로 남김
+        head_depth = self._open_counts.get('head', 0)
+        return bool(head_depth and self._open_counts.get('title')) and self._skip_depth == head_depth
+
+    def _append(self, text: str) -> None:
+        if self.keep_blocks:
+            if self._at_block_start:
+                if self._in_title():
+                    text = TITLE_PREFIX + text
+                elif any(self._open_counts.get(tag) for tag in HEADING_TAGS):
+                    text = HEADING_PREFIX + text
+            self._separators.append("\n" if self._at_block_start else " ")
+            self._at_block_start = False
+        if self._pieces:
+            self._length += 1
+        self._pieces.append(text)
+        self._length += len(text)
+        if self.max_chars is not None and self._length >= self.max_chars:
+            raise _BudgetReached()
+
+    def _add_data(self, data: str, cdata: bool = False) -> None:
+        # CDATA는 rt/template 등의 안에서도 텍스트로 취급됨
+        collecting = self._skip_depth == 0 if cdata else self._collecting()
+        if not collecting:
+            # 제외 영역의 텍스트는 어차피 버려지므로 모을 필요 없음
+            return
+        self._pending.append(data)
+        self._pending_length += len(data)
+
+        # 태그 없이 아주 긴 텍스트 노드라도 예산을 넘으면 바로 멈춤
+        remaining = self._remaining()
+        if remaining is not None and self._pending_length > remaining:
+            text = _WHITESPACE_PATTERN.sub(' ', "".join(self._pending)).strip()
+            if text and len(text) >= remaining:
+                self._pending = []
+                self._pending_length = 0
+                self._append(text)
+
+    def get_text(self) -> str:
+        if self.keep_blocks:
+            text = "".join(separator + piece for separator, piece in zip(self._separators, self._pieces))[1:]
+        else:
+            text = " ".join(self._pieces)
+        if self.max_chars is not None:
+            text = text[:self.max_chars]
+        return text
+
+    # ---- 트리 구조 추적 (BeautifulSoup html.parser 트리 빌더와 같은 규칙) ----
+
+    def _push(self, tag: str) -> None:
+        self._open_tags.append(tag)
+        self._open_counts[tag] = self._open_counts.get(tag, 0) + 1
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        if tag in NON_TEXT_CONTAINER_TAGS:
+            self._container_stack.append(tag)
+
+    def _pop(self) -> str:
+        tag = self._open_tags.pop()
+        self._open_counts[tag] -= 1
+        if tag in SKIP_TAGS:
+            self._skip_depth -= 1
+        if tag in NON_TEXT_CONTAINER_TAGS:
+            self._container_stack.pop()
+        return tag
+
+    def _pop_to_tag(self, tag: str) -> None:
+        # 열려 있지 않은 태그의 닫는 태그는 무시, 열려 있으면 그 태그까지 모두 닫음
+        if not self._open_counts.get(tag):
+            return
+        while self._open_tags:
+            if self._pop() == tag:
+                break
+
+    def _mark_block_boundary(self, tag: str) -> None:
+        if self.keep_blocks and tag in BLOCK_TAGS:
+            self._at_block_start = True
+
+    def handle_starttag(self, tag, attrs, handle_void=True):
+        self._flush()
+        self._mark_block_boundary(tag)
+        self._push(tag)
+        if tag in VOID_TAGS and handle_void:
+            self._end_tag(tag, check_already_closed=False)
+            self._already_closed_void.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs, handle_void=False)
+        self._end_tag(tag, check_already_closed=False)
+
+    def handle_endtag(self, tag):
+        self._end_tag(tag, check_already_closed=True)
+
+    def _end_tag(self, tag: str, check_already_closed: bool) -> None:
+        if check_already_closed and tag in self._already_closed_void:
+            self._already_closed_void.remove(tag)
+            return
+        self._flush()
+        self._mark_block_boundary(tag)
+        self._pop_to_tag(tag)
+
+    # ---- 텍스트/참조/기타 토큰 ----
+
+    def handle_data(self, data):
+        self._add_data(data)
+
+    def handle_charref(self, name):
+        reference = _HEX_REFERENCE if name[:1] in ('x', 'X') else _DECIMAL_REFERENCE
+        digits = name[1:] if reference is _HEX_REFERENCE else name
+        base = 16 if reference is _HEX_REFERENCE else 10
+        extra = ""
+        try:
+            code = int(digits, base)
+        except ValueError:
+            match = reference.search(digits)
+            if match is None:
+                self._add_data(digits)
+                return
+            code = int(match.group(1), base)
+            extra = match.group(2)
+        self._add_data(self._numeric_reference(code))
+        if extra:
+            self._add_data(extra)
+
+    @staticmethod
+    def _numeric_reference(code: int) -> str:
+        if code == 0 or code > 0x10FFFF or 0xD800 <= code <= 0xDFFF:
+            return "�"
+        if code in _WINDOWS_1252_CONTROLS:
+            return _WINDOWS_1252_CONTROLS[code]
+        return chr(code)
+
+    def handle_entityref(self, name):
+        character = html5.get(name + ";")
+        self._add_data(character if character is not None else "&" + name)
+
+    def unknown_decl(self, data):
+        # CDATA 블록의 내용은 텍스트로 취급, 그 외 선언은 무시
+        self._flush()
+        if data.upper().startswith("CDATA["):
+            self._add_data(data[len("CDATA["):], cdata=True)
+        self._flush()
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+
+def extract_text(html_content: str, max_chars: Optional[int] = None, keep_blocks: bool = False) -> str:
+    """
+    HTML에서 본문 텍스트만 추출합니다 (script, style, meta, noscript, link, head 내용 제외)
+
+    Args:
+        html_content: 원본 HTML 콘텐츠
+        max_chars: 최대 글자 수 (도달하면 나머지 HTML은 파싱하지 않음)
+        keep_blocks: 블록 요소마다 줄을 나누고 제목("# ")/소제목("## ") 줄을 남길지 여부
+
+    Returns:
+        공백이 정리된 텍스트 (max_chars가 있으면 그 길이로 자름)
+    """
+    extractor = StreamingTextExtractor(max_chars=max_chars, keep_blocks=keep_blocks)
+    try:
+        # 문서를 나눠 넣으면 잘못된 문자 참조의 해석이 달라지므로 한 번에 넣고,
+        # 글자 수 예산에 도달하면 핸들러에서 예외로 파싱을 중단
+        extractor.feed(html_content)
+        extractor.close()
+        extractor._flush()
+    except _BudgetReached:
+        pass
+    return extractor.get_text()
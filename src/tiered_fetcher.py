@@ -0,0 +1,165 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional
+
+from .async_fetcher import AsyncFetcher
+from .metrics import ERRORS
+
+
+# 자바스크립트로만 콘텐츠를 그리는 SPA 껍데기 페이지의 흔적
+SPA_MARKERS = [
+    re.compile(r'<div[^>]+id=["\'](?:root|app|__next|__nuxt)["\'][^>]*>\s*</div>', re.IGNORECASE),
+    re.compile(r'\bng-app\b|\bng-version=', re.IGNORECASE),
+    re.compile(r'(?:enable|turn on)\s+javascript', re.IGNORECASE),
+    re.compile(r'자바스크립트를\s*(?:활성화|사용)', re.IGNORECASE),
+]
+
+# 봇 차단/보안 확인(challenge) 페이지의 흔적
+CHALLENGE_MARKERS = [
+    re.compile(r'cf-browser-verification|challenge-platform|cf_chl_|cf-challenge', re.IGNORECASE),
+    re.compile(r'<title>\s*(?:Just a moment\.\.\.|Attention Required! \| Cloudflare|DDoS-Guard)', re.IGNORECASE),
+    re.compile(r'ddos-guard|hcaptcha\.com/1/api\.js', re.IGNORECASE),
+]
+
+META_REFRESH_PATTERN = re.compile(r'<meta[^>]+http-equiv=["\']?refresh', re.IGNORECASE)
+
+_SCRIPT_STYLE_PATTERN = re.compile(r'<(script|style|noscript)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def estimate_visible_text_length(html_content: str) -> int:
+    """정규식으로 script/style과 태그를 제거한 대략적인 본문 글자 수를 계산합니다"""
+    text = _SCRIPT_STYLE_PATTERN.sub(' ', html_content)
+    text = _TAG_PATTERN.sub(' ', text)
+    return len(_WHITESPACE_PATTERN.sub(' ', text).strip())
+
+
+def needs_browser(html_content: str, min_text_chars: int = 200) -> Optional[str]:
+    """
+    HTTP로 가져온 HTML이 브라우저 렌더링이 필요한 페이지인지 판단합니다
+
+    Args:
+        html_content: HTTP 응답 HTML
+        min_text_chars: 정적 페이지로 인정할 최소 본문 글자 수
+
+    Returns:
+        브라우저가 필요한 이유 ("empty", "challenge", "meta_refresh", "spa", "tiny_text")
+        또는 HTTP 결과를 그대로 사용해도 되면 None
+    """
+    if not html_content:
+        return "empty"
+
+    if any(pattern.search(html_content) for pattern in CHALLENGE_MARKERS):
+        return "challenge"
+
+    if META_REFRESH_PATTERN.search(html_content):
+        return "meta_refresh"
+
+    text_length = estimate_visible_text_length(html_content)
+    if text_length < min_text_chars:
+        if any(pattern.search(html_content) for pattern in SPA_MARKERS):
+            return "spa"
+        return "tiny_text"
+
+    return None
+
+
+class TieredFetcher:
+    """
+    단계별 페이지 수집기
+
+    1단계(http): AsyncFetcher로 모든 URL을 병렬로 가져옴
+    2단계(browser): JS 껍데기/리다이렉트/보안 확인 페이지로 판단된 URL만 브라우저로 렌더링
+
+    각 결과에는 어느 단계에서 수집했는지(tier)와 브라우저로 넘긴 이유(escalation_reason)가 기록됩니다.
+    """
+
+    def __init__(self, http_fetcher: AsyncFetcher, render_func: Optional[Callable[[str], tuple]] = None,
+                 browser_workers: int = 1, min_text_chars: int = 200):
+        """
+        Args:
+            http_fetcher: HTTP 단계에서 사용할 AsyncFetcher
+            render_func: URL을 받아 (final_url, html)을 반환하는 브라우저 렌더링 함수
+                         (None이면 브라우저 단계 없이 HTTP 결과만 사용)
+            browser_workers: 브라우저 단계의 동시 렌더링 수
+            min_text_chars: 정적 페이지로 인정할 최소 본문 글자 수
+        """
+        self.http_fetcher = http_fetcher
+        self.render_func = render_func
+        self.browser_workers = max(1, browser_workers)
+        self.min_text_chars = min_text_chars
+        # 파이프라인의 수집 작업자 여러 개가 동시에 fetch()를 호출하므로 lock으로 보호
+        self.tier_counts = {"http": 0, "browser": 0}
+        self._lock = threading.Lock()
+
+    def fetch(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        URL 목록을 단계별로 수집합니다
+
+        Returns:
+            [
+                {
+                    "url": str (요청 URL),
+                    "final_url": str,
+                    "html": str,
+                    "tier": "http" | "browser",
+                    "escalation_reason": str or None,
+                    "error": str or None
+                },
+                ...
+            ] (입력 순서 유지)
+        """
+        results = {}
+        escalate = []
+
+        # 1단계: HTTP로 병렬 수집
+        for fetch_result in self.http_fetcher.iter_fetch(urls):
+            url = fetch_result["url"]
+            reason = "http_error" if fetch_result["error"] else needs_browser(fetch_result["html"], self.min_text_chars)
+            results[url] = {
+                "url": url,
+                "final_url": fetch_result["final_url"],
+                "html": fetch_result["html"],
+                "tier": "http",
+                "escalation_reason": reason,
+                "error": fetch_result["error"],
+            }
+            if reason and self.render_func:
+                escalate.append(url)
+
+        # 2단계: 필요한 URL만 브라우저로 렌더링
+        if escalate:
+            print(f"    🌐 {len(escalate)}개 URL 브라우저 렌더링으로 전환")
+            with ThreadPoolExecutor(max_workers=min(self.browser_workers, len(escalate))) as executor:
+                futures = {url: executor.submit(self.render_func, url) for url in escalate}
+                for url, future in futures.items():
+                    try:
+                        final_url, html_content = future.result()
+                        results[url].update({
+                            "final_url": final_url,
+                            "html": html_content,
+                            "tier": "browser",
+                            "error": None,
+                        })
+                    except Exception as e:
+                        # 브라우저 렌더링에 실패하면 HTTP 결과를 그대로 사용
+                        ERRORS.inc(stage="visit")
+                        print(f"    ❌ 브라우저 렌더링 실패 {url}: {e}")
+
+        ordered = [results[url] for url in urls if url in results]
+        for result in ordered:
+            if result["error"]:
+                # 브라우저로도 가져오지 못한 HTTP 오류(4xx 등) 응답은 오류 페이지 본문을 분류하지 않도록 페이지 없음으로 처리
+                result["html"] = ""
+        with self._lock:
+            for result in ordered:
+                if result["html"]:
+                    self.tier_counts[result["tier"]] += 1
+        return ordered
+
+    def get_tier_counts(self) -> Dict[str, int]:
+        """단계별 수집 페이지 수"""
+        with self._lock:
+            return dict(self.tier_counts)
@@ -0,0 +1,118 @@
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Any, Iterator, Optional
+
+
+class TrainingSampleStore:
+    """
+    로컬 분류 모델 학습용 Gemini 판정 표본 저장소 (SQLite)
+
+    gambling_urls 테이블에는 불법 판정만 저장되고 페이지 텍스트도 없으므로,
+    Gemini가 판정한 페이지(불법/합법 모두)의 정제된 텍스트와 판정을 분류할 때 함께 저장합니다.
+    학습은 나중에 URL을 다시 가져오지 않고 판정 당시의 텍스트로 합니다.
+
+    - 텍스트는 zlib으로 압축하여 저장
+    - 같은 URL을 다시 판정하면 최신 판정으로 교체
+    - max_entries를 넘으면 가장 오래된 표본부터 삭제
+    """
+
+    # 이 횟수만큼 저장할 때마다 한 번씩 오래된 표본 정리
+    EVICT_EVERY = 100
+
+    def __init__(self, db_file: str = "training_samples.sqlite3", max_entries: int = 100000):
+        self.db_file = db_file
+        self.max_entries = max_entries
+
+        self._puts_since_evict = 0
+        self._lock = threading.Lock()
+
+        self.connection = sqlite3.connect(db_file, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS training_samples (
+                url TEXT PRIMARY KEY,
+                text BLOB NOT NULL,
+                is_illegal INTEGER NOT NULL,
+                confidence REAL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self.connection.execute("""
+            CREATE INDEX IF NOT EXISTS idx_training_samples_created_at
+            ON training_samples(created_at)
+        """)
+        self.connection.commit()
+
+    def add(self, url: str, text: str, classification: Dict[str, Any]) -> None:
+        """Gemini 판정과 판정에 쓴 정제된 텍스트 저장"""
+        if not text:
+            return
+        now = time.time()
+        with self._lock:
+            self.connection.execute(
+                """
+                INSERT OR REPLACE INTO training_samples (url, text, is_illegal, confidence, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (url, zlib.compress(text.encode('utf-8')), int(bool(classification.get("is_illegal"))),
+                 classification.get("confidence"), now)
+            )
+            self.connection.commit()
+
+            self._puts_since_evict += 1
+            if self._puts_since_evict >= self.EVICT_EVERY:
+                self._puts_since_evict = 0
+                self._evict()
+
+    def _evict(self) -> None:
+        """max_entries를 넘는 오래된 표본 삭제 (lock을 잡은 상태에서 호출)"""
+        if not self.max_entries:
+            return
+        self.connection.execute(
+            """
+            DELETE FROM training_samples WHERE url IN (
+                SELECT url FROM training_samples
+                ORDER BY created_at DESC
+                LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,)
+        )
+        self.connection.commit()
+
+    def iter_samples(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        최근 표본부터 하나씩 읽기
+
+        Yields:
+            {"url", "text", "is_illegal", "confidence"}
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                """
+                SELECT url, text, is_illegal, confidence FROM training_samples
+                ORDER BY created_at DESC
+                LIMIT ?
+                """,
+                (int(limit) if limit else -1,)
+            ).fetchall()
+        for url, text, is_illegal, confidence in rows:
+            yield {
+                "url": url,
+                "text": zlib.decompress(text).decode('utf-8'),
+                "is_illegal": bool(is_illegal),
+                "confidence": confidence,
+            }
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            total, illegal = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(is_illegal), 0) FROM training_samples"
+            ).fetchone()
+        return {"entries": total, "illegal": illegal, "legal": total - illegal}
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
@@ -1,7 +1,7 @@
 import re
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-from typing import List, Set
+from typing import Iterator, List, Set, Tuple
 
 
 class URLExtractor:
@@ -13,8 +13,30 @@ class URLExtractor:
         ]
 
     def extract_urls_from_html(self, html_content: str) -> List[str]:
+        """검색 결과 영역의 URL 목록 (중복 제거, 페이지에 나온 순서 유지)"""
+        return list(dict.fromkeys(url for url, _ in self._iter_links(html_content)))
+
+    def extract_search_result_links(self, html_content: str) -> List[Tuple[str, str]]:
+        """
+        Google 검색 결과 페이지 HTML에서 방문할 결과 링크를 한 번에 추출합니다
+
+        /url?q= 리다이렉트를 풀고 추적 파라미터를 제거하며, 구글 내부 링크는 제외합니다.
+
+        Returns:
+            [(url, 원래 href 속성값), ...] (url 기준 중복 제거, 검색 결과 순서 유지)
+        """
+        links = []
+        seen = set()
+        for url, href in self._iter_links(html_content):
+            if url in seen or "google.com" in url:
+                continue
+            seen.add(url)
+            links.append((url, href))
+        return links
+
+    def _iter_links(self, html_content: str) -> Iterator[Tuple[str, str]]:
+        """(정리한 URL, 원래 href) 쌍을 페이지에 나온 순서대로 반환"""
         soup = BeautifulSoup(html_content, 'html.parser')
-        urls = set()
 
         # 구글 검색 결과의 메인 영역(id="rso")만 추출
         rso_element = soup.find(id='rso')
@@ -23,17 +45,17 @@ class URLExtractor:
         search_area = rso_element if rso_element else soup
         
         for link in search_area.find_all('a', href=True):
-            url = link['href']
+            href = link['href']
             
             # 구글 리다이렉트 URL에서 실제 URL 추출
-            url = self._extract_real_url_from_google(url)
+            url = self._extract_real_url_from_google(href)
+            if url.startswith('//'):
+                url = 'https:' + url
             
             if self._is_valid_url(url):
                 if self.remove_tracking_params:
                     url = self._clean_tracking_params(url)
-                urls.add(url)
-
-        return list(urls)
+                yield url, href
 
     def _extract_real_url_from_google(self, url: str) -> str:
         """구글 리다이렉트 URL에서 실제 URL 추출 (예: /url?q=실제URL&...)"""
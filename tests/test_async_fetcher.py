@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import unittest
+
+from aiohttp import web
+
+from src.async_fetcher import AsyncFetcher
+
+
+# 여러 번에 나눠 보내는 본문 (한 번에 받는 네트워크 청크보다 큼)
+BODY = ("<html><body>" + "가나다라마바사 " * 40000 + "</body></html>").encode("utf-8")
+PART_BYTES = 16 * 1024
+
+
+async def _stream_body(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse(headers={"Content-Type": "text/html; charset=utf-8"})
+    await response.prepare(request)
+    for start in range(0, len(BODY), PART_BYTES):
+        await response.write(BODY[start:start + PART_BYTES])
+        await asyncio.sleep(0.001)
+    await response.write_eof()
+    return response
+
+
+class LocalServer:
+    """백그라운드 스레드에서 실행하는 테스트용 aiohttp 서버"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.runner = None
+        self.port = None
+
+    def start(self) -> None:
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+
+    async def _start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/large", _stream_body)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+class AsyncFetcherBodyTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer()
+        cls.server.start()
+        cls.url = f"http://127.0.0.1:{cls.server.port}/large"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_reads_body_larger_than_one_chunk(self):
+        fetcher = AsyncFetcher(max_retries=0)
+        try:
+            result = fetcher.fetch_all([self.url])[0]
+        finally:
+            fetcher.close()
+        self.assertIsNone(result["error"])
+        self.assertEqual(result["bytes"], len(BODY))
+        self.assertEqual(result["html"], BODY.decode("utf-8"))
+
+    def test_stops_at_max_bytes(self):
+        fetcher = AsyncFetcher(max_retries=0, max_bytes=100000)
+        try:
+            result = fetcher.fetch_all([self.url])[0]
+        finally:
+            fetcher.close()
+        self.assertIsNone(result["error"])
+        self.assertEqual(result["bytes"], 100000)
+
+
+if __name__ == "__main__":
+    unittest.main()